@@ -14,47 +14,170 @@ Changes:
 import pandas as pd
 from pathlib import Path
 
-# File path
+# Parquet cache is optional (requires pyarrow); the CSV stays the canonical file
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# File paths
 CSV_FILE = Path(__file__).parent / "GAID_MASTER_V2_COMPILATION.csv"
+CACHE_FILE = CSV_FILE.with_suffix('.parquet')
+TMP_FILE = CSV_FILE.with_name(CSV_FILE.name + '.tmp')
+CACHE_TMP_FILE = CACHE_FILE.with_name(CACHE_FILE.name + '.tmp')
+
+# Rows per chunk when streaming the CSV back to disk
+CHUNK_SIZE = 200_000
+
+# Output buffer size for the rewritten CSV
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Write CSV chunks with pyarrow's native writer (needs pyarrow). Output is
+# equivalent CSV but quotes every text field, so it is off by default.
+FAST_IO = False
+
+# Country name variations to standardize
+MICRONESIA_VARIANTS = {
+    'Federated States of Micronesia': 'Micronesia',
+    'Micronesia, Fed. Sts.': 'Micronesia',
+}
+
+
+def cache_is_fresh():
+    """Return True if the Parquet cache exists and is not older than the CSV."""
+    return (
+        PARQUET_AVAILABLE
+        and CACHE_FILE.exists()
+        and CACHE_FILE.stat().st_mtime >= CSV_FILE.stat().st_mtime
+    )
+
+
+def load_country_column():
+    """Load only the Country column as a categorical Series."""
+    if cache_is_fresh():
+        print(f"\nLoading Country column from Parquet cache: {CACHE_FILE.name}")
+        country = pd.read_parquet(CACHE_FILE, columns=['Country'])['Country']
+        return country.replace('', pd.NA).astype('category')
+
+    print(f"\nLoading Country column from CSV: {CSV_FILE.name}")
+    # Same NA rules as rewrite_csv: only empty cells are missing, 'NA' text is a value
+    df = pd.read_csv(CSV_FILE, encoding='utf-8', usecols=['Country'], dtype={'Country': 'category'},
+                     keep_default_na=False, na_values=[''])
+    return df['Country']
+
+
+def write_csv_chunk(chunk, out, header):
+    """Append a chunk to an open binary CSV handle."""
+    if FAST_IO and PARQUET_AVAILABLE:
+        options = pacsv.WriteOptions(include_header=header, batch_size=64 * 1024)
+        pacsv.write_csv(pa.Table.from_pandas(chunk, preserve_index=False), out, write_options=options)
+    else:
+        chunk.to_csv(out, header=header, index=False, encoding='utf-8', lineterminator='\n')
+
+
+def rewrite_csv():
+    """
+    Stream the CSV through in chunks, fixing the Country column only.
+
+    Every column is read as text so untouched cells are written back unchanged.
+    The Parquet cache is refreshed from the same chunks. Both are written to
+    temporary files and only swapped in once every chunk has been written, so a
+    failure leaves the CSV and the cache as they were.
+
+    Returns:
+    --------
+    pd.Series
+        Row count per country in the rewritten file
+    """
+    country_counts = pd.Series(dtype='int64')
+    writer = None
+    cache_written = False
+
+    try:
+        reader = pd.read_csv(CSV_FILE, encoding='utf-8', dtype=str, keep_default_na=False, chunksize=CHUNK_SIZE)
+        with open(TMP_FILE, 'wb', buffering=WRITE_BUFFER_SIZE) as out:
+            for i, chunk in enumerate(reader):
+                chunk['Country'] = chunk['Country'].replace(MICRONESIA_VARIANTS)
+
+                country_counts = country_counts.add(chunk['Country'].value_counts(), fill_value=0)
+
+                write_csv_chunk(chunk, out, header=(i == 0))
+
+                if PARQUET_AVAILABLE:
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                    if writer is None:
+                        writer = pq.ParquetWriter(CACHE_TMP_FILE, table.schema, compression='zstd')
+                    writer.write_table(table)
+
+        # Close the cache after the CSV so the cache is never older than it
+        if writer is not None:
+            writer.close()
+            writer = None
+            cache_written = True
+    except BaseException:
+        # Leave no half-written files behind; CSV_FILE and CACHE_FILE are untouched
+        if writer is not None:
+            writer.close()
+        TMP_FILE.unlink(missing_ok=True)
+        CACHE_TMP_FILE.unlink(missing_ok=True)
+        raise
+
+    # Swap the CSV in first: if the cache swap is interrupted, the old cache is
+    # older than the new CSV and is ignored as stale
+    TMP_FILE.replace(CSV_FILE)
+    if cache_written:
+        CACHE_TMP_FILE.replace(CACHE_FILE)
+
+    # Empty cells are missing values, not a country
+    return country_counts.drop('', errors='ignore').astype('int64')
+
 
 def main():
     print("=" * 70)
     print("FIXING MICRONESIA COUNTRY NAME VARIATIONS")
     print("=" * 70)
-    
+
     if not CSV_FILE.exists():
         print(f"ERROR: File not found: {CSV_FILE}")
         return
-    
-    # Load the CSV
-    print(f"\nLoading CSV: {CSV_FILE.name}")
-    df = pd.read_csv(CSV_FILE, encoding='utf-8')
-    
+
+    # Load only the column we mutate
+    country = load_country_column()
+
     print(f"\nBefore fix:")
-    fed_states_count = (df['Country'] == 'Federated States of Micronesia').sum()
-    micronesia_fed_count = (df['Country'] == 'Micronesia, Fed. Sts.').sum()
-    micronesia_count = (df['Country'] == 'Micronesia').sum()
-    unique_countries = df['Country'].nunique()
-    
+    vc = country.value_counts()
+    vc = vc[vc > 0]  # categorical value_counts also lists unused categories
+    fed_states_count = vc.get('Federated States of Micronesia', 0)
+    micronesia_fed_count = vc.get('Micronesia, Fed. Sts.', 0)
+    micronesia_count = vc.get('Micronesia', 0)
+    unique_countries = len(vc)
+
     print(f"  'Federated States of Micronesia': {fed_states_count} rows")
     print(f"  'Micronesia, Fed. Sts.': {micronesia_fed_count} rows")
     print(f"  'Micronesia': {micronesia_count} rows")
     print(f"  Total unique countries: {unique_countries}")
-    
-    # Apply fixes
-    df.loc[df['Country'] == 'Federated States of Micronesia', 'Country'] = 'Micronesia'
-    df.loc[df['Country'] == 'Micronesia, Fed. Sts.', 'Country'] = 'Micronesia'
-    
+
+    # Already standardized: leave the file (and cache) untouched
+    if fed_states_count == 0 and micronesia_fed_count == 0:
+        print(f"\nNothing to fix.")
+        print("=" * 70)
+        return
+
+    # Apply fixes while streaming the file back to disk
+    vc_after = rewrite_csv()
+    micronesia_count_after = vc_after.get('Micronesia', 0)
+    unique_countries_after = len(vc_after)
+
     print(f"\nAfter fix:")
-    micronesia_count_after = (df['Country'] == 'Micronesia').sum()
-    unique_countries_after = df['Country'].nunique()
-    
     print(f"  'Micronesia': {micronesia_count_after} rows")
     print(f"  Total unique countries: {unique_countries_after}")
-    
-    # Save the fixed CSV
-    df.to_csv(CSV_FILE, index=False, encoding='utf-8')
+
     print(f"\n✓ Fixed CSV saved to: {CSV_FILE}")
+    if PARQUET_AVAILABLE:
+        print(f"✓ Parquet cache refreshed: {CACHE_FILE.name}")
     print(f"✓ Reduced unique countries from {unique_countries} to {unique_countries_after}")
     print("=" * 70)
 
@@ -15,10 +15,34 @@ Rules:
 
 import pandas as pd
 import numpy as np
+from collections import defaultdict
 from pathlib import Path
 
-# File path
+# pyarrow is optional; it is only used for the FAST_IO writer
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# File paths
 CSV_FILE = Path(__file__).parent / "GAID_MASTER_V2_COMPILATION_FINAL.csv"
+TMP_FILE = CSV_FILE.with_name(CSV_FILE.name + '.tmp')
+
+# Rows per chunk when streaming the CSV back to disk
+CHUNK_SIZE = 250_000
+
+# Read every column as text, except the low-cardinality Dataset column which is
+# only compared and mapped, so it is read as a categorical
+COLUMN_DTYPES = defaultdict(lambda: str, Dataset='category')
+
+# Output buffer size for the rewritten CSV
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Write CSV chunks with pyarrow's native writer (needs pyarrow). Output is
+# equivalent CSV but quotes every text field, so it is off by default.
+FAST_IO = False
 
 # Mapping rules
 DATASET_SOURCE_FILE_MAPPING = {
@@ -26,6 +50,84 @@ DATASET_SOURCE_FILE_MAPPING = {
     "UNESCO RAM": "https://www.unesco.org/en/ethics-ai/observatory"
 }
 
+
+def write_csv_chunk(chunk, out, header):
+    """Append a chunk to an open binary CSV handle."""
+    if FAST_IO and PYARROW_AVAILABLE:
+        options = pacsv.WriteOptions(include_header=header, batch_size=64 * 1024)
+        pacsv.write_csv(pa.Table.from_pandas(chunk, preserve_index=False), out, write_options=options)
+    else:
+        chunk.to_csv(out, header=header, index=False, encoding='utf-8', lineterminator='\n')
+
+
+def scan_csv():
+    """
+    Count missing Source_File values, reading only the Dataset and Source_File columns.
+    
+    Returns:
+    --------
+    dict
+        Row count and missing-value statistics before any fix
+    """
+    df = pd.read_csv(CSV_FILE, encoding='utf-8', usecols=['Dataset', 'Source_File'], dtype='category')
+    
+    missing = df['Source_File'].isna()
+    empty = df['Source_File'] == ''
+    missing_by_dataset = df.loc[missing | empty, 'Dataset'].value_counts()
+    
+    return {
+        'rows': len(df),
+        'missing_before': missing.sum(),
+        'empty_before': empty.sum(),
+        'missing_by_dataset': missing_by_dataset[missing_by_dataset > 0],
+    }
+
+
+def heal_csv():
+    """
+    Stream the CSV through in chunks, filling Source_File from the Dataset mapping.
+    
+    Every column is read as text so numbers keep their original formatting.
+    Cells pandas parses as missing by default ('', 'NA', 'null', 'N/A', ...)
+    are written back blank, as in a plain read_csv/to_csv round trip.
+    The rewritten file is written to TMP_FILE and then moved over CSV_FILE.
+    
+    Returns:
+    --------
+    dict
+        Fix counts, rows written and missing-value statistics after the fix
+    """
+    stats = {
+        'fixed_by_dataset': dict.fromkeys(DATASET_SOURCE_FILE_MAPPING, 0),
+        'missing_after': 0,
+        'empty_after': 0,
+        'rows_written': 0,
+    }
+    
+    reader = pd.read_csv(CSV_FILE, encoding='utf-8', dtype=COLUMN_DTYPES, chunksize=CHUNK_SIZE)
+    with open(TMP_FILE, 'wb', buffering=WRITE_BUFFER_SIZE) as out:
+        for i, chunk in enumerate(reader):
+            # Apply fixes: one map over the rows missing Source_File (NaN or empty);
+            # on the categorical Dataset column the map only touches its categories
+            need = chunk['Source_File'].isna() | (chunk['Source_File'] == '')
+            fill = chunk.loc[need, 'Dataset'].map(DATASET_SOURCE_FILE_MAPPING).dropna().astype(str)
+            chunk.loc[fill.index, 'Source_File'] = fill
+            for dataset, count in chunk.loc[fill.index, 'Dataset'].value_counts().items():
+                if count > 0:
+                    stats['fixed_by_dataset'][dataset] += count
+            
+            # Check missing values after the fix
+            stats['missing_after'] += chunk['Source_File'].isna().sum()
+            stats['empty_after'] += (chunk['Source_File'] == '').sum()
+            
+            write_csv_chunk(chunk, out, header=(i == 0))
+            stats['rows_written'] += len(chunk)
+    
+    TMP_FILE.replace(CSV_FILE)
+    
+    return stats
+
+
 def main():
     print("=" * 70)
     print("HEALING MISSING SOURCE_FILE METADATA")
@@ -35,16 +137,15 @@ def main():
         print(f"ERROR: File not found: {CSV_FILE}")
         return
     
-    # Load the CSV
-    print(f"\nLoading CSV: {CSV_FILE.name}")
-    df = pd.read_csv(CSV_FILE, encoding='utf-8', low_memory=False)
+    # Scan only the two columns involved before committing to a full rewrite
+    print(f"\nScanning CSV: {CSV_FILE.name}")
+    scan = scan_csv()
     
-    initial_row_count = len(df)
+    initial_row_count = scan['rows']
     print(f"  Initial row count: {initial_row_count:,}")
     
-    # Check initial missing values
-    initial_missing_source_file = df['Source_File'].isna().sum()
-    initial_empty_source_file = (df['Source_File'] == '').sum()
+    initial_missing_source_file = scan['missing_before']
+    initial_empty_source_file = scan['empty_before']
     total_initial_missing = initial_missing_source_file + initial_empty_source_file
     
     print(f"\nBefore fix:")
@@ -54,22 +155,25 @@ def main():
     
     if total_initial_missing > 0:
         print(f"\n  Missing values by Dataset:")
-        missing_mask = df['Source_File'].isna() | (df['Source_File'] == '')
-        missing_by_dataset = df[missing_mask]['Dataset'].value_counts()
-        for dataset, count in missing_by_dataset.items():
+        for dataset, count in scan['missing_by_dataset'].items():
             print(f"    {dataset}: {count}")
     
-    # Apply fixes
+    # Nothing the mapping can fill: leave the file untouched
+    fixable_count = scan['missing_by_dataset'].reindex(list(DATASET_SOURCE_FILE_MAPPING), fill_value=0).sum()
+    if fixable_count == 0:
+        print(f"\nNo rows needed healing; skipping write.")
+        print(f"\n" + "=" * 70)
+        print("PROCESS COMPLETED")
+        print("=" * 70)
+        return
+    
+    # Apply fixes while streaming the file back to disk
     print(f"\nApplying fixes...")
+    stats = heal_csv()
     fixed_count = 0
     
-    for dataset, source_file_url in DATASET_SOURCE_FILE_MAPPING.items():
-        # Find rows where Dataset matches and Source_File is missing (NaN or empty)
-        mask = (df['Dataset'] == dataset) & (df['Source_File'].isna() | (df['Source_File'] == ''))
-        count = mask.sum()
-        
+    for dataset, count in stats['fixed_by_dataset'].items():
         if count > 0:
-            df.loc[mask, 'Source_File'] = source_file_url
             fixed_count += count
             print(f"  Fixed {count} rows for Dataset: '{dataset}'")
     
@@ -77,20 +181,16 @@ def main():
     
     # Verification
     print(f"\nAfter fix:")
-    final_missing_source_file = df['Source_File'].isna().sum()
-    final_empty_source_file = (df['Source_File'] == '').sum()
+    final_missing_source_file = stats['missing_after']
+    final_empty_source_file = stats['empty_after']
     total_final_missing = final_missing_source_file + final_empty_source_file
     
     print(f"  Missing Source_File (NaN): {final_missing_source_file}")
     print(f"  Empty Source_File (''): {final_empty_source_file}")
     print(f"  Total missing Source_File: {total_final_missing}")
     
-    # Check for any NaN values in entire dataframe
-    total_nan_count = df.isna().sum().sum()
     print(f"\nVerification:")
-    print(f"  Total NaN values in entire dataframe: {total_nan_count}")
-    
-    final_row_count = len(df)
+    final_row_count = stats['rows_written']
     print(f"  Final row count: {final_row_count:,}")
     
     if final_row_count != initial_row_count:
@@ -98,20 +198,13 @@ def main():
     else:
         print(f"  ✓ Row count unchanged (no data lost)")
     
-    if total_final_missing == 0 and total_nan_count == 0:
+    if total_final_missing == 0:
         print(f"\n✓ SUCCESS: All missing Source_File values have been filled!")
-        print(f"✓ No NaN values remain in the dataframe")
     else:
         print(f"\n⚠ WARNING: Some missing values remain")
-        if total_final_missing > 0:
-            print(f"  Still missing {total_final_missing} Source_File values")
-        if total_nan_count > 0:
-            print(f"  Still have {total_nan_count} NaN values in dataframe")
-    
-    # Save the updated file
-    print(f"\nSaving updated file...")
-    df.to_csv(CSV_FILE, index=False, encoding='utf-8')
-    print(f"✓ Updated CSV saved to: {CSV_FILE}")
+        print(f"  Still missing {total_final_missing} Source_File values")
+    
+    print(f"\n✓ Updated CSV saved to: {CSV_FILE}")
     print(f"\n" + "=" * 70)
     print("PROCESS COMPLETED")
     print("=" * 70)
@@ -23,9 +23,24 @@ The script performs:
 import pandas as pd
 import numpy as np
 from pathlib import Path
+import importlib.metadata
+import io
+import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import json
 import logging
 
+# pyarrow is optional; it is only used for FAST_IO and ARROW_STRINGS
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Silence country_converter warnings
 logging.getLogger('country_converter').setLevel(logging.ERROR)
 
@@ -71,6 +86,28 @@ if not OECD_FILE.exists():
 # Output file
 OUTPUT_FILE = BASE_DIR / "MASTER_AI_DATA_COMPILATION_FINAL.csv"
 
+# Read the source CSVs with pandas' pyarrow engine and write the output CSV with
+# pyarrow's native writer (needs pyarrow). Output is equivalent CSV but quotes
+# text fields and drops the '.0' on whole floats, so it is off by default.
+FAST_IO = False
+
+# Hold the heavily scrubbed text columns as Arrow-backed strings during final
+# cleanup (needs pyarrow), so plain str methods run in Arrow's C kernels.
+# Arrow regexes use RE2, whose \b and \d are ASCII-only, so this is off by
+# default.
+ARROW_STRINGS = False
+ARROW_STRING_COLUMNS = [
+    'Metric', 'Country', 'ISO3', 'Source', 'Dataset',
+    'Source_File', 'Source_Category', 'Source_Type',
+]
+
+# Print one line per renamed metric name in the Step 59-81 rename dicts; set
+# to False to print only each step's total
+VERBOSE = True
+
+# ISO3 lookups persisted between runs (safe to delete; rebuilt on the next run)
+ISO3_CACHE_FILE = BASE_DIR / "iso3_cache.json"
+
 # Columns to preserve (core columns)
 CORE_COLUMNS = ['Year', 'Country', 'ISO3', 'Metric', 'Value']
 
@@ -103,11 +140,429 @@ TEMPORARY_METRICS = [
     'Metric_original_1',
 ]
 
+# Lookup forms of the lists above: one regex scan for junk characters,
+# a prefix tuple for str.startswith and a hash set for exact names.
+# Single-character junk entries compile to a character class, which the regex
+# engine tests with one set lookup per character instead of trying each branch.
+_JUNK_SINGLE = ''.join(c for c in JUNK_CHARACTERS if len(c) == 1)
+_JUNK_PATTERNS = [re.escape(c) for c in JUNK_CHARACTERS if len(c) > 1]
+if _JUNK_SINGLE:
+    _JUNK_PATTERNS.insert(0, f'[{re.escape(_JUNK_SINGLE)}]')
+JUNK_CHARACTERS_RE = re.compile('|'.join(_JUNK_PATTERNS))
+# When every junk entry contains a non-ASCII character, pure-ASCII names can
+# be ruled out without running the regex
+JUNK_NEEDS_NON_ASCII = all(not c.isascii() for c in JUNK_CHARACTERS)
+PLACEHOLDER_PREFIXES = tuple(PLACEHOLDER_PATTERNS)
+TEMPORARY_METRICS_SET = frozenset(TEMPORARY_METRICS)
+
+# Metric text repairs used by final_cleanup, each applied in a single pass.
+# Mojibake dash sequences: 'â€"' needs no branch of its own because its '€"'
+# tail always matched first (as with the earlier one-by-one replaces).
+MOJIBAKE_DASH_RE = re.compile('Â€"|€"|聙聯')
+CURLY_APOSTROPHE_TABLE = str.maketrans(dict.fromkeys('\u2018\u2019\u201A\u201B', "'"))
+LONG_DASH_TABLE = str.maketrans(dict.fromkeys('\u2013\u2014', '-'))
+UNDERSCORE_RUN_RE = re.compile(r'_{2,}')
+REPEATED_GRADUATES_RE = re.compile(r'Graduates(?:s| Graduates)+')
+SINGULAR_GRADUATE_RE = re.compile(r'\bGraduate\b(?!s)')
+WHITESPACE_RUN_RE = re.compile(r'\s+')
+AI_WORD_RE = re.compile(r'\bAi\b')
+DIGIT_RE = re.compile(r'\d')
+
+# Survey statement/metric fixes (Steps 37, 61, 62), each applied in a single pass
+SURVEY_STATEMENT_FIXES = {'Ai': 'AI', '\u2013': '-', '\u2014': '-', '35 Years': '3-5 Years'}
+SURVEY_STATEMENT_FIXES_RE = re.compile(r'\bAi\b|[\u2013\u2014]|35 Years')
+SURVEY_METRIC_FIXES = {
+    "\u2018S": "'s", "\u2019S": "'s", "'S": "'s",
+    '\u2018': "'", '\u2019': "'", 'Ai': 'AI',
+}
+SURVEY_METRIC_FIXES_RE = re.compile(r"[\u2018\u2019']S|[\u2018\u2019]|\bAi\b")
+
+# Column-name candidates in the raw survey CSVs, in lookup order
+SURVEY_VALUE_COLUMN_RE = re.compile('agree|percentage|%|value', re.IGNORECASE)
+SURVEY_STATEMENT_COLUMNS = ('Statement', 'Question', 'statement', 'question')
+SURVEY_COUNTRY_COLUMNS = ('Country', 'country', 'Country Name', 'country_name')
+# World-total rows in the survey files (matched against stripped country names)
+SURVEY_GLOBAL_ROW_RE = re.compile('global', re.IGNORECASE)
+
+# Step 39 collapsed "3-5 Years" ranges
+COLLAPSED_3_5_RE = re.compile(r'(\b3)([^\s\-])(5\s+Years\b)')
+PAST_35_YEARS_RE = re.compile(r'(\bPast\s+)35(\s+Years\b)')
+NEXT_35_YEARS_RE = re.compile(r'(\bNext\s+)35(\s+Years\b)')
+# Final sweep: any non-ASCII run between the 3 and the 5
+NON_ASCII_3_5_RE = re.compile(r'3\s*[^\x00-\x7F]+\s*5')
+
+# Step 56 regex purge of generic survey and sub-national metrics
+METRIC_PURGE_PATTERNS = [
+    r'% Of Respondents.*',  # Catches ALL generic respondent metrics
+    r'% Of Students',
+    r'% Of Total In State',
+    r'1Pp\. Change',
+    r'.*Of Total State\)',
+    r'.*US States.*Job Postings.*'
+]
+METRIC_PURGE_RE = re.compile('|'.join(METRIC_PURGE_PATTERNS), re.IGNORECASE)
+
+# Net AI Talent Migration names that still lack a (2023)/(2024) suffix
+NET_MIGRATION_RE = re.compile('Net AI Talent Migration.*LinkedIn.*Members', re.IGNORECASE)
+MIGRATION_YEAR_SUFFIX_RE = re.compile(r'\(202[34]\)')
+DEGREE_CASING_ARTIFACT_RE = re.compile("Master'S|Bachelor'S")
+
+
+def compile_word_pattern(words):
+    """Compile a whole-word alternation; longer words are tried first."""
+    return re.compile(r'\b(?:' + '|'.join(map(re.escape, sorted(words, key=len, reverse=True))) + r')\b')
+
+
+# Whole-word capitalization fixes (Step 35 connectors, Step 42 acronym audit)
+CONNECTOR_ACRONYMS = {
+    'Linkedin': 'LinkedIn', 'Cs': 'CS', 'Ce': 'CE', 'It': 'IT', 'Ict': 'ICT',
+    'Ai': 'AI', 'Phd': 'PhD', 'phd': 'PhD',
+}
+CONNECTOR_ACRONYMS_RE = compile_word_pattern(CONNECTOR_ACRONYMS)
+
+FINAL_ACRONYMS = {
+    'Nlp': 'NLP', 'Av': 'AV', 'Vc': 'VC', 'Hr': 'HR', 'Ict': 'ICT', 'It': 'IT',
+    'Cs': 'CS', 'Ce': 'CE', 'Phd': 'PhD', 'ar/vr': 'AR/VR', 'Ar/Vr': 'AR/VR',
+}
+FINAL_ACRONYMS_RE = compile_word_pattern(FINAL_ACRONYMS)
+
+# AI/PhD capitalization after Step 44 ('Ai:' is already covered by the word
+# boundary before ':', and Master's/Bachelor's were rewritten to themselves)
+GLOBAL_ACRONYMS = {'Ai': 'AI', 'Phd': 'PhD'}
+GLOBAL_ACRONYMS_RE = compile_word_pattern(GLOBAL_ACRONYMS)
+
+# Raw source column names renamed in Step 48
+RAW_METRIC_NAMES = {
+    'FWCI': 'Field Weighted Citation Impact',
+    'OBS_VALUE': 'OECD AI Indicator Value',
+}
+RAW_METRIC_NAMES_RE = re.compile(r'^(?:FWCI|OBS_VALUE)$')
+
+# Acronyms restored after the Step 49 title-casing
+TITLE_CASE_ACRONYMS = {
+    'Ai': 'AI', 'Vat': 'VAT', 'Nlp': 'NLP', 'Vc': 'VC', 'Av': 'AV', 'Hr': 'HR',
+    'Ict': 'ICT', 'It': 'IT', 'Cs': 'CS', 'Ce': 'CE', 'Phd': 'PhD', 'Us': 'US',
+    'Uk': 'UK', 'Eu': 'EU',
+}
+TITLE_CASE_ACRONYMS_RE = compile_word_pattern(TITLE_CASE_ACRONYMS)
+AR_VR_RE = re.compile(r'\bAr\s*/\s*Vr\b')
+
+# Step 50 spelling fixes
+ARXIV_RE = re.compile(r'\bArxiv\b', re.IGNORECASE)
+MASTERS_RE = re.compile(r'\bMasters\b')
+
+# Literal fixes; none of the keys overlap, so one alternation per step gives
+# the same result as replacing them one after another
+STEP51_METRIC_FIXES = {'Oecd': 'OECD', "Master's'S": "Master's"}
+STEP51_METRIC_FIXES_RE = re.compile('|'.join(map(re.escape, STEP51_METRIC_FIXES)))
+
+GIRAI_UNDERSCORE_FIXES = {
+    'Government_Actions': 'Government Actions',
+    'Government_Frameworks': 'Government Frameworks',
+    'Index_Score': 'Index Score',
+    'Human_Rights_And_AI': 'Human Rights And AI',
+}
+GIRAI_UNDERSCORE_FIXES_RE = re.compile('|'.join(map(re.escape, GIRAI_UNDERSCORE_FIXES)))
+
+GIRAI_FORCED_SPACES = {
+    'Government_': 'Government ',
+    'Index_Score': 'Index Score',
+    'Human_Rights_And_AI': 'Human Rights And AI',
+}
+GIRAI_FORCED_SPACES_RE = re.compile('|'.join(map(re.escape, GIRAI_FORCED_SPACES)))
+
+# Metadata backfilled by final_cleanup (Steps 45, 48, 49, 50)
+GIRAI_METADATA = {
+    'Source': 'Global Index on Responsible AI',
+    'Source_File': 'girai_ai_index_data_long.csv',
+    'Source_Category': 'Responsible AI',
+    'Source_Type': 'csv',
+    'Source_Year': 2024,
+    'Dataset': 'GIRAI 2024 Index',
+}
+OECD_METADATA = {
+    'Source_File': 'oecd_ai_index_data_long.csv',
+    'Source_Category': 'Economy',
+    'Source_Type': 'csv',
+    'Source_Year': 2024,
+}
+
+# Metric anchors that identify GIRAI rows in Steps 49-50 (substring, any case)
+GIRAI_ANCHORS = [
+    'Government Actions', 'Index Score', 'Human Rights And AI',
+    'Responsible AI Governance', 'Non State Actors', 'Government Frameworks',
+    'Responsible AI Capacities'
+]
+GIRAI_ANCHORS_RE = re.compile('|'.join(GIRAI_ANCHORS), re.IGNORECASE)
+
+# Filters used by final_cleanup
+
+# Aggregate regions dropped in the pre-filter
+GEO_AGGREGATES = frozenset({'GLOBAL', 'WORLD', 'EU', 'OECD'})
+
+# Universal ISO3 whitelist (Step 6) - only rows with these codes are kept
+TRUSTED_ISO3 = frozenset({
+    "AFG", "ALB", "DZA", "ASM", "AND", "AGO", "AIA", "ATA", "ATG", "ARG", "ARM", "ABW", "AUS", "AUT", "AZE",
+    "BHS", "BHR", "BGD", "BRB", "BLR", "BEL", "BLZ", "BEN", "BMU", "BTN", "BOL", "BES", "BIH", "BWA", "BVT",
+    "BRA", "IOT", "BRN", "BGR", "BFA", "BDI", "CPV", "KHM", "CMR", "CAN", "CYM", "CAF", "TCD", "CHL", "CHN",
+    "CXR", "CCK", "COL", "COM", "COD", "COG", "COK", "CRI", "CIV", "HRV", "CUB", "CUW", "CYP", "CZE", "DNK",
+    "DJI", "DMA", "DOM", "ECU", "EGY", "SLV", "GNQ", "ERI", "EST", "SWZ", "ETH", "FLK", "FRO", "FJI", "FIN",
+    "FRA", "GUF", "PYF", "ATF", "GAB", "GMB", "GEO", "DEU", "GHA", "GIB", "GRC", "GRL", "GRD", "GLP", "GUM",
+    "GTM", "GGY", "GIN", "GNB", "GUY", "HTI", "HMD", "VAT", "HND", "HKG", "HUN", "ISL", "IND", "IDN", "IRN",
+    "IRQ", "IRL", "IMN", "ISR", "ITA", "JAM", "JPN", "JEY", "JOR", "KAZ", "KEN", "KIR", "PRK", "KOR", "KWT",
+    "KGZ", "LAO", "LVA", "LBN", "LSO", "LBR", "LBY", "LIE", "LTU", "LUX", "MAC", "MDG", "MWI", "MYS", "MDV",
+    "MLI", "MLT", "MHL", "MTQ", "MRT", "MUS", "MYT", "MEX", "FSM", "MDA", "MCO", "MNG", "MNE", "MSR", "MAR",
+    "MOZ", "MMR", "NAM", "NRU", "NPL", "NLD", "NCL", "NZL", "NIC", "NER", "NGA", "NIU", "NFK", "MKD", "MNP",
+    "NOR", "OMN", "PAK", "PLW", "PSE", "PAN", "PNG", "PRY", "PER", "PHL", "PCN", "POL", "PRT", "PRI", "QAT",
+    "REU", "ROU", "RUS", "RWA", "BLM", "SHN", "KNA", "LCA", "MAF", "SPM", "VCT", "WSM", "SMR", "STP", "SAU",
+    "SEN", "SRB", "SYC", "SLE", "SGP", "SXM", "SVK", "SVN", "SLB", "SOM", "ZAF", "SGS", "SSD", "ESP", "LKA",
+    "SDN", "SUR", "SJM", "SWE", "CHE", "SYR", "TWN", "TJK", "TZA", "THA", "TLS", "TGO", "TKL", "TON", "TTO",
+    "TUN", "TUR", "TKM", "TCA", "TUV", "UGA", "UKR", "ARE", "GBR", "USA", "UMI", "URY", "UZB", "VUT", "VEN",
+    "VNM", "VGB", "VIR", "WLF", "ESH", "YEM", "ZMB", "ZWE", "EU27", "WLD"
+})
+
+# Sub-national (U.S. state) metrics purged in Step 36
+STATE_LEVEL_METRICS = frozenset({
+    '% Of Total In State', 'Number Of AP CS Exams Taken',
+    'Number Of AP CS Exams Taken In 2022',
+    'Number Of AP CS Exams Taken Per 100,000 Inhabitants',
+    'Number Of AP CS Exams Taken Per 100,000 Inhabitants In 2022',
+    'Public High Schools Teaching CS (% Of Total State)',
+    'Requires All High Schools Offer A CS Course',
+    "Share Of Us States' Job Postings In AI 2022",
+    'Number Of State-Level AI-Related Bills Pased Into Law',
+    'Us Patient Cohorts',
+    # Mislabeled U.S. state metrics
+    'Percentage Of Us AI Job Postings',
+    'Percentage Of Us States Job Postings In AI In 2023',
+    "Percentage Of Us States' Job Postings In AI"
+})
+
+# Sub-national diversity artifacts purged in Step 40
+SUBNATIONAL_DIVERSITY_METRICS = frozenset({'AP CS Exams Taken By Female Students (% Of Total)'})
+SUBNATIONAL_DIVERSITY_SOURCES = frozenset({
+    '9. Diversity-2023_Data_fig_7.3.2.csv',
+    '9. Diversity-2024_Data_fig_8.3.2.csv'
+})
+
+# Bare focus-area names restored to full investment metric names in Step 41
+FOCUS_SECTORS = frozenset({
+    'Agritech', 'Av', 'Drones', 'Ed Tech', 'Entertainment', 'Fintech',
+    'Geospatial', 'Hr Tech', 'Insurtech', 'Legal Tech', 'Retail', 'Semiconductor',
+})
+
+
+# ============================================================================
+# CSV I/O FUNCTIONS
+# ============================================================================
+
+def read_source_csv(file_path):
+    """
+    Read a source CSV, using the multithreaded pyarrow engine when FAST_IO is enabled.
+    
+    Parameters:
+    -----------
+    file_path : Path
+        Path to the CSV file
+    
+    Returns:
+    --------
+    pd.DataFrame
+        Loaded dataframe
+    """
+    if FAST_IO and PYARROW_AVAILABLE:
+        df = pd.read_csv(file_path, engine='pyarrow')
+        # The pyarrow engine leaves None in text columns; downstream cleaning expects NaN
+        return df.fillna(np.nan)
+    
+    return pd.read_csv(file_path, low_memory=False)
+
+
+def read_legacy_csv(file_path, usecols=None):
+    """
+    Read a CSV of unknown encoding, loading the file from disk only once.
+    
+    Valid UTF-8 is parsed as UTF-8; anything else falls back to latin-1, which
+    decodes every byte (so iso-8859-1/cp1252 retries would never be reached).
+    With FAST_IO, the bytes are parsed by the multithreaded pyarrow engine
+    (which cannot take a callable usecols).
+    
+    Parameters:
+    -----------
+    file_path : Path
+        Path to the CSV file
+    usecols : list or callable, optional
+        Columns to parse (passed through to pd.read_csv)
+    
+    Returns:
+    --------
+    pd.DataFrame
+        Loaded dataframe
+    """
+    raw = Path(file_path).read_bytes()
+    try:
+        raw.decode('utf-8')
+        encoding = 'utf-8'
+    except UnicodeDecodeError:
+        encoding = 'latin-1'
+    
+    if FAST_IO and PYARROW_AVAILABLE and not callable(usecols):
+        df = pd.read_csv(io.BytesIO(raw), engine='pyarrow', encoding=encoding, usecols=usecols)
+        return df.fillna(np.nan)
+    
+    return pd.read_csv(io.BytesIO(raw), low_memory=False, encoding=encoding, usecols=usecols)
+
+
+@lru_cache(maxsize=None)
+def list_directory(directory):
+    """
+    Return the names of a directory's existing entries, cached per run.
+    
+    Broken symlinks are left out, as Path.exists() would reject them; a missing
+    directory gives an empty set.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file() or entry.is_dir())
+    except OSError:
+        return frozenset()
+
+
+def find_source_file(candidates):
+    """
+    Return the first candidate path that exists, or None.
+    
+    Each parent directory is listed once per run, so a candidate whose exact
+    name is on disk costs a set lookup instead of a stat. Misses fall back to
+    Path.exists(), which still matches names that differ only by case on
+    case-insensitive filesystems, or by Unicode normalization (NFC vs NFD).
+    
+    Parameters:
+    -----------
+    candidates : list of Path
+        Paths to try, in priority order
+    
+    Returns:
+    --------
+    Path or None
+        First existing candidate
+    """
+    for candidate in candidates:
+        if candidate.name in list_directory(str(candidate.parent)) or candidate.exists():
+            return candidate
+    return None
+
+
+def read_source_files(file_paths):
+    """
+    Read several source CSVs concurrently (the parsers release the GIL).
+    
+    Missing files are skipped here so the caller can report them.
+    
+    Parameters:
+    -----------
+    file_paths : list of Path
+        Paths to the CSV files
+    
+    Returns:
+    --------
+    dict
+        File path -> loaded dataframe, for each file that exists
+    """
+    existing = [path for path in file_paths if path.exists()]
+    if not existing:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=len(existing)) as executor:
+        return dict(zip(existing, executor.map(read_source_csv, existing)))
+
+
+def write_csv(df, path):
+    """
+    Write dataframe to CSV, using the pyarrow writer when FAST_IO is enabled.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dataframe to write
+    path : Path
+        Output file path
+    """
+    if FAST_IO and PYARROW_AVAILABLE:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            # Mixed-type object columns cannot be converted; use the pandas writer
+            print(f"  Fast CSV writer unavailable for this data ({e}); using pandas.")
+        else:
+            pacsv.write_csv(table, path, write_options=pacsv.WriteOptions(batch_size=64 * 1024))
+            return
+    
+    df.to_csv(path, index=False, encoding='utf-8', lineterminator='\n')
+
 
 # ============================================================================
 # COUNTRY CODE MAPPING FUNCTIONS
 # ============================================================================
 
+# Country name -> ISO3 code (None when unresolved), shared across all sources
+_ISO3_CACHE = {}
+
+# Library (and release) that produced the cached codes; a cache written by any
+# other library or release is discarded
+ISO3_BACKEND = 'country_converter' if CC_AVAILABLE else 'pycountry'
+try:
+    ISO3_BACKEND_VERSION = importlib.metadata.version(ISO3_BACKEND)
+except importlib.metadata.PackageNotFoundError:
+    ISO3_BACKEND_VERSION = None  # unknown release: the on-disk cache is not trusted
+
+
+def load_iso3_cache():
+    """
+    Seed _ISO3_CACHE from ISO3_CACHE_FILE.
+    
+    A missing or unreadable file, or one written by a different ISO3 backend or
+    backend version (or in the old untagged format), is ignored.
+    """
+    if ISO3_BACKEND_VERSION is None:
+        return
+    
+    try:
+        with open(ISO3_CACHE_FILE, encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return
+    
+    if (
+        isinstance(cached, dict)
+        and cached.get('backend') == ISO3_BACKEND
+        and cached.get('version') == ISO3_BACKEND_VERSION
+        and isinstance(cached.get('names'), dict)
+    ):
+        _ISO3_CACHE.update(cached['names'])
+
+
+def save_iso3_cache():
+    """
+    Write the resolved entries of _ISO3_CACHE to ISO3_CACHE_FILE for the next run.
+    
+    Unresolved names (None) are not written, so they are looked up again on
+    every run. The file is tagged with the backend and its version.
+    """
+    resolved = {country: iso3 for country, iso3 in _ISO3_CACHE.items() if iso3 is not None}
+    try:
+        with open(ISO3_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(
+                {'backend': ISO3_BACKEND, 'version': ISO3_BACKEND_VERSION, 'names': resolved},
+                f, ensure_ascii=False, indent=0, sort_keys=True
+            )
+    except (OSError, TypeError, ValueError) as e:
+        print(f"  Warning: could not save ISO3 cache: {e}")
+
+
+load_iso3_cache()
+
+
 def get_iso3_country_converter(country_name):
     """
     Get ISO3 code using country_converter library.
@@ -185,10 +640,71 @@ def get_iso3_pycountry(country_name):
         return None
 
 
+def build_iso3_map(countries):
+    """
+    Map country names to ISO3 codes, converting all uncached names in one batch.
+    
+    Results are memoized in _ISO3_CACHE so names shared between the Stanford,
+    GIRAI and OECD files are only looked up once per run. If the batch call
+    fails, the per-name fallback's results are used but not memoized.
+    
+    Parameters:
+    -----------
+    countries : iterable
+        Country names to convert
+    
+    Returns:
+    --------
+    dict
+        Country name -> ISO3 code (names without a match are omitted)
+    """
+    misses = [c for c in countries if c not in _ISO3_CACHE]
+    uncached = {}
+    
+    if misses:
+        if CC_AVAILABLE:
+            # Blank names never resolve; keep them out of the batch call
+            names = [str(c).strip() for c in misses]
+            to_convert = [n for n in names if n != '']
+            
+            try:
+                converted = cc.convert(names=to_convert, to='ISO3', not_found=None) if to_convert else []
+                # country_converter returns a bare string for single-name input
+                if isinstance(converted, str):
+                    converted = [converted]
+                converted = dict(zip(to_convert, converted))
+                batch_ok = True
+            except Exception:
+                # The per-name fallback turns errors into None, so its results
+                # are used for this call only and never cached
+                converted = {n: get_iso3_country_converter(n) for n in to_convert}
+                batch_ok = False
+            
+            for country, name in zip(misses, names):
+                iso3 = converted.get(name)
+                uncached[country] = None if iso3 == 'not found' else iso3
+            if batch_ok:
+                _ISO3_CACHE.update(uncached)
+                uncached = {}
+        else:
+            for country in misses:
+                _ISO3_CACHE[country] = get_iso3_pycountry(country)
+    
+    iso3_map = {}
+    for country in countries:
+        iso3 = uncached[country] if country in uncached else _ISO3_CACHE[country]
+        if iso3 is not None:
+            iso3_map[country] = iso3
+    
+    return iso3_map
+
+
 def add_iso3_column(df, country_col='Country'):
     """
     Add ISO3 column to dataframe by mapping Country column (VECTORIZED).
     
+    The input dataframe is modified in place and returned.
+    
     Parameters:
     -----------
     df : pd.DataFrame
@@ -201,8 +717,6 @@ def add_iso3_column(df, country_col='Country'):
     pd.DataFrame
         Dataframe with ISO3 column added
     """
-    df = df.copy()
-    
     # If ISO3 already exists, keep it but fill missing values
     if 'ISO3' in df.columns:
         print(f"  ISO3 column already exists. Filling missing values...")
@@ -211,15 +725,7 @@ def add_iso3_column(df, country_col='Country'):
         if missing_mask.any():
             # VECTORIZED: Get unique countries and create mapping dictionary
             unique_countries = df.loc[missing_mask, country_col].dropna().unique()
-            iso3_map = {}
-            
-            for country in unique_countries:
-                if CC_AVAILABLE:
-                    iso3 = get_iso3_country_converter(country)
-                else:
-                    iso3 = get_iso3_pycountry(country)
-                if iso3 is not None:
-                    iso3_map[country] = iso3
+            iso3_map = build_iso3_map(unique_countries)
             
             # Use .map() for vectorized assignment
             df.loc[missing_mask, 'ISO3'] = df.loc[missing_mask, country_col].map(iso3_map)
@@ -229,15 +735,7 @@ def add_iso3_column(df, country_col='Country'):
         
         # VECTORIZED: Get unique countries and create mapping dictionary
         unique_countries = df[country_col].dropna().unique()
-        iso3_map = {}
-        
-        for country in unique_countries:
-            if CC_AVAILABLE:
-                iso3 = get_iso3_country_converter(country)
-            else:
-                iso3 = get_iso3_pycountry(country)
-            if iso3 is not None:
-                iso3_map[country] = iso3
+        iso3_map = build_iso3_map(unique_countries)
         
         # Use .map() for vectorized assignment
         df['ISO3'] = df[country_col].map(iso3_map)
@@ -253,6 +751,8 @@ def enforce_numeric_types(df):
     """
     Ensure Year and Value columns are numeric.
     
+    The input dataframe is modified in place and returned.
+    
     Parameters:
     -----------
     df : pd.DataFrame
@@ -263,8 +763,6 @@ def enforce_numeric_types(df):
     pd.DataFrame
         Dataframe with numeric Year and Value columns
     """
-    df = df.copy()
-    
     # Convert Year to numeric
     if 'Year' in df.columns:
         print("  Converting 'Year' to numeric...")
@@ -284,6 +782,8 @@ def remove_redundant_columns(df):
     """
     Remove columns that are entirely redundant or provide zero analytical value.
     
+    The input dataframe is modified in place and returned.
+    
     Parameters:
     -----------
     df : pd.DataFrame
@@ -294,8 +794,6 @@ def remove_redundant_columns(df):
     pd.DataFrame
         Dataframe with redundant columns removed
     """
-    df = df.copy()
-    
     # Identify columns to keep
     columns_to_keep = []
     
@@ -331,7 +829,7 @@ def remove_redundant_columns(df):
     
     if columns_to_drop:
         print(f"  Dropping {len(columns_to_drop)} redundant columns: {', '.join(columns_to_drop[:10])}{'...' if len(columns_to_drop) > 10 else ''}")
-        df = df.drop(columns=columns_to_drop)
+        df.drop(columns=columns_to_drop, inplace=True)
     
     return df
 
@@ -340,113 +838,45 @@ def remove_redundant_columns(df):
 # DATA LOADING FUNCTIONS
 # ============================================================================
 
-def load_stanford_data(file_path):
-    """
-    Load and standardize Stanford AI Index data.
-    
-    Parameters:
-    -----------
-    file_path : Path
-        Path to Stanford data file
-    
-    Returns:
-    --------
-    pd.DataFrame
-        Standardized Stanford dataframe
-    """
-    print("\n" + "=" * 80)
-    print("Loading Stanford AI Index Data")
-    print("=" * 80)
-    print(f"File: {file_path}")
-    
-    if not file_path.exists():
-        raise FileNotFoundError(f"Stanford data file not found: {file_path}")
-    
-    df = pd.read_csv(file_path, low_memory=False)
-    print(f"  Loaded: {len(df)} rows, {len(df.columns)} columns")
-    print(f"  Columns: {', '.join(df.columns.tolist()[:10])}{'...' if len(df.columns) > 10 else ''}")
-    
-    # Add ISO3 column
-    df = add_iso3_column(df, country_col='Country')
-    
-    # Enforce numeric types
-    df = enforce_numeric_types(df)
-    
-    # Remove redundant columns
-    df = remove_redundant_columns(df)
-    
-    print(f"  Final shape: {len(df)} rows, {len(df.columns)} columns")
-    
-    return df
-
-
-def load_girai_data(file_path):
+def load_source_data(file_path, name, short_name=None, df=None):
     """
-    Load and standardize GIRAI data.
-    
-    Parameters:
-    -----------
-    file_path : Path
-        Path to GIRAI data file
-    
-    Returns:
-    --------
-    pd.DataFrame
-        Standardized GIRAI dataframe
-    """
-    print("\n" + "=" * 80)
-    print("Loading GIRAI Data")
-    print("=" * 80)
-    print(f"File: {file_path}")
-    
-    if not file_path.exists():
-        raise FileNotFoundError(f"GIRAI data file not found: {file_path}")
-    
-    df = pd.read_csv(file_path, low_memory=False)
-    print(f"  Loaded: {len(df)} rows, {len(df.columns)} columns")
-    print(f"  Columns: {', '.join(df.columns.tolist()[:10])}{'...' if len(df.columns) > 10 else ''}")
-    
-    # GIRAI already has ISO3, but ensure it's complete
-    df = add_iso3_column(df, country_col='Country')
-    
-    # Enforce numeric types
-    df = enforce_numeric_types(df)
-    
-    # Remove redundant columns
-    df = remove_redundant_columns(df)
-    
-    print(f"  Final shape: {len(df)} rows, {len(df.columns)} columns")
+    Load and standardize one source dataset (Stanford AI Index, GIRAI or OECD).
     
-    return df
-
-
-def load_oecd_data(file_path):
-    """
-    Load and standardize OECD data.
+    All three sources share the same long format, so they go through the same
+    steps: ISO3 is added (or only its gaps filled, when the source already has
+    a complete ISO3 column), numeric types are enforced and redundant columns
+    are dropped.
     
     Parameters:
     -----------
     file_path : Path
-        Path to OECD data file
+        Path to the source data file
+    name : str
+        Source name used in progress messages (e.g. 'Stanford AI Index')
+    short_name : str, optional
+        Name used in the file-not-found error; defaults to ``name``
+    df : pd.DataFrame, optional
+        Already loaded contents of ``file_path``; read from disk if omitted
     
     Returns:
     --------
     pd.DataFrame
-        Standardized OECD dataframe
+        Standardized source dataframe
     """
     print("\n" + "=" * 80)
-    print("Loading OECD Data")
+    print(f"Loading {name} Data")
     print("=" * 80)
     print(f"File: {file_path}")
     
-    if not file_path.exists():
-        raise FileNotFoundError(f"OECD data file not found: {file_path}")
+    if df is None:
+        if not file_path.exists():
+            raise FileNotFoundError(f"{short_name or name} data file not found: {file_path}")
+        df = read_source_csv(file_path)
     
-    df = pd.read_csv(file_path, low_memory=False)
     print(f"  Loaded: {len(df)} rows, {len(df.columns)} columns")
     print(f"  Columns: {', '.join(df.columns.tolist()[:10])}{'...' if len(df.columns) > 10 else ''}")
     
-    # Add ISO3 column (OECD may have Country_Code but we want ISO3)
+    # Add ISO3 column (only missing values are resolved if it already exists)
     df = add_iso3_column(df, country_col='Country')
     
     # Enforce numeric types
@@ -495,30 +925,23 @@ def merge_dataframes(df_list):
     
     # Standardize column order: Core columns first, then metadata, then others
     priority_cols = ['Year', 'Country', 'ISO3', 'Metric', 'Value']
-    metadata_cols = [col for col in all_columns if col in METADATA_COLUMNS]
-    other_cols = [col for col in all_columns if col not in priority_cols + metadata_cols]
+    present = frozenset(all_columns)
+    metadata_set = frozenset(METADATA_COLUMNS)
+    ordered_set = metadata_set.union(priority_cols)
+    metadata_cols = [col for col in all_columns if col in metadata_set]
+    other_cols = [col for col in all_columns if col not in ordered_set]
     
-    column_order = []
-    for col in priority_cols:
-        if col in all_columns:
-            column_order.append(col)
+    column_order = [col for col in priority_cols if col in present]
     column_order.extend(metadata_cols)
     column_order.extend(other_cols)
     
     print(f"  Column order: {', '.join(column_order[:10])}{'...' if len(column_order) > 10 else ''}")
     
-    # Add missing columns to each dataframe with NaN values
+    # Reorder each dataframe, adding missing columns as NA in the same step
     standardized_dfs = []
     for i, df in enumerate(df_list):
-        df_copy = df.copy()
-        missing_cols = [col for col in column_order if col not in df_copy.columns]
-        if missing_cols:
-            for col in missing_cols:
-                df_copy[col] = pd.NA
-        # Reorder columns
-        df_copy = df_copy[column_order]
-        standardized_dfs.append(df_copy)
-        print(f"  DataFrame {i+1}: {len(df_copy)} rows, {len(df_copy.columns)} columns")
+        standardized_dfs.append(df.reindex(columns=column_order, fill_value=pd.NA, copy=False))
+        print(f"  DataFrame {i+1}: {len(df)} rows, {len(column_order)} columns")
     
     # Concatenate
     print("\n  Concatenating dataframes...")
@@ -533,6 +956,295 @@ def merge_dataframes(df_list):
 # METRIC CLEANING FUNCTIONS
 # ============================================================================
 
+def flag_unique_values(strings, predicate):
+    """
+    Evaluate a vectorized string test on the distinct values of a column only.
+    
+    Parameters:
+    -----------
+    strings : pd.Series
+        Column of strings
+    predicate : callable
+        Function taking a pd.Series of strings and returning a boolean Series
+        (it must map any missing values to False)
+    
+    Returns:
+    --------
+    np.ndarray
+        Boolean mask aligned with the input rows
+    """
+    uniques = strings.unique()
+    flagged = uniques[predicate(pd.Series(uniques, dtype=object)).to_numpy(dtype=bool)]
+    return strings.isin(flagged).to_numpy()
+
+
+def contains_digit(strings):
+    """Flag strings that contain a digit."""
+    return flag_unique_values(strings, lambda u: u.str.contains(DIGIT_RE, regex=True, na=False))
+
+
+def is_all_lowercase(strings):
+    """Flag strings that lowercasing leaves unchanged (no upper-case letters)."""
+    return flag_unique_values(strings, lambda u: u == u.str.lower())
+
+
+def is_valid_iso3(codes):
+    """Flag 3-character ISO3 codes (after stripping), excluding the 'nan' placeholder."""
+    def check(uniques):
+        stripped = uniques.astype(str).str.strip()
+        return (stripped.str.len() == 3) & (stripped != 'nan') & (stripped != 'NaN')
+    return flag_unique_values(codes, check)
+
+
+def mentions_oecd(values):
+    """Flag Source/Dataset values that mention OECD (case-insensitive)."""
+    return flag_unique_values(values, lambda uniques: uniques.str.contains('OECD', case=False, na=False))
+
+
+def is_girai_metric(metrics):
+    """Flag metric names containing a GIRAI anchor (case-insensitive)."""
+    return flag_unique_values(metrics, lambda uniques: uniques.str.contains(GIRAI_ANCHORS_RE, regex=True, na=False))
+
+
+def backfill_columns(df, mask, values):
+    """
+    Set columns to fixed values on the masked rows, one column at a time.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dataframe to update in place
+    mask : array-like of bool
+        Rows to fill
+    values : dict
+        Column name -> value for the masked rows
+    """
+    for col, value in values.items():
+        if col in df.columns:
+            df[col] = df[col].mask(mask, value)
+        else:
+            df.loc[mask, col] = value
+
+
+def rename_metrics(df, mapping, verb='Restored', scope=None):
+    """
+    Rename Metric values through a dict in a single hashed pass.
+    
+    Prints one line per renamed name, in mapping order, when VERBOSE is set.
+    The mapping must not chain (no new name may also be an old name).
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dataframe to update in place
+    mapping : dict
+        Old metric name -> new metric name
+    verb : str
+        Verb used in the per-name progress lines
+    scope : pd.Series of bool, optional
+        Only rename rows where this is True
+    
+    Returns:
+    --------
+    int
+        Number of rows renamed
+    """
+    # Nothing to look up when the scoped source/file is absent
+    if scope is not None:
+        scope = np.asarray(scope, dtype=bool)
+        if not scope.any():
+            return 0
+    
+    metrics = df['Metric'].to_numpy(dtype=object, copy=True)
+    
+    # Position of each row's name among the mapping keys (-1 = not renamed)
+    key_index = pd.Index(list(mapping), dtype=object).get_indexer(metrics)
+    if scope is not None:
+        key_index[~scope] = -1
+    rename_mask = key_index >= 0
+    if not rename_mask.any():
+        return 0
+    
+    rename_counts = np.bincount(key_index[rename_mask], minlength=len(mapping))
+    new_names = np.array(list(mapping.values()), dtype=object)
+    metrics[rename_mask] = new_names[key_index[rename_mask]]
+    df['Metric'] = pd.Series(metrics, index=df.index, dtype=df['Metric'].dtype)
+    
+    if VERBOSE:
+        print('\n'.join(
+            f"  ✓ {verb} {count} rows: '{old_name}' -> '{new_name}'"
+            for (old_name, new_name), count in zip(mapping.items(), rename_counts) if count
+        ))
+    return int(rename_counts.sum())
+
+
+def map_unique_values(series, transform):
+    """
+    Apply a vectorized string transform to the distinct values of a column only.
+    
+    Metric names repeat across many rows, so running a chain of str.replace
+    calls over the distinct names and mapping the results back touches far
+    fewer strings than running it over the full column.
+    
+    Parameters:
+    -----------
+    series : pd.Series
+        Column to transform
+    transform : callable
+        Function taking and returning a pd.Series of strings
+    
+    Returns:
+    --------
+    pd.Series
+        Transformed column (missing values are left missing)
+    """
+    uniques = pd.Series(series.dropna().unique(), dtype=object)
+    if uniques.empty:
+        return series
+    
+    transformed = transform(uniques.copy())
+    return series.map(dict(zip(uniques, transformed)))
+
+
+def parse_percent_values(values):
+    """
+    Parse survey values that may carry '%' signs, coercing failures to NaN.
+    
+    Text columns are stringified, stripped of '%' and trimmed in a single walk
+    before pd.to_numeric; numeric columns go straight to pd.to_numeric.
+    
+    Parameters:
+    -----------
+    values : pd.Series
+        Raw value column
+    
+    Returns:
+    --------
+    pd.Series
+        Numeric values
+    """
+    if values.dtype == 'object':
+        values = pd.Series([str(v).replace('%', '').strip() for v in values], index=values.index, dtype=object)
+    return pd.to_numeric(values, errors='coerce')
+
+
+def normalize_survey_statements(statements, prefix=''):
+    """
+    Normalize survey statement text and embed it in a metric name.
+    
+    Collapses whitespace, title-cases, then restores 'AI', hyphenates long
+    dashes and repairs '35 Years' in one regex pass. Everything, including
+    the prefix concatenation, runs once per distinct statement.
+    
+    Parameters:
+    -----------
+    statements : pd.Series
+        Statement/question column
+    prefix : str
+        Metric-name prefix placed before each normalized statement
+    
+    Returns:
+    --------
+    pd.Series
+        Prefixed, normalized statements
+    """
+    def normalize(uniques):
+        uniques = uniques.str.strip().str.replace(WHITESPACE_RUN_RE, ' ', regex=True).str.title()
+        return prefix + uniques.str.replace(SURVEY_STATEMENT_FIXES_RE, lambda m: SURVEY_STATEMENT_FIXES[m.group(0)], regex=True)
+    
+    return map_unique_values(statements.astype(str), normalize)
+
+
+def normalize_survey_metrics(metrics):
+    """Straighten curly quotes, lower "'S" and restore 'AI' in one pass (PROTECTED: no title case)."""
+    return map_unique_values(
+        metrics.astype(str),
+        lambda uniques: uniques.str.replace(SURVEY_METRIC_FIXES_RE, lambda m: SURVEY_METRIC_FIXES[m.group(0)], regex=True).str.strip()
+    )
+
+
+def restore_agreement_survey(survey_file, survey_year, path_part):
+    """
+    Rebuild '% Agreeing With Statement' rows from a raw Stanford survey CSV.
+    
+    Parameters:
+    -----------
+    survey_file : str
+        Source file name (also used as Source_File)
+    survey_year : int
+        Year assigned to the restored rows
+    path_part : str
+        Report data folder under 'public access raw data'
+    
+    Returns:
+    --------
+    tuple or None
+        (restored rows, success message), or None if the file is missing or
+        unusable. ISO3 is still empty and Metric not yet normalized: the caller
+        does both for all restored surveys at once, and prints the message only
+        once the rows have actually been appended.
+    """
+    file_path_survey = BASE_DIR / "stanford_ai_index" / "public access raw data" / path_part / survey_file
+    
+    if not file_path_survey.exists():
+        print(f"  WARNING: File not found: {file_path_survey}")
+        return None
+    
+    try:
+        file_df_survey = read_legacy_csv(file_path_survey)
+        if file_df_survey is None or len(file_df_survey) == 0:
+            return None
+        
+        # Find the value column (likely '% Agree' or similar)
+        value_col_survey = next((col for col in file_df_survey.columns if SURVEY_VALUE_COLUMN_RE.search(col)), None)
+        if not value_col_survey:
+            print(f"  WARNING: Could not find value column in '{survey_file}'.")
+            return None
+        
+        file_df_survey = file_df_survey.rename(columns={value_col_survey: 'Value'})
+        file_df_survey['Value'] = parse_percent_values(file_df_survey['Value'])
+        
+        statement_col_survey = next((col for col in SURVEY_STATEMENT_COLUMNS if col in file_df_survey.columns), None)
+        if not statement_col_survey:
+            print(f"  WARNING: Could not find Statement/Question column in '{survey_file}'.")
+            return None
+        
+        # Create metric with full context: % Agreeing With Statement: [Statement]
+        file_df_survey['Metric'] = normalize_survey_statements(file_df_survey[statement_col_survey], prefix='% Agreeing With Statement: ')
+        
+        country_col_survey = next((col for col in SURVEY_COUNTRY_COLUMNS if col in file_df_survey.columns), None)
+        if not country_col_survey:
+            return None
+        
+        # Cast and strip the country names once, for both the filter and the output
+        countries = file_df_survey[country_col_survey].astype(str).str.strip()
+        keep_mask = ~countries.str.fullmatch(SURVEY_GLOBAL_ROW_RE).to_numpy(dtype=bool)
+        file_df_survey = file_df_survey[keep_mask]
+        
+        # Create new DataFrame with Year set appropriately (scalars broadcast
+        # over the rows, so Year is int64 from the start)
+        new_df_survey = pd.DataFrame({
+            'Year': survey_year,
+            'Country': countries[keep_mask],
+            'ISO3': pd.NA,
+            'Metric': file_df_survey['Metric'],
+            'Value': file_df_survey['Value'],
+            'Source_File': survey_file,
+            'Source_Category': 'Public Opinion',
+            'Source_Type': 'csv',
+            'Source_Year': str(survey_year),
+            'Source': 'Stanford AI Index',
+            'Dataset': 'Stanford AI Index - Public Opinion',
+        })
+        
+        new_df_survey = new_df_survey.dropna(subset=['Country', 'Metric', 'Value'])
+        
+        return new_df_survey, f"  ✓ Successfully restored {len(new_df_survey)} rows for {survey_year} Survey 'Agreeing With Statement' metrics with full context."
+    except Exception as e:
+        print(f"  ERROR: Failed to process '{survey_file}': {str(e)}")
+        return None
+
+
 def contains_junk_characters(text):
     """
     Check if text contains any junk/encoding corruption characters.
@@ -550,11 +1262,32 @@ def contains_junk_characters(text):
     if pd.isna(text):
         return False
     
-    text_str = str(text)
-    for junk_char in JUNK_CHARACTERS:
-        if junk_char in text_str:
-            return True
-    return False
+    return JUNK_CHARACTERS_RE.search(str(text)) is not None
+
+
+def find_junk_metrics(metrics):
+    """
+    Vectorized contains_junk_characters over a Metric column.
+    
+    Only distinct names are scanned, and pure-ASCII names are skipped up front
+    since str.isascii() reads a flag CPython already keeps on each string.
+    
+    Parameters:
+    -----------
+    metrics : pd.Series
+        Metric column
+    
+    Returns:
+    --------
+    np.ndarray
+        Boolean mask of rows whose metric name contains junk characters
+    """
+    candidates = [m for m in metrics.dropna().unique() if isinstance(m, str)]
+    if JUNK_NEEDS_NON_ASCII:
+        candidates = [m for m in candidates if not m.isascii()]
+    
+    junk_names = [m for m in candidates if JUNK_CHARACTERS_RE.search(m)]
+    return metrics.isin(junk_names).to_numpy()
 
 
 def is_placeholder_metric(metric_name):
@@ -577,12 +1310,11 @@ def is_placeholder_metric(metric_name):
     metric_str = str(metric_name).strip()
     
     # Check for placeholder patterns
-    for pattern in PLACEHOLDER_PATTERNS:
-        if metric_str.startswith(pattern):
-            return True
+    if metric_str.startswith(PLACEHOLDER_PREFIXES):
+        return True
     
     # Check for exact temporary metric names
-    if metric_str in TEMPORARY_METRICS:
+    if metric_str in TEMPORARY_METRICS_SET:
         return True
     
     return False
@@ -605,63 +1337,57 @@ def clean_metric_names(df):
     print("\n[Step 3a] Cleaning Metric Names")
     print("-" * 80)
     
-    df = df.copy()
-    initial_rows = len(df)
+    initial_rows = len(df)
+    
+    if 'Metric' not in df.columns:
+        print("  Warning: 'Metric' column not found")
+        return df
+    
+    # All three masks are built over the full frame and applied in one slice.
+    # Each filter only counts rows the earlier filters have not already removed.
+    metric_str = df['Metric'].astype('string').str.strip()
     
     # Filter 1: Remove rows with junk/encoding characters in Metric column
     print("  Removing rows with corrupted metric names (junk characters)...")
-    before_junk = len(df)
+    junk_mask = find_junk_metrics(df['Metric'])
+    junk_count = junk_mask.sum()
     
-    if 'Metric' in df.columns:
-        junk_mask = df['Metric'].apply(contains_junk_characters)
-        junk_count = junk_mask.sum()
-        
-        if junk_count > 0:
-            print(f"    Found {junk_count} rows with corrupted metric names")
-            df = df[~junk_mask]
-            print(f"    Removed {junk_count} rows")
-        else:
-            print(f"    No rows with junk characters found")
+    if junk_count > 0:
+        print(f"    Found {junk_count} rows with corrupted metric names")
+        print(f"    Removed {junk_count} rows")
     else:
-        print("    Warning: 'Metric' column not found")
-    
-    after_junk = len(df)
+        print(f"    No rows with junk characters found")
     
     # Filter 2: Remove placeholder/temporary metrics
     print("  Removing placeholder and temporary metric names...")
-    before_placeholder = len(df)
-    
-    if 'Metric' in df.columns:
-        placeholder_mask = df['Metric'].apply(is_placeholder_metric)
-        placeholder_count = placeholder_mask.sum()
-        
-        if placeholder_count > 0:
-            print(f"    Found {placeholder_count} rows with placeholder metrics")
-            df = df[~placeholder_mask]
-            print(f"    Removed {placeholder_count} rows")
-        else:
-            print(f"    No placeholder metrics found")
+    # Same test as is_placeholder_metric, vectorized over the column
+    placeholder_mask = (
+        metric_str.isna()
+        | metric_str.str.startswith(PLACEHOLDER_PREFIXES, na=False)
+        | metric_str.isin(TEMPORARY_METRICS_SET)
+    ).to_numpy(dtype=bool)
+    placeholder_count = (placeholder_mask & ~junk_mask).sum()
+    
+    if placeholder_count > 0:
+        print(f"    Found {placeholder_count} rows with placeholder metrics")
+        print(f"    Removed {placeholder_count} rows")
     else:
-        print("    Warning: 'Metric' column not found")
-    
-    after_placeholder = len(df)
+        print(f"    No placeholder metrics found")
     
     # Filter 3: Remove empty or whitespace-only metric names
     print("  Removing rows with empty or whitespace-only metric names...")
-    before_empty = len(df)
+    empty_mask = (metric_str.isna() | (metric_str == '')).to_numpy(dtype=bool, na_value=True)
+    empty_count = (empty_mask & ~junk_mask & ~placeholder_mask).sum()
     
-    if 'Metric' in df.columns:
-        empty_mask = df['Metric'].isna() | (df['Metric'].astype(str).str.strip() == '')
-        empty_count = empty_mask.sum()
-        
-        if empty_count > 0:
-            print(f"    Found {empty_count} rows with empty metric names")
-            df = df[~empty_mask]
-            print(f"    Removed {empty_count} rows")
-        else:
-            print(f"    No empty metric names found")
+    if empty_count > 0:
+        print(f"    Found {empty_count} rows with empty metric names")
+        print(f"    Removed {empty_count} rows")
     else:
-        print("    Warning: 'Metric' column not found")
+        print(f"    No empty metric names found")
+    
+    drop_mask = junk_mask | placeholder_mask | empty_mask
+    if drop_mask.any():
+        df = df.take(np.flatnonzero(~drop_mask))
     
     after_empty = len(df)
     total_removed = initial_rows - after_empty
@@ -694,56 +1420,29 @@ def resolve_case_redundancy(df):
         print("  Warning: 'Metric' column not found, skipping case resolution")
         return df
     
-    df = df.copy()
-    
-    # Find metrics that differ only by case
-    unique_metrics = df['Metric'].dropna().unique()
-    metric_lower_map = {}
-    case_variants = {}
-    
-    for metric in unique_metrics:
-        metric_str = str(metric)
-        metric_lower = metric_str.lower()
-        
-        if metric_lower not in metric_lower_map:
-            metric_lower_map[metric_lower] = []
-        metric_lower_map[metric_lower].append(metric_str)
-    
-    # Find case variants (same name, different case)
-    for metric_lower, variants in metric_lower_map.items():
-        if len(variants) > 1:
-            # Multiple case variants found
-            # Use the most common variant as the standard
-            variant_counts = {}
-            for variant in variants:
-                count = (df['Metric'] == variant).sum()
-                variant_counts[variant] = count
-            
-            # Sort by count (descending) and use the most common
-            sorted_variants = sorted(variant_counts.items(), key=lambda x: x[1], reverse=True)
-            standard_variant = sorted_variants[0][0]
-            
-            case_variants[metric_lower] = {
-                'standard': standard_variant,
-                'variants': variants,
-                'counts': variant_counts
-            }
+    # Row count per distinct metric name, in order of first appearance
+    metric_counts = df['Metric'].value_counts(sort=False)
+    metric_lower = metric_counts.index.astype(str).str.lower()
+    
+    # Group names that differ only by case; the most common variant is the
+    # standard (ties go to the variant seen first)
+    groups = metric_counts.groupby(metric_lower, sort=False)
+    group_size = groups.transform('size')
+    standard = groups.transform('idxmax')
     
-    if case_variants:
-        print(f"  Found {len(case_variants)} metric names with case variants")
+    case_variant_count = groups.ngroups - (group_size == 1).sum()
+    
+    if case_variant_count:
+        print(f"  Found {case_variant_count} metric names with case variants")
         print(f"  Standardizing to most common variant...")
         
-        total_changes = 0
-        for metric_lower, info in case_variants.items():
-            standard = info['standard']
-            variants = info['variants']
-            
-            # Replace all variants with the standard
-            for variant in variants:
-                if variant != standard:
-                    count = (df['Metric'] == variant).sum()
-                    df.loc[df['Metric'] == variant, 'Metric'] = standard
-                    total_changes += count
+        # Replace all variants with the standard in a single mapped assignment
+        renames = standard[(group_size > 1) & (standard.index != standard.values)]
+        total_changes = metric_counts[renames.index].sum()
+        
+        mapped = df['Metric'].map(renames)
+        rename_mask = mapped.notna()
+        df.loc[rename_mask, 'Metric'] = mapped[rename_mask]
         
         print(f"  Total metric name changes: {total_changes:,}")
     else:
@@ -770,8 +1469,6 @@ def convert_to_strings_for_deduplication(df):
     print("\n[Step 3c] Converting Non-Numeric Columns to Strings")
     print("-" * 80)
     
-    df = df.copy()
-    
     # Identify non-numeric columns
     numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
     non_numeric_cols = df.select_dtypes(include=['object']).columns.tolist()
@@ -779,19 +1476,65 @@ def convert_to_strings_for_deduplication(df):
     print(f"  Numeric columns (preserving): {len(numeric_cols)}")
     print(f"  Non-numeric columns (converting to string): {len(non_numeric_cols)}")
     
-    # Convert non-numeric columns to strings
-    converted_count = 0
-    for col in non_numeric_cols:
-        if col not in ['Year', 'Value']:  # Preserve Year and Value as numeric
-            df[col] = df[col].astype(str)
-            converted_count += 1
+    # Convert non-numeric columns to strings in one multi-column assignment
+    to_convert = [col for col in non_numeric_cols if col not in ['Year', 'Value']]  # Preserve Year and Value as numeric
+    if to_convert:
+        df[to_convert] = df[to_convert].astype(str)
     
-    print(f"  Converted {converted_count} columns to string type")
+    print(f"  Converted {len(to_convert)} columns to string type")
     print("  All columns are now hashable for deduplication")
     
     return df
 
 
+def use_arrow_strings(df):
+    """
+    Cast ARROW_STRING_COLUMNS to string[pyarrow] when ARROW_STRINGS is enabled.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dataframe to convert
+    
+    Returns:
+    --------
+    pd.DataFrame
+        Dataframe with Arrow-backed text columns (unchanged if disabled)
+    """
+    if not (ARROW_STRINGS and PYARROW_AVAILABLE):
+        return df
+    
+    for col in ARROW_STRING_COLUMNS:
+        if col in df.columns and df[col].dtype != 'string[pyarrow]':
+            df[col] = df[col].astype('string[pyarrow]')
+    return df
+
+
+def drop_duplicate_rows(df, subset=None):
+    """
+    Drop duplicate rows (keeping the first), copying only when some are found.
+    
+    Most dedup passes find nothing to remove; those return df itself instead
+    of rebuilding every column.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dataframe to deduplicate
+    subset : list, optional
+        Columns identifying a duplicate (default: all columns)
+    
+    Returns:
+    --------
+    pd.DataFrame
+        Dataframe without duplicate rows
+    """
+    duplicate_mask = df.duplicated(subset=subset).to_numpy()
+    if not duplicate_mask.any():
+        return df
+    return df.take(np.flatnonzero(~duplicate_mask))
+
+
 def final_cleanup(df):
     """
     Final cleanup of merged dataframe.
@@ -810,7 +1553,8 @@ def final_cleanup(df):
     print("STEP 3: Final Cleanup and Metric Filtering")
     print("=" * 80)
     
-    df = df.copy()
+    # Shallow copy: the row filters below hand every later step a new frame
+    df = df.copy(deep=False)
     
     initial_rows = len(df)
     
@@ -828,23 +1572,23 @@ def final_cleanup(df):
     # PRE-FILTER: Drop rows with non-country geographic entities
     if 'Country' in df.columns or 'ISO3' in df.columns:
         before_prefilter = len(df)
-        filter_mask = pd.Series([False] * len(df), index=df.index)
+        filter_mask = np.zeros(len(df), dtype=bool)
         
         # Filter by Country column
         if 'Country' in df.columns:
             country_str = df['Country'].astype(str).str.strip().str.upper()
-            filter_mask = filter_mask | (
-                country_str.isin(['GLOBAL', 'WORLD', 'EU', 'OECD']) |
+            filter_mask |= (
+                country_str.isin(GEO_AGGREGATES) |
                 country_str.str.contains('&', na=False, regex=False)
-            )
+            ).to_numpy()
         
         # Filter by ISO3 column
         if 'ISO3' in df.columns:
             iso3_str = df['ISO3'].astype(str).str.strip().str.upper()
-            filter_mask = filter_mask | (
-                iso3_str.isin(['GLOBAL', 'WORLD', 'EU', 'OECD']) |
+            filter_mask |= (
+                iso3_str.isin(GEO_AGGREGATES) |
                 iso3_str.str.contains('&', na=False, regex=False)
-            )
+            ).to_numpy()
         
         df = df[~filter_mask]
         prefilter_removed = before_prefilter - len(df)
@@ -860,9 +1604,11 @@ def final_cleanup(df):
     # Convert non-numeric columns to strings for deduplication
     df = convert_to_strings_for_deduplication(df)
     
+    df = use_arrow_strings(df)
+    
     # Remove duplicate rows
     initial_rows = len(df)
-    df = df.drop_duplicates()
+    df = drop_duplicate_rows(df)
     duplicates_removed = initial_rows - len(df)
     if duplicates_removed > 0:
         print(f"\n[Step 3d] Removed {duplicates_removed} duplicate rows")
@@ -895,36 +1641,18 @@ def final_cleanup(df):
         initial_count_6 = len(df)
         
         # Universal ISO3 Whitelist - Only keep rows with valid ISO3 codes
-        trusted_iso3 = [
-            "AFG", "ALB", "DZA", "ASM", "AND", "AGO", "AIA", "ATA", "ATG", "ARG", "ARM", "ABW", "AUS", "AUT", "AZE",
-            "BHS", "BHR", "BGD", "BRB", "BLR", "BEL", "BLZ", "BEN", "BMU", "BTN", "BOL", "BES", "BIH", "BWA", "BVT",
-            "BRA", "IOT", "BRN", "BGR", "BFA", "BDI", "CPV", "KHM", "CMR", "CAN", "CYM", "CAF", "TCD", "CHL", "CHN",
-            "CXR", "CCK", "COL", "COM", "COD", "COG", "COK", "CRI", "CIV", "HRV", "CUB", "CUW", "CYP", "CZE", "DNK",
-            "DJI", "DMA", "DOM", "ECU", "EGY", "SLV", "GNQ", "ERI", "EST", "SWZ", "ETH", "FLK", "FRO", "FJI", "FIN",
-            "FRA", "GUF", "PYF", "ATF", "GAB", "GMB", "GEO", "DEU", "GHA", "GIB", "GRC", "GRL", "GRD", "GLP", "GUM",
-            "GTM", "GGY", "GIN", "GNB", "GUY", "HTI", "HMD", "VAT", "HND", "HKG", "HUN", "ISL", "IND", "IDN", "IRN",
-            "IRQ", "IRL", "IMN", "ISR", "ITA", "JAM", "JPN", "JEY", "JOR", "KAZ", "KEN", "KIR", "PRK", "KOR", "KWT",
-            "KGZ", "LAO", "LVA", "LBN", "LSO", "LBR", "LBY", "LIE", "LTU", "LUX", "MAC", "MDG", "MWI", "MYS", "MDV",
-            "MLI", "MLT", "MHL", "MTQ", "MRT", "MUS", "MYT", "MEX", "FSM", "MDA", "MCO", "MNG", "MNE", "MSR", "MAR",
-            "MOZ", "MMR", "NAM", "NRU", "NPL", "NLD", "NCL", "NZL", "NIC", "NER", "NGA", "NIU", "NFK", "MKD", "MNP",
-            "NOR", "OMN", "PAK", "PLW", "PSE", "PAN", "PNG", "PRY", "PER", "PHL", "PCN", "POL", "PRT", "PRI", "QAT",
-            "REU", "ROU", "RUS", "RWA", "BLM", "SHN", "KNA", "LCA", "MAF", "SPM", "VCT", "WSM", "SMR", "STP", "SAU",
-            "SEN", "SRB", "SYC", "SLE", "SGP", "SXM", "SVK", "SVN", "SLB", "SOM", "ZAF", "SGS", "SSD", "ESP", "LKA",
-            "SDN", "SUR", "SJM", "SWE", "CHE", "SYR", "TWN", "TJK", "TZA", "THA", "TLS", "TGO", "TKL", "TON", "TTO",
-            "TUN", "TUR", "TKM", "TCA", "TUV", "UGA", "UKR", "ARE", "GBR", "USA", "UMI", "URY", "UZB", "VUT", "VEN",
-            "VNM", "VGB", "VIR", "WLF", "ESH", "YEM", "ZMB", "ZWE", "EU27", "WLD"
-        ]
-        
-        trusted_iso3_set = set(trusted_iso3)
-        df = df[df['ISO3'].isin(trusted_iso3_set)]
+        df = df[df['ISO3'].isin(TRUSTED_ISO3)]
         
         removed_geo = initial_count_6 - len(df)
         print(f"  Removed {removed_geo} rows of non-country data.")
         
         # STEP 47.1: Fix Country Redundancy - Map ISO3 to single country name
         if 'Country' in df.columns:
-            iso_to_name = df[df['ISO3'].notna() & (df['ISO3'] != 'nan')].groupby('ISO3')['Country'].first().to_dict()
-            df['Country'] = df['ISO3'].map(iso_to_name).fillna(df['Country'])
+            # Every ISO3 left here is whitelisted, so group on its integer codes
+            iso3_codes, iso3_uniques = pd.factorize(df['ISO3'])
+            first_names = df['Country'].groupby(iso3_codes).first().reindex(range(len(iso3_uniques)))
+            unified = pd.Series(first_names.to_numpy()[iso3_codes], index=df.index)
+            df['Country'] = unified.fillna(df['Country'])
             print(f"  Unified country names via ISO3 mapping (collapsed redundant entries).")
     
     # STEP 46: Final Gold Standard Hard-Lock
@@ -933,27 +1661,28 @@ def final_cleanup(df):
         initial_count_46 = len(df)
         
         # 1. Strict Country Hard-Lock
-        filter_mask = pd.Series([False] * len(df), index=df.index)
+        filter_mask = np.zeros(len(df), dtype=bool)
         
         # Filter by Country column
         if 'Country' in df.columns:
             country_str = df['Country'].astype(str).str.strip()
             # Contains digits
-            filter_mask = filter_mask | country_str.str.contains(r'\d', na=False, regex=True)
+            filter_mask |= contains_digit(country_str)
             # Is all lowercase (not proper title case) - only keep title case
-            filter_mask = filter_mask | (country_str == country_str.str.lower())
+            filter_mask |= is_all_lowercase(country_str)
             # Has length of 2 (likely ISO2 codes, not standard names)
-            filter_mask = filter_mask | (country_str.str.len() == 2)
+            filter_mask |= (country_str.str.len() == 2).to_numpy()
         
         # Filter by ISO3 column
         if 'ISO3' in df.columns:
             iso3_str = df['ISO3'].astype(str)
+            iso3_stripped = iso3_str.str.strip()
             # Contains digits
-            filter_mask = filter_mask | iso3_str.str.contains(r'\d', na=False, regex=True)
+            filter_mask |= contains_digit(iso3_str)
             # Is all lowercase
-            filter_mask = filter_mask | (iso3_str.str.strip() == iso3_str.str.strip().str.lower())
+            filter_mask |= is_all_lowercase(iso3_stripped)
             # Has length of 2
-            filter_mask = filter_mask | (iso3_str.str.strip().str.len() == 2)
+            filter_mask |= (iso3_stripped.str.len() == 2).to_numpy()
         
         df = df[~filter_mask]
         hardlock_removed = initial_count_46 - len(df)
@@ -962,70 +1691,61 @@ def final_cleanup(df):
     
     # 3. Metric Name Scrub
     if 'Metric' in df.columns:
-        # Replace encoding artifacts (multiple variants)
-        df['Metric'] = df['Metric'].str.replace('Â€"', '-', regex=False)
-        df['Metric'] = df['Metric'].str.replace('€"', '-', regex=False)
-        df['Metric'] = df['Metric'].str.replace('â€"', '-', regex=False)
-        df['Metric'] = df['Metric'].str.replace('聙聯', '-', regex=False)
-        # Remove trailing underscores
-        df['Metric'] = df['Metric'].str.rstrip('_')
-        # Replace double underscores (recursive cleanup)
-        while df['Metric'].str.contains('__', na=False, regex=False).any():
-            df['Metric'] = df['Metric'].str.replace('__', '_', regex=False)
-        df['Metric'] = df['Metric'].str.strip()
+        def scrub_metric_names(metrics):
+            # Replace encoding artifacts (multiple variants)
+            metrics = metrics.str.replace(MOJIBAKE_DASH_RE, '-', regex=True)
+            # Remove trailing underscores
+            metrics = metrics.str.rstrip('_')
+            # Collapse runs of underscores in one pass
+            metrics = metrics.str.replace(UNDERSCORE_RUN_RE, '_', regex=True)
+            metrics = metrics.str.strip()
+            return metrics
+        
+        df['Metric'] = map_unique_values(df['Metric'], scrub_metric_names)
     
     # STEP 35: Final Surgical Normalization of Metric Names
     print("\n[Step 35] Final Surgical Normalization of Metric Names...")
     if 'Metric' in df.columns:
-        # Fix any "Graduatess" patterns first
-        df['Metric'] = df['Metric'].astype(str).str.replace("Graduatess", "Graduates", regex=False)
-        
-        # Replace curly apostrophes with straight apostrophes
-        df['Metric'] = df['Metric'].str.replace('\u2018', "'", regex=False)
-        df['Metric'] = df['Metric'].str.replace('\u2019', "'", regex=False)
-        df['Metric'] = df['Metric'].str.replace('\u201A', "'", regex=False)
-        df['Metric'] = df['Metric'].str.replace('\u201B', "'", regex=False)
-        
-        # Replace "'S" with "'s"
-        df['Metric'] = df['Metric'].str.replace("'S", "'s", regex=False)
-        
-        # Collapse messy degree suffixes
-        df['Metric'] = df['Metric'].str.replace("Bachelor's Graduates's Graduates", "Bachelor's Graduates", regex=False)
-        df['Metric'] = df['Metric'].str.replace("Master's Graduates's Graduates", "Master's Graduates", regex=False)
-        df['Metric'] = df['Metric'].str.replace("PhD Graduates Graduate", "PhD Graduates", regex=False)
-        df['Metric'] = df['Metric'].str.replace("PhD Graduates Students", "PhD Graduates", regex=False)
-        df['Metric'] = df['Metric'].str.replace("Graduates's Graduates", "Graduates", regex=False)
-        df['Metric'] = df['Metric'].str.replace("Graduates's", "Graduates", regex=False)
-        df['Metric'] = df['Metric'].str.replace("Graduates Graduates", "Graduates", regex=False)
-        df['Metric'] = df['Metric'].str.replace("Bachelor's Graduate", "Bachelor's Graduates", regex=False)
-        df['Metric'] = df['Metric'].str.replace("Master's Graduate", "Master's Graduates", regex=False)
-        
-        # Grammar check for Informatics metrics
-        informatics_mask = df['Metric'].str.contains("Informatics, CS, CE, and IT", na=False, regex=False)
-        graduate_singular_mask = df['Metric'].str.contains(r'\bGraduate\b(?!s)', na=False, regex=True)
-        grammar_mask = informatics_mask & graduate_singular_mask
-        if grammar_mask.any():
-            df.loc[grammar_mask, 'Metric'] = df.loc[grammar_mask, 'Metric'].str.replace(r'\bGraduate\b(?!s)', 'Graduates', regex=True)
-        
-        # Final encoding safety
-        df['Metric'] = df['Metric'].str.replace("鈥橲", "'s", regex=False)
-        df['Metric'] = df['Metric'].str.replace('Ð', '-', regex=False)
-        
-        # Standardize connectors & acronyms
-        df['Metric'] = df['Metric'].str.replace(r'\bLinkedin\b', 'LinkedIn', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bCs\b', 'CS', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bCe\b', 'CE', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bIt\b', 'IT', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bIct\b', 'ICT', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bAi\b', 'AI', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bPhd\b', 'PhD', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bphd\b', 'PhD', regex=True)
-        
-        # Final cleanup
-        df['Metric'] = df['Metric'].str.replace("Graduatess", "Graduates", regex=False)
-        df['Metric'] = df['Metric'].str.replace("Graduates Graduates", "Graduates", regex=False)
-        df['Metric'] = df['Metric'].str.strip()
-        df.drop_duplicates(inplace=True)
+        def normalize_metric_names(metrics):
+            # Fix any "Graduatess" patterns first
+            metrics = metrics.astype(str).str.replace("Graduatess", "Graduates", regex=False)
+            
+            # Replace curly apostrophes with straight apostrophes
+            metrics = metrics.str.translate(CURLY_APOSTROPHE_TABLE)
+            
+            # Replace "'S" with "'s"
+            metrics = metrics.str.replace("'S", "'s", regex=False)
+            
+            # Collapse messy degree suffixes
+            metrics = metrics.str.replace("Bachelor's Graduates's Graduates", "Bachelor's Graduates", regex=False)
+            metrics = metrics.str.replace("Master's Graduates's Graduates", "Master's Graduates", regex=False)
+            metrics = metrics.str.replace("PhD Graduates Graduate", "PhD Graduates", regex=False)
+            metrics = metrics.str.replace("PhD Graduates Students", "PhD Graduates", regex=False)
+            metrics = metrics.str.replace("Graduates's Graduates", "Graduates", regex=False)
+            metrics = metrics.str.replace("Graduates's", "Graduates", regex=False)
+            metrics = metrics.str.replace("Graduates Graduates", "Graduates", regex=False)
+            metrics = metrics.str.replace("Bachelor's Graduate", "Bachelor's Graduates", regex=False)
+            metrics = metrics.str.replace("Master's Graduate", "Master's Graduates", regex=False)
+            
+            # Grammar check for Informatics metrics
+            # (the substitution is a no-op on names without a singular "Graduate")
+            informatics_mask = metrics.str.contains("Informatics, CS, CE, and IT", na=False, regex=False)
+            if informatics_mask.any():
+                metrics.loc[informatics_mask] = metrics.loc[informatics_mask].str.replace(SINGULAR_GRADUATE_RE, 'Graduates', regex=True)
+            
+            # Final encoding safety
+            metrics = metrics.str.replace("鈥橲", "'s", regex=False)
+            metrics = metrics.str.replace('Ð', '-', regex=False)
+            
+            # Standardize connectors & acronyms
+            metrics = metrics.str.replace(CONNECTOR_ACRONYMS_RE, lambda m: CONNECTOR_ACRONYMS[m.group(0)], regex=True)
+            
+            # Final cleanup: "Graduatess" and repeated "Graduates Graduates"
+            metrics = metrics.str.replace(REPEATED_GRADUATES_RE, 'Graduates', regex=True)
+            metrics = metrics.str.strip()
+            return metrics
+        
+        df['Metric'] = map_unique_values(df['Metric'], normalize_metric_names)
         
         final_metric_count_35 = df['Metric'].nunique()
         print(f"  Final unique metric count: {final_metric_count_35}")
@@ -1033,88 +1753,60 @@ def final_cleanup(df):
     # STEP 36: Purge Sub-National (U.S. State) Data Artifacts
     print("\n[Step 36] Purge Sub-National (U.S. State) Data Artifacts...")
     if 'Metric' in df.columns:
-        state_level_metrics = [
-            '% Of Total In State', 'Number Of AP CS Exams Taken',
-            'Number Of AP CS Exams Taken In 2022',
-            'Number Of AP CS Exams Taken Per 100,000 Inhabitants',
-            'Number Of AP CS Exams Taken Per 100,000 Inhabitants In 2022',
-            'Public High Schools Teaching CS (% Of Total State)',
-            'Requires All High Schools Offer A CS Course',
-            "Share Of Us States' Job Postings In AI 2022",
-            'Number Of State-Level AI-Related Bills Pased Into Law',
-            'Us Patient Cohorts'
-        ]
-        
-        mislabeled_us_state_metrics = [
-            'Percentage Of Us AI Job Postings',
-            'Percentage Of Us States Job Postings In AI In 2023',
-            "Percentage Of Us States' Job Postings In AI"
-        ]
-        
-        state_mask = df['Metric'].isin(state_level_metrics + mislabeled_us_state_metrics)
+        state_mask = df['Metric'].isin(STATE_LEVEL_METRICS)
         state_removed = state_mask.sum()
         df = df[~state_mask]
-        
-        df.drop_duplicates(inplace=True)
         print(f"  Removed {state_removed} rows with state-level metrics.")
     
     # STEP 39: Robust Mojibake & 3-5 Year Repair
     print("\n[Step 39] Robust Mojibake & 3-5 Year Repair...")
     if 'Metric' in df.columns:
-        # Fix 3-5 Year collapses
-        df['Metric'] = df['Metric'].str.replace(r'3\u20135 Years', '3-5 Years', regex=False)
-        df['Metric'] = df['Metric'].str.replace(r'(\b3)([^\s\-])(5\s+Years\b)', r'\1-\3', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'(\bPast\s+)35(\s+Years\b)', r'\g<1>3-5\g<2>', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'(\bNext\s+)35(\s+Years\b)', r'\g<1>3-5\g<2>', regex=True)
-        df['Metric'] = df['Metric'].str.replace('35 Years', '3-5 Years', regex=False)
-        
-        # Surgical Mojibake Removal
-        df['Metric'] = df['Metric'].str.replace('聙聯', '-', regex=False)
-        df['Metric'] = df['Metric'].str.replace('€"', '-', regex=False)
-        df['Metric'] = df['Metric'].str.replace('â€"', '-', regex=False)
-        
-        # Global Dash Unification
-        df['Metric'] = df['Metric'].str.replace('\u2013', '-', regex=False)
-        df['Metric'] = df['Metric'].str.replace('\u2014', '-', regex=False)
-        
-        # Final pass: Fix any remaining "35 Years"
-        final_35_count = df['Metric'].str.contains('35 Years', na=False, regex=False).sum()
-        if final_35_count > 0:
-            df['Metric'] = df['Metric'].str.replace('35 Years', '3-5 Years', regex=False)
-        
-        df['Metric'] = df['Metric'].str.strip()
-        df.drop_duplicates(inplace=True)
+        def repair_year_ranges_and_mojibake(metrics):
+            # Fix 3-5 Year collapses
+            metrics = metrics.str.replace(r'3\u20135 Years', '3-5 Years', regex=False)
+            metrics = metrics.str.replace(COLLAPSED_3_5_RE, r'\1-\3', regex=True)
+            metrics = metrics.str.replace(PAST_35_YEARS_RE, r'\g<1>3-5\g<2>', regex=True)
+            metrics = metrics.str.replace(NEXT_35_YEARS_RE, r'\g<1>3-5\g<2>', regex=True)
+            metrics = metrics.str.replace('35 Years', '3-5 Years', regex=False)
+            
+            # Surgical Mojibake Removal
+            metrics = metrics.str.replace(MOJIBAKE_DASH_RE, '-', regex=True)
+            
+            # Global Dash Unification
+            metrics = metrics.str.translate(LONG_DASH_TABLE)
+            
+            # Final pass: Fix any remaining "35 Years"
+            final_35_count = metrics.str.contains('35 Years', na=False, regex=False).sum()
+            if final_35_count > 0:
+                metrics = metrics.str.replace('35 Years', '3-5 Years', regex=False)
+            
+            metrics = metrics.str.strip()
+            return metrics
+        
+        df['Metric'] = map_unique_values(df['Metric'], repair_year_ranges_and_mojibake)
         print(f"  FINAL ENCODING PASS COMPLETE: All mojibake and 35-year artifacts resolved.")
     
     # STEP 40: Purge Remaining Sub-National Diversity Artifacts
     print("\n[Step 40] Purge Remaining Sub-National Diversity Artifacts...")
     if 'Metric' in df.columns and 'Source_File' in df.columns:
-        diversity_metrics_to_remove = ['AP CS Exams Taken By Female Students (% Of Total)']
-        problematic_sources = [
-            '9. Diversity-2023_Data_fig_7.3.2.csv',
-            '9. Diversity-2024_Data_fig_8.3.2.csv'
-        ]
-        
-        metric_mask = df['Metric'].isin(diversity_metrics_to_remove)
-        source_mask = df['Source_File'].isin(problematic_sources) if 'Source_File' in df.columns else pd.Series([False] * len(df), index=df.index)
-        total_mask = metric_mask | source_mask
+        metric_mask = df['Metric'].isin(SUBNATIONAL_DIVERSITY_METRICS)
+        source_mask = df['Source_File'].isin(SUBNATIONAL_DIVERSITY_SOURCES)
+        total_mask = (metric_mask | source_mask).to_numpy()
         
         total_rows_removed = total_mask.sum()
-        df = df[~total_mask]
-        df.drop_duplicates(inplace=True)
+        df = df.take(np.flatnonzero(~total_mask))
         print(f"  Successfully purged {total_rows_removed} sub-national diversity rows.")
     
     # STEP 41: Clean Focus Area Investment Metrics (Global Fix - Step 47.2)
     print("\n[Step 41] Clean Focus Area Investment Metrics (Global Fix)...")
     if 'Metric' in df.columns:
         # STEP 47.2: Restore Focus Area Metrics - Global fix for 12 sectors
-        focus_sectors = ['Agritech', 'Av', 'Drones', 'Ed Tech', 'Entertainment', 'Fintech', 
-                        'Geospatial', 'Hr Tech', 'Insurtech', 'Legal Tech', 'Retail', 'Semiconductor']
-        
-        focus_mask = df['Metric'].isin(focus_sectors)
+        focus_mask = df['Metric'].isin(FOCUS_SECTORS)
         if focus_mask.any():
-            df.loc[focus_mask, 'Metric'] = df.loc[focus_mask, 'Metric'].apply(
-                lambda x: f"Private Investment In AI Focus Area: {x} (In Billions Of US Dollars)"
+            df.loc[focus_mask, 'Metric'] = (
+                'Private Investment In AI Focus Area: '
+                + df.loc[focus_mask, 'Metric']
+                + ' (In Billions Of US Dollars)'
             )
             print(f"  Successfully renamed {focus_mask.sum()} focus area investment metrics (global fix).")
         
@@ -1122,44 +1814,37 @@ def final_cleanup(df):
         if 'Source_File' in df.columns and 'Country' in df.columns:
             eu_uk_mask = (df['Country'].astype(str).str.strip().str.upper() == 'EU/UK')
             if eu_uk_mask.any():
-                df = df[~eu_uk_mask].copy()
+                df = df.take(np.flatnonzero(~eu_uk_mask.to_numpy()))
                 print(f"  Removed {eu_uk_mask.sum()} EU/UK aggregate rows.")
     
     # STEP 42: Final Acronym Capitalization
     print("\n[Step 42] Final Acronym Capitalization...")
     if 'Metric' in df.columns:
-        # Fix investment acronyms
-        df['Metric'] = df['Metric'].str.replace(
-            'Private Investment In AI Focus Area: Av (In Billions Of US Dollars)',
-            'Private Investment In AI Focus Area: AV (In Billions Of US Dollars)',
-            regex=False
-        )
-        df['Metric'] = df['Metric'].str.replace(
-            'Private Investment In AI Focus Area: Nlp,',
-            'Private Investment In AI Focus Area: NLP,',
-            regex=False
-        )
-        df['Metric'] = df['Metric'].str.replace(
-            'Private Investment In AI Focus Area: Hr Tech',
-            'Private Investment In AI Focus Area: HR Tech',
-            regex=False
-        )
+        def capitalize_acronyms(metrics):
+            # Fix investment acronyms
+            metrics = metrics.str.replace(
+                'Private Investment In AI Focus Area: Av (In Billions Of US Dollars)',
+                'Private Investment In AI Focus Area: AV (In Billions Of US Dollars)',
+                regex=False
+            )
+            metrics = metrics.str.replace(
+                'Private Investment In AI Focus Area: Nlp,',
+                'Private Investment In AI Focus Area: NLP,',
+                regex=False
+            )
+            metrics = metrics.str.replace(
+                'Private Investment In AI Focus Area: Hr Tech',
+                'Private Investment In AI Focus Area: HR Tech',
+                regex=False
+            )
+            
+            # Global acronym audit
+            metrics = metrics.str.replace(FINAL_ACRONYMS_RE, lambda m: FINAL_ACRONYMS[m.group(0)], regex=True)
+            
+            metrics = metrics.str.strip()
+            return metrics
         
-        # Global acronym audit
-        df['Metric'] = df['Metric'].str.replace(r'\bNlp\b', 'NLP', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bAv\b', 'AV', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bVc\b', 'VC', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bHr\b', 'HR', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bIct\b', 'ICT', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bIt\b', 'IT', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bCs\b', 'CS', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bCe\b', 'CE', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bPhd\b', 'PhD', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bar/vr\b', 'AR/VR', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bAr/Vr\b', 'AR/VR', regex=True)
-        
-        df['Metric'] = df['Metric'].str.strip()
-        df.drop_duplicates(inplace=True)
+        df['Metric'] = map_unique_values(df['Metric'], capitalize_acronyms)
         print(f"  Applied global acronym capitalization.")
     
     # STEP 43: Rename LinkedIn Gender Diversity Metrics
@@ -1174,38 +1859,34 @@ def final_cleanup(df):
                 'Male': 'Relative AI Skill Penetration Rate (Male)'
             }
             
-            for old_metric, new_metric in metric_mapping.items():
-                metric_mask = source_mask & (df['Metric'] == old_metric)
-                if metric_mask.any():
-                    df.loc[metric_mask, 'Metric'] = new_metric
-                    print(f"  Renamed '{old_metric}' -> '{new_metric}' ({metric_mask.sum()} rows).")
+            # Map both names in one pass over this source's rows
+            renamed = df['Metric'].where(source_mask).map(metric_mapping)
+            rename_mask = renamed.notna()
+            rename_counts = df.loc[rename_mask, 'Metric'].value_counts()
+            df.loc[rename_mask, 'Metric'] = renamed[rename_mask]
             
-            df.drop_duplicates(inplace=True)
+            for old_metric, new_metric in metric_mapping.items():
+                if rename_counts.get(old_metric, 0):
+                    print(f"  Renamed '{old_metric}' -> '{new_metric}' ({rename_counts[old_metric]} rows).")
     
     # STEP 44: Restore and Rename arXiv Category Metrics
     print("\n[Step 44] Restore and Rename arXiv Category Metrics...")
     if 'Metric' in df.columns and 'Source_File' in df.columns:
         source_file_44 = '1. Research and Development-2021_Publications_arXiv_arXiv - 2021 AI Index Report.xlsx'
         
-        old_arxiv_mask = df['Source_File'] == source_file_44
+        old_arxiv_mask = (df['Source_File'] == source_file_44).to_numpy()
         old_arxiv_count = old_arxiv_mask.sum()
         if old_arxiv_count > 0:
-            df = df[~old_arxiv_mask].copy()
+            df = df.take(np.flatnonzero(~old_arxiv_mask))
             print(f"  Removed {old_arxiv_count} old arXiv rows.")
         
-        file_path = None
-        potential_paths = [
+        file_path = find_source_file([
             BASE_DIR / source_file_44,
             BASE_DIR / "stanford_ai_index" / "public access raw data" / "2021_data" / source_file_44,
             BASE_DIR / "stanford_ai_index" / "2021_data" / source_file_44,
-        ]
+        ])
         
-        for potential_path in potential_paths:
-            if potential_path.exists():
-                file_path = potential_path
-                break
-        
-        if file_path and file_path.exists():
+        if file_path:
             try:
                 file_df = pd.read_excel(file_path, sheet_name='arXiv', engine='openpyxl')
                 
@@ -1225,60 +1906,53 @@ def final_cleanup(df):
                 country_col = 'country_name' if 'country_name' in file_df.columns else None
                 year_col = 'Year' if 'Year' in file_df.columns else None
                 
-                if iso3_col and country_col and year_col:
-                    new_rows = []
-                    for category_col in category_columns:
-                        if category_col in file_df.columns:
-                            metric_name = category_mappings[category_col]
-                            category_df = file_df[[iso3_col, country_col, year_col, category_col]].copy()
-                            category_df = category_df.rename(columns={
-                                iso3_col: 'ISO3',
-                                country_col: 'Country',
-                                year_col: 'Year',
-                                category_col: 'Value'
-                            })
-                            category_df['Metric'] = metric_name
-                            category_df = category_df.dropna(subset=['ISO3', 'Country', 'Year', 'Value'])
-                            category_df['Value'] = pd.to_numeric(category_df['Value'], errors='coerce')
-                            category_df = category_df.dropna(subset=['Value'])
-                            
-                            if len(category_df) > 0:
-                                category_df['Source_File'] = source_file_44
-                                category_df['Source_Category'] = 'Research and Development'
-                                category_df['Source_Year'] = 2021
-                                category_df['Source_Type'] = 'Excel'
-                                for col in ['Source', 'Dataset', 'GIRAI_region', 'UN_region', 'UN_subregion']:
-                                    if col not in category_df.columns:
-                                        category_df[col] = None
-                                new_rows.append(category_df)
+                present_categories = [col for col in category_columns if col in file_df.columns]
+                
+                if iso3_col and country_col and year_col and present_categories:
+                    # Reshape every category column into long rows in one melt
+                    # (rows stay grouped by category, in category_columns order)
+                    new_df = file_df.melt(
+                        id_vars=[iso3_col, country_col, year_col],
+                        value_vars=present_categories,
+                        var_name='Category',
+                        value_name='Value'
+                    ).rename(columns={iso3_col: 'ISO3', country_col: 'Country', year_col: 'Year'})
+                    new_df['Metric'] = new_df.pop('Category').map(category_mappings)
+                    new_df = new_df.dropna(subset=['ISO3', 'Country', 'Year', 'Value'])
+                    new_df['Value'] = pd.to_numeric(new_df['Value'], errors='coerce')
+                    new_df = new_df.dropna(subset=['Value']).reset_index(drop=True)
                     
-                    if new_rows:
-                        new_df = pd.concat(new_rows, ignore_index=True)
+                    if len(new_df) > 0:
+                        new_df['Source_File'] = source_file_44
+                        new_df['Source_Category'] = 'Research and Development'
+                        new_df['Source_Year'] = 2021
+                        new_df['Source_Type'] = 'Excel'
+                        for col in ['Source', 'Dataset', 'GIRAI_region', 'UN_region', 'UN_subregion']:
+                            new_df[col] = None
+                        
                         df = pd.concat([df, new_df], ignore_index=True)
-                        print(f"  Successfully restored {len(new_df)} arXiv publication rows across {len(new_rows)} descriptive categories.")
+                        print(f"  Successfully restored {len(new_df)} arXiv publication rows across {new_df['Metric'].nunique()} descriptive categories.")
             except Exception as e:
                 print(f"  ERROR: Failed to process '{source_file_44}': {str(e)}")
-        
-        df.drop_duplicates(inplace=True)
+    
+    # Restored rows come back as object columns; re-cast for Steps 45-56
+    df = use_arrow_strings(df)
     
     # Global Standardization: AI Capitalization & Degree Names
     print("\n[Global Standardization] Final AI capitalization and degree name standardization...")
     if 'Metric' in df.columns:
-        # Ensure 'AI' is always uppercase
-        df['Metric'] = df['Metric'].str.replace(r'\bAi\b', 'AI', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bAi:', 'AI:', regex=True)
-        
-        # Standardize degree names
-        df['Metric'] = df['Metric'].str.replace(r'\bPhd\b', 'PhD', regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bMaster\'s\b', "Master's", regex=True)
-        df['Metric'] = df['Metric'].str.replace(r'\bBachelor\'s\b', "Bachelor's", regex=True)
-        
-        df['Metric'] = df['Metric'].str.strip()
-        df.drop_duplicates(inplace=True)
+        # Ensure 'AI' is always uppercase and standardize degree names
+        df['Metric'] = map_unique_values(
+            df['Metric'],
+            lambda metrics: metrics.str.replace(GLOBAL_ACRONYMS_RE, lambda m: GLOBAL_ACRONYMS[m.group(0)], regex=True).str.strip()
+        )
     
     # STEP 45 (ZERO-LOOP): Vectorized Metadata Backfill (At Absolute End)
     print("\n[Step 45] Backfilling missing GIRAI/OECD metadata...")
     
+    # Rows whose Source or Dataset mentions OECD; reused by Step 48
+    oecd_mentions = None
+    
     if 'Metric' in df.columns and 'Source_File' in df.columns:
         # 1. Target GIRAI Metrics
         girai_metrics = [
@@ -1293,28 +1967,21 @@ def final_cleanup(df):
         girai_mask = df['Metric'].isin(girai_metrics) & df['Source_File'].isna()
         
         if girai_mask.any():
-            df.loc[girai_mask, 'Source'] = 'Global Index on Responsible AI'
-            df.loc[girai_mask, 'Source_File'] = 'girai_ai_index_data_long.csv'
-            df.loc[girai_mask, 'Source_Category'] = 'Responsible AI'
-            df.loc[girai_mask, 'Source_Type'] = 'csv'
-            df.loc[girai_mask, 'Source_Year'] = 2024
-            df.loc[girai_mask, 'Dataset'] = 'GIRAI 2024 Index'
+            backfill_columns(df, girai_mask, GIRAI_METADATA)
             print(f"  ✓ Backfilled {girai_mask.sum()} GIRAI rows.")
 
         # 2. Target OECD Rows (STEP 47.4: Aggressive Metadata Backfill)
-        oecd_mask = pd.Series([False] * len(df), index=df.index)
+        oecd_mentions = np.zeros(len(df), dtype=bool)
         if 'Source' in df.columns:
-            oecd_mask = oecd_mask | df['Source'].fillna('').str.contains('OECD', case=False)
+            oecd_mentions |= mentions_oecd(df['Source'])
         if 'Dataset' in df.columns:
-            oecd_mask = oecd_mask | df['Dataset'].fillna('').str.contains('OECD', case=False)
+            oecd_mentions |= mentions_oecd(df['Dataset'])
         
         # Only backfill rows where Source_File is missing
-        oecd_mask = oecd_mask & df['Source_File'].isna()
+        oecd_mask = oecd_mentions & df['Source_File'].isna().to_numpy()
         
         if oecd_mask.any():
-            df.loc[oecd_mask, ['Source_File', 'Source_Category', 'Source_Type', 'Source_Year']] = [
-                'oecd_ai_index_data_long.csv', 'Economy', 'csv', 2024
-            ]
+            backfill_columns(df, oecd_mask, OECD_METADATA)
             print(f"  ✓ Backfilled {oecd_mask.sum()} OECD rows (aggressive backfill).")
 
         print(f"  Final null Source_File count: {df['Source_File'].isna().sum()}")
@@ -1324,14 +1991,13 @@ def final_cleanup(df):
     
     # 1. Final Metadata Enforcement (OECD)
     if 'Dataset' in df.columns and 'Source' in df.columns and 'Source_File' in df.columns:
-        oecd_mask = (df['Dataset'].fillna('').str.contains('OECD', case=False)) | (df['Source'].fillna('').str.contains('OECD', case=False))
+        # Step 45's OECD backfill leaves Source, Dataset and the rows unchanged
+        oecd_mask = oecd_mentions if oecd_mentions is not None else (
+            mentions_oecd(df['Dataset']) | mentions_oecd(df['Source'])
+        )
         
         if oecd_mask.any():
-            df.loc[oecd_mask, 'Source_File'] = 'oecd_ai_index_data_long.csv'
-            df.loc[oecd_mask, 'Source_Category'] = 'Economy'
-            df.loc[oecd_mask, 'Source_Type'] = 'csv'
-            df.loc[oecd_mask, 'Source_Year'] = 2024
-            df.loc[oecd_mask, 'Source'] = 'OECD.ai'
+            backfill_columns(df, oecd_mask, {**OECD_METADATA, 'Source': 'OECD.ai'})
             print(f"  ✓ Enforced metadata for {oecd_mask.sum()} OECD rows.")
     
     # 2. Absolute Metric Scrub (Descriptive Only)
@@ -1339,8 +2005,10 @@ def final_cleanup(df):
         initial_metric_count = len(df)
         
         # Rename raw column names to descriptive metrics
-        df['Metric'] = df['Metric'].str.replace('^FWCI$', 'Field Weighted Citation Impact', regex=True)
-        df['Metric'] = df['Metric'].str.replace('^OBS_VALUE$', 'OECD AI Indicator Value', regex=True)
+        df['Metric'] = map_unique_values(
+            df['Metric'],
+            lambda metrics: metrics.str.replace(RAW_METRIC_NAMES_RE, lambda m: RAW_METRIC_NAMES[m.group(0)], regex=True)
+        )
         
         # Fix remaining Focus Area Acronyms
         focus_rename_map = {
@@ -1348,14 +2016,13 @@ def final_cleanup(df):
             'AV': 'Private Investment In AI Focus Area: AV (In Billions Of US Dollars)',
             'HR Tech': 'Private Investment In AI Focus Area: HR Tech (In Billions Of US Dollars)'
         }
-        for old_name, new_name in focus_rename_map.items():
-            df.loc[df['Metric'] == old_name, 'Metric'] = new_name
+        df['Metric'] = map_unique_values(df['Metric'], lambda metrics: metrics.replace(focus_rename_map))
         
         # Drop rows with raw column names as metrics
         bad_metrics = ['Question', 'Label', 'Concern', 'Group', 'Event ID', 'Gender']
         bad_metric_mask = df['Metric'].isin(bad_metrics)
         if bad_metric_mask.any():
-            df = df[~bad_metric_mask].copy()
+            df = df.take(np.flatnonzero(~bad_metric_mask.to_numpy()))
             print(f"  ✓ Dropped {bad_metric_mask.sum()} rows with raw column names as metrics.")
         
         metric_scrub_removed = initial_metric_count - len(df)
@@ -1366,10 +2033,9 @@ def final_cleanup(df):
     if 'ISO3' in df.columns and 'Country' in df.columns:
         initial_geo_count = len(df)
         
-        # Force only valid ISO3 codes (3 characters, and not 'nan')
-        iso3_str = df['ISO3'].astype(str).str.strip()
-        valid_iso3_mask = (iso3_str.str.len() == 3) & (iso3_str != 'nan') & (iso3_str != 'NaN')
-        df = df[valid_iso3_mask].copy()
+        # Force only valid ISO3 codes (3 characters, and not 'nan'); ISO3 is
+        # not changed again before Step 50, so this one filter covers both steps
+        df = df.take(np.flatnonzero(is_valid_iso3(df['ISO3'])))
         
         # Create mapping from ISO3 to full country names
         iso3_country_map = df[df['ISO3'].notna()].groupby('ISO3')['Country'].first().to_dict()
@@ -1382,9 +2048,14 @@ def final_cleanup(df):
             print(f"  ✓ Geography collapse complete: {geo_collapse_removed} rows removed (invalid ISO3 codes).")
     
     # 4. Final Deduplication
+    # Steps 35-48 only rewrite or filter rows one at a time, so this also drops
+    # any full-row duplicates they created (keeping the same first row). Those
+    # steps no longer deduplicate as they go, so the row counts they print
+    # (state-level and sub-national purges, the Step 41/43 renames, the old
+    # arXiv rows, the Step 45-48 backfills) include rows dropped here.
     print("\n[Final Deduplication] Running final deduplication on core columns...")
     before_final_dedup = len(df)
-    df.drop_duplicates(subset=['Year', 'Country', 'Metric', 'Value'], inplace=True)
+    df = drop_duplicate_rows(df, subset=['Year', 'Country', 'Metric', 'Value'])
     final_dedup_removed = before_final_dedup - len(df)
     if final_dedup_removed > 0:
         print(f"  ✓ Removed {final_dedup_removed} duplicate rows (based on Year, Country, Metric, Value).")
@@ -1407,62 +2078,36 @@ def final_cleanup(df):
     
     # 1. Unify Metric Naming (Title Case & Spaces)
     if 'Metric' in df.columns:
-        # Replace underscores with spaces and convert to title case
-        df['Metric'] = df['Metric'].str.replace('_', ' ', regex=False).str.title()
-        
-        # Fix acronyms after title-casing
-        acronym_fixes = {
-            r'\bAi\b': 'AI',
-            r'\bVat\b': 'VAT',
-            r'\bNlp\b': 'NLP',
-            r'\bVc\b': 'VC',
-            r'\bAv\b': 'AV',
-            r'\bHr\b': 'HR',
-            r'\bIct\b': 'ICT',
-            r'\bIt\b': 'IT',
-            r'\bCs\b': 'CS',
-            r'\bCe\b': 'CE',
-            r'\bPhd\b': 'PhD',
-            r'\bUs\b': 'US',
-            r'\bUk\b': 'UK',
-            r'\bEu\b': 'EU',
-            r'\bAr\s*/\s*Vr\b': 'AR/VR'
-        }
-        for pattern, replacement in acronym_fixes.items():
-            df['Metric'] = df['Metric'].str.replace(pattern, replacement, regex=True)
+        def title_case_metric_names(metrics):
+            # Replace underscores with spaces and convert to title case
+            metrics = metrics.str.replace('_', ' ', regex=False).str.title()
+            
+            # Fix acronyms after title-casing
+            metrics = metrics.str.replace(TITLE_CASE_ACRONYMS_RE, lambda m: TITLE_CASE_ACRONYMS[m.group(0)], regex=True)
+            return metrics.str.replace(AR_VR_RE, 'AR/VR', regex=True)
+        
+        df['Metric'] = map_unique_values(df['Metric'], title_case_metric_names)
         
         print(f"  ✓ Unified metric naming (title case, acronyms fixed).")
     
     # 2. GIRAI Metadata Final Backfill
     if 'Metric' in df.columns and 'Source_File' in df.columns:
-        girai_anchors = [
-            'Government Actions', 'Index Score', 'Human Rights And AI',
-            'Responsible AI Governance', 'Non State Actors', 'Government Frameworks',
-            'Responsible AI Capacities'
-        ]
-        
-        girai_pattern = '|'.join(girai_anchors)
-        girai_mask = df['Metric'].str.contains(girai_pattern, case=False, na=False) & df['Source_File'].isna()
+        girai_mask = is_girai_metric(df['Metric']) & df['Source_File'].isna().to_numpy()
         
         if girai_mask.any():
-            df.loc[girai_mask, 'Source'] = 'Global Index on Responsible AI'
-            df.loc[girai_mask, 'Source_File'] = 'girai_ai_index_data_long.csv'
-            df.loc[girai_mask, 'Source_Category'] = 'Responsible AI'
-            df.loc[girai_mask, 'Source_Type'] = 'csv'
-            df.loc[girai_mask, 'Source_Year'] = 2024
-            df.loc[girai_mask, 'Dataset'] = 'GIRAI 2024 Index'
+            backfill_columns(df, girai_mask, GIRAI_METADATA)
             print(f"  ✓ Backfilled {girai_mask.sum()} GIRAI rows (case-insensitive match).")
     
     # 3. Final Filter
     if 'Metric' in df.columns:
         rank_mask = df['Metric'] == 'Rank'
         if rank_mask.any():
-            df = df[~rank_mask].copy()
+            df = df.take(np.flatnonzero(~rank_mask.to_numpy()))
             print(f"  ✓ Dropped {rank_mask.sum()} rows with 'Rank' metric.")
     
     # 4. Deduplication Check
     before_final_dedup = len(df)
-    df.drop_duplicates(inplace=True)
+    df = drop_duplicate_rows(df)
     final_dedup_removed = before_final_dedup - len(df)
     if final_dedup_removed > 0:
         print(f"  ✓ Removed {final_dedup_removed} duplicate rows in final pass.")
@@ -1481,22 +2126,10 @@ def final_cleanup(df):
     
     # 1. Selective GIRAI Metadata Backfill
     if 'Metric' in df.columns:
-        girai_anchors = [
-            'Government Actions', 'Index Score', 'Human Rights And AI',
-            'Responsible AI Governance', 'Non State Actors', 'Government Frameworks',
-            'Responsible AI Capacities'
-        ]
-        
-        girai_pattern = '|'.join(girai_anchors)
-        girai_mask = df['Metric'].str.contains(girai_pattern, case=False, na=False)
+        girai_mask = is_girai_metric(df['Metric'])
         
         if girai_mask.any():
-            df.loc[girai_mask, 'Source'] = 'Global Index on Responsible AI'
-            df.loc[girai_mask, 'Source_File'] = 'girai_ai_index_data_long.csv'
-            df.loc[girai_mask, 'Source_Category'] = 'Responsible AI'
-            df.loc[girai_mask, 'Source_Type'] = 'csv'
-            df.loc[girai_mask, 'Source_Year'] = 2024
-            df.loc[girai_mask, 'Dataset'] = 'GIRAI 2024 Index'
+            backfill_columns(df, girai_mask, GIRAI_METADATA)
             print(f"  ✓ Applied GIRAI metadata to {girai_mask.sum()} rows using metric anchors.")
     
     # 2. Purge All Nulls (The Quality Floor)
@@ -1517,39 +2150,33 @@ def final_cleanup(df):
         
         # Convert Year to int
         if 'Year' in df.columns:
-            df['Year'] = pd.to_numeric(df['Year'], errors='coerce')
+            year = pd.to_numeric(df['Year'], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
             # Drop any rows where Year conversion failed
-            df = df.dropna(subset=['Year']).copy()
-            df['Year'] = df['Year'].astype(int)
+            year_parsed = ~np.isnan(year)
+            df = df.take(np.flatnonzero(year_parsed))
+            df['Year'] = year[year_parsed].astype(int)
             print(f"  ✓ Converted Year column to integer type.")
     
     # 3. Geography Final Unified Lock
     if 'Country' in df.columns and 'ISO3' in df.columns:
-        before_geo_lock = len(df)
-        
         # Force Title Case
         df['Country'] = df['Country'].str.strip().str.title()
         
         # 1:1 ISO3 mapping (use most common country name for each ISO3)
-        mapping = df.groupby('ISO3')['Country'].apply(lambda x: x.value_counts().index[0]).to_dict()
+        # (ties go to the name seen first, as with value_counts)
+        name_counts = df.groupby(['ISO3', 'Country'], sort=False).size()
+        mapping = dict(name_counts.groupby(level='ISO3', sort=False).idxmax().tolist())
         df['Country'] = df['ISO3'].map(mapping).fillna(df['Country'])
-        
-        # Keep only 3-character ISO3 codes
-        iso3_str = df['ISO3'].astype(str).str.strip()
-        valid_iso3_mask = (iso3_str.str.len() == 3) & (iso3_str != 'nan') & (iso3_str != 'NaN')
-        df = df[valid_iso3_mask].copy()
-        
-        geo_lock_removed = before_geo_lock - len(df)
-        if geo_lock_removed > 0:
-            print(f"  ✓ Geography unified lock: {geo_lock_removed} rows removed (invalid ISO3 codes).")
+        # (only 3-character ISO3 codes remain since the Step 48 filter)
     
     # 4. Specific Metric Polish
     if 'Metric' in df.columns:
         # Standardize 'arXiv' (handle variations like 'Arxiv', 'ArXiv', etc.)
-        df['Metric'] = df['Metric'].str.replace(r'\bArxiv\b', 'arXiv', regex=True, case=False)
-        
-        # Fix 'Masters' typo -> 'Master\'s'
-        df['Metric'] = df['Metric'].str.replace(r'\bMasters\b', "Master's", regex=True)
+        # and fix the 'Masters' typo -> 'Master\'s'
+        df['Metric'] = map_unique_values(
+            df['Metric'],
+            lambda metrics: metrics.str.replace(ARXIV_RE, 'arXiv', regex=True).str.replace(MASTERS_RE, "Master's", regex=True)
+        )
         
         print(f"  ✓ Applied specific metric polish (arXiv standardization, Masters typo fix).")
     
@@ -1588,14 +2215,11 @@ def final_cleanup(df):
     
     # 2. Absolute Metric Polish
     if 'Metric' in df.columns:
-        # Enforce 'OECD' uppercase
-        df['Metric'] = df['Metric'].str.replace('Oecd', 'OECD', regex=False)
-        
-        # Fix the typo
-        df['Metric'] = df['Metric'].str.replace("Master's'S", "Master's", regex=False)
-        
-        # Strip all whitespace
-        df['Metric'] = df['Metric'].str.strip()
+        # Enforce 'OECD' uppercase, fix the Master's typo and strip all whitespace
+        df['Metric'] = map_unique_values(
+            df['Metric'],
+            lambda metrics: metrics.str.replace(STEP51_METRIC_FIXES_RE, lambda m: STEP51_METRIC_FIXES[m.group(0)], regex=True).str.strip()
+        )
         
         print(f"  ✓ Applied absolute metric polish (OECD casing, Master's typo fix, whitespace stripped).")
     
@@ -1650,7 +2274,9 @@ def final_cleanup(df):
                 except:
                     return code_str
             
-            df['Country'] = df['ISO3'].apply(get_official_name)
+            # Look up each distinct code once (missing codes stay missing)
+            official_names = {code: get_official_name(code) for code in df['ISO3'].dropna().unique()}
+            df['Country'] = df['ISO3'].map(official_names)
             print(f"  ✓ Restored country names using pycountry fallback.")
         
         # 2. Final Formatting Pass
@@ -1676,34 +2302,31 @@ def final_cleanup(df):
     
     # Fix GIRAI Metric Underscores
     if 'Metric' in df.columns:
-        girai_fixes = {
-            'Government_Actions': 'Government Actions',
-            'Government_Frameworks': 'Government Frameworks',
-            'Index_Score': 'Index Score',
-            'Human_Rights_And_AI': 'Human Rights And AI'
-        }
-        for old, new in girai_fixes.items():
-            df['Metric'] = df['Metric'].str.replace(old, new, regex=False)
+        df['Metric'] = map_unique_values(
+            df['Metric'],
+            lambda metrics: metrics.str.replace(GIRAI_UNDERSCORE_FIXES_RE, lambda m: GIRAI_UNDERSCORE_FIXES[m.group(0)], regex=True)
+        )
         print(f"  ✓ Fixed GIRAI metric underscores.")
     
     # STEP 55: Final Zero-Null Integrity & Year Lock
     print("\n[Step 55] Final Zero-Null Integrity & Year Lock...")
     
     # Absolute Final Safety Purge
-    before_final_purge = len(df)
-    df = df.dropna(subset=['Year', 'Value']).copy()
-    purge_removed = before_final_purge - len(df)
+    null_mask = (df['Year'].isna() | df['Value'].isna()).to_numpy()
+    purge_removed = null_mask.sum()
     if purge_removed > 0:
         print(f"  ✓ Purged {purge_removed} rows with null Year or Value.")
     
-    # Force Year to integer (final cast)
-    df['Year'] = pd.to_numeric(df['Year'], errors='coerce')
-    df = df.dropna(subset=['Year']).copy()  # Remove any rows where Year conversion failed
-    df['Year'] = df['Year'].astype(int)
+    # Force Year to integer (final cast), also dropping rows where Year conversion fails
+    year = pd.to_numeric(df['Year'], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    keep_mask = ~null_mask & ~np.isnan(year)
+    df = df.take(np.flatnonzero(keep_mask))
+    df['Year'] = year[keep_mask].astype(int)
     print(f"  ✓ Converted Year column to integer type (final cast).")
     
     # Verify Integrity
-    total_nulls = df.isna().sum().sum()
+    # Count a column at a time rather than materializing a full boolean frame
+    total_nulls = sum(int(df[col].isna().sum()) for col in df.columns)
     year_dtype = df['Year'].dtype
     final_row_count = len(df)
     
@@ -1714,60 +2337,68 @@ def final_cleanup(df):
     # STEP 56: The Surgical Purge & Protected Lock
     print("\n[Step 56] The Surgical Purge & Protected Lock...")
     
+    # Rows purged in this step are collected and dropped together at the end
+    step56_drop_mask = np.zeros(len(df), dtype=bool)
+    
     # 1. The Regex Nuclear Purge (Catches all variants including curly quotes)
     if 'Metric' in df.columns:
-        purge_patterns = [
-            r'% Of Respondents.*',  # Catches ALL generic respondent metrics
-            r'% Of Students',
-            r'% Of Total In State',
-            r'1Pp\. Change',
-            r'.*Of Total State\)',
-            r'.*US States.*Job Postings.*'
-        ]
-        combined_pattern = '|'.join(purge_patterns)
-        before_purge = len(df)
-        df = df[~df['Metric'].str.contains(combined_pattern, case=False, na=False, regex=True)].copy()
-        purge_removed = before_purge - len(df)
+        purge_mask = flag_unique_values(
+            df['Metric'], lambda metrics: metrics.str.contains(METRIC_PURGE_RE, na=False, regex=True)
+        )
+        step56_drop_mask |= purge_mask
+        purge_removed = purge_mask.sum()
         if purge_removed > 0:
             print(f"  ✓ Regex nuclear purge removed {purge_removed} rows with bad metrics (including quote variants).")
     
     # 2. Fix GIRAI Metrics (Force Space, No Underscores)
     if 'Metric' in df.columns:
-        df['Metric'] = df['Metric'].str.replace('Government_', 'Government ', regex=False)
-        df['Metric'] = df['Metric'].str.replace('Index_Score', 'Index Score', regex=False)
-        df['Metric'] = df['Metric'].str.replace('Human_Rights_And_AI', 'Human Rights And AI', regex=False)
+        df['Metric'] = map_unique_values(
+            df['Metric'],
+            lambda metrics: metrics.str.replace(GIRAI_FORCED_SPACES_RE, lambda m: GIRAI_FORCED_SPACES[m.group(0)], regex=True)
+        )
         print(f"  ✓ Fixed GIRAI metric underscores (forced spaces).")
     
     # 4. CS Schools Validation (Remove USA entries)
     if 'Metric' in df.columns and 'ISO3' in df.columns:
-        cs_schools_mask = (df['Metric'] == '% Public High Schools Teaching Foundational CS') & (df['ISO3'] == 'USA')
+        cs_schools_mask = ((df['Metric'] == '% Public High Schools Teaching Foundational CS') & (df['ISO3'] == 'USA')).to_numpy()
+        cs_schools_mask &= ~step56_drop_mask
         cs_schools_removed = cs_schools_mask.sum()
         if cs_schools_removed > 0:
-            df = df[~cs_schools_mask].copy()
+            step56_drop_mask |= cs_schools_mask
             print(f"  ✓ Removed {cs_schools_removed} USA entries for CS schools metric (sub-national protection).")
     
+    if step56_drop_mask.any():
+        df = df.take(np.flatnonzero(~step56_drop_mask))
+    
+    # Survey rows restored by Steps 37, 61 and 62, as (frame, success message)
+    # keyed by source file; appended (and reported) together after Step 62
+    restored_survey_frames = {}
+    
     # STEP 37: Restore Context to 2024 Survey Point Change Metrics (ABSOLUTE LAST - PROTECTED)
     print("\n[Step 37] Restore Context to 2024 Survey Point Change Metrics (Protected Final Restoration)...")
     if 'Source_File' in df.columns:
         contaminated_source = '8. Public Opinion-2024_Data_fig_9.1.4.csv'
         
-        source_mask = df['Source_File'] == contaminated_source
+        source_mask = (df['Source_File'] == contaminated_source).to_numpy()
         rows_to_remove = source_mask.sum()
         if rows_to_remove > 0:
-            df = df[~source_mask]
+            df = df.take(np.flatnonzero(~source_mask))
             print(f"  Removed {rows_to_remove} contaminated rows from '{contaminated_source}'.")
         
         file_path = BASE_DIR / "stanford_ai_index" / "public access raw data" / "2024_data" / contaminated_source
         
         if file_path.exists():
             try:
-                file_df = None
-                for encoding in ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252']:
-                    try:
-                        file_df = pd.read_csv(file_path, low_memory=False, encoding=encoding)
-                        break
-                    except (UnicodeDecodeError, UnicodeError):
-                        continue
+                # Only parse the columns the value/statement/country lookups below can pick
+                def is_step37_column(col):
+                    col_lower = col.lower()
+                    return (
+                        ('point change' in col_lower and '2022' in col_lower)
+                        or col in ('Statement', 'Question')
+                        or col in SURVEY_COUNTRY_COLUMNS
+                    )
+                
+                file_df = read_legacy_csv(file_path, usecols=is_step37_column)
                 
                 if file_df is not None and len(file_df) > 0:
                     value_col = None
@@ -1779,66 +2410,43 @@ def final_cleanup(df):
                     
                     if value_col:
                         file_df = file_df.rename(columns={value_col: 'Value'})
-                        if file_df['Value'].dtype == 'object':
-                            file_df['Value'] = file_df['Value'].astype(str).str.replace('%', '', regex=False).str.strip()
-                        file_df['Value'] = pd.to_numeric(file_df['Value'], errors='coerce')
+                        file_df['Value'] = parse_percent_values(file_df['Value'])
                         
                         statement_col = 'Statement' if 'Statement' in file_df.columns else ('Question' if 'Question' in file_df.columns else None)
                         
                         if statement_col:
-                            file_df[statement_col] = file_df[statement_col].astype(str).str.strip()
-                            file_df[statement_col] = file_df[statement_col].str.replace(r'\s+', ' ', regex=True)
-                            file_df[statement_col] = file_df[statement_col].str.title()
-                            file_df[statement_col] = file_df[statement_col].str.replace(r'\bAi\b', 'AI', regex=True)
-                            file_df[statement_col] = file_df[statement_col].str.replace('–', '-', regex=False)
-                            file_df[statement_col] = file_df[statement_col].str.replace('—', '-', regex=False)
-                            file_df[statement_col] = file_df[statement_col].str.replace('35 Years', '3-5 Years', regex=False)
-                            
                             # Create metric with full context (PROTECTED - NO title case or regex after this)
-                            file_df['Metric'] = '% Point Change 2022-23 of Statement: ' + file_df[statement_col].astype(str)
+                            file_df['Metric'] = normalize_survey_statements(file_df[statement_col], prefix='% Point Change 2022-23 of Statement: ')
                             
-                            country_col = None
-                            for col in ['Country', 'country', 'Country Name', 'country_name']:
-                                if col in file_df.columns:
-                                    country_col = col
-                                    break
+                            country_col = next((col for col in SURVEY_COUNTRY_COLUMNS if col in file_df.columns), None)
                             
                             if country_col:
-                                before_filter = len(file_df)
-                                file_df = file_df[file_df[country_col].astype(str).str.strip().str.lower() != 'global']
+                                countries = file_df[country_col].astype(str).str.strip()
+                                keep_mask = ~countries.str.fullmatch(SURVEY_GLOBAL_ROW_RE).to_numpy(dtype=bool)
+                                file_df = file_df[keep_mask]
                                 
                                 # Create new DataFrame with Year set to 2024 as integer
+                                # (scalars broadcast over the rows)
                                 new_df = pd.DataFrame({
-                                    'Year': [2024] * len(file_df),
-                                    'Country': file_df[country_col].astype(str).str.strip(),
+                                    'Year': 2024,
+                                    'Country': countries[keep_mask],
                                     'ISO3': pd.NA,
                                     'Metric': file_df['Metric'],
-                                    'Value': file_df['Value']
+                                    'Value': file_df['Value'],
+                                    'Source_File': contaminated_source,
+                                    'Source_Category': 'Public Opinion',
+                                    'Source_Type': 'csv',
+                                    'Source_Year': '2024',
+                                    'Source': 'Stanford AI Index',
+                                    'Dataset': 'Stanford AI Index - Public Opinion',
                                 })
                                 
-                                new_df['Source_File'] = contaminated_source
-                                new_df['Source_Category'] = 'Public Opinion'
-                                new_df['Source_Type'] = 'csv'
-                                new_df['Source_Year'] = '2024'
-                                new_df['Source'] = 'Stanford AI Index'
-                                new_df['Dataset'] = 'Stanford AI Index - Public Opinion'
-                                
-                                new_df = add_iso3_column(new_df, country_col='Country')
                                 new_df = new_df.dropna(subset=['Country', 'Metric', 'Value'])
                                 
-                                # Ensure Year remains integer type after filtering (should already be 2024)
-                                if len(new_df) > 0 and new_df['Year'].dtype != 'int64':
-                                    new_df['Year'] = new_df['Year'].astype(int)
-                                
-                                # PROTECTED: Apply minimal normalization only (NO title case - preserve the format)
-                                new_df['Metric'] = new_df['Metric'].astype(str).str.replace('\u2018', "'", regex=False)
-                                new_df['Metric'] = new_df['Metric'].str.replace('\u2019', "'", regex=False)
-                                new_df['Metric'] = new_df['Metric'].str.replace("'S", "'s", regex=False)
-                                new_df['Metric'] = new_df['Metric'].str.replace(r'\bAi\b', 'AI', regex=True)
-                                new_df['Metric'] = new_df['Metric'].str.strip()
-                                
-                                df = pd.concat([df, new_df], ignore_index=True)
-                                print(f"  Successfully restored {len(new_df)} rows for 2024 Survey Point Change metrics with full context (PROTECTED).")
+                                restored_survey_frames[contaminated_source] = (
+                                    new_df,
+                                    f"  Successfully restored {len(new_df)} rows for 2024 Survey Point Change metrics with full context (PROTECTED)."
+                                )
             except Exception as e:
                 print(f"  ERROR: Failed to process '{contaminated_source}': {str(e)}")
     
@@ -1854,14 +2462,7 @@ def final_cleanup(df):
             'Tot. Value Per 100K Inhabitants (K$)': 'Total Value Per 100,000 Inhabitants (In Thousands Of US Dollars)'
         }
         
-        restoration_count = 0
-        for old_name, new_name in metric_restorations.items():
-            mask = df['Metric'] == old_name
-            count = mask.sum()
-            if count > 0:
-                df.loc[mask, 'Metric'] = new_name
-                restoration_count += count
-                print(f"  ✓ Restored {count} rows: '{old_name}' -> '{new_name}'")
+        restoration_count = rename_metrics(df, metric_restorations)
         
         if restoration_count > 0:
             print(f"  ✓ Total {restoration_count} metric names surgically restored.")
@@ -1874,111 +2475,17 @@ def final_cleanup(df):
     # 1. Purge generic 2023 survey rows to prepare for enriched restoration
     if 'Source_File' in df.columns:
         contaminated_source_2023 = '8. Public Opinion-2023_Data_fig_8.1.3.csv'
-        source_mask_2023 = df['Source_File'] == contaminated_source_2023
+        source_mask_2023 = (df['Source_File'] == contaminated_source_2023).to_numpy()
         rows_to_remove_2023 = source_mask_2023.sum()
         if rows_to_remove_2023 > 0:
-            df = df[~source_mask_2023].copy()
+            df = df.take(np.flatnonzero(~source_mask_2023))
             print(f"  ✓ Removed {rows_to_remove_2023} generic 2023 survey rows from '{contaminated_source_2023}'.")
     
     # 2. Restore Enriched 2023 Survey Data
     if 'Source_File' in df.columns:
-        file_path_2023 = BASE_DIR / "stanford_ai_index" / "public access raw data" / "2023_data" / contaminated_source_2023
-        
-        if file_path_2023.exists():
-            try:
-                file_df_2023 = None
-                for encoding in ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252']:
-                    try:
-                        file_df_2023 = pd.read_csv(file_path_2023, low_memory=False, encoding=encoding)
-                        break
-                    except (UnicodeDecodeError, UnicodeError):
-                        continue
-                
-                if file_df_2023 is not None and len(file_df_2023) > 0:
-                    # Find the value column (likely '% Agree' or similar)
-                    value_col_2023 = None
-                    for col in file_df_2023.columns:
-                        col_lower = col.lower()
-                        if any(x in col_lower for x in ['agree', 'percentage', '%', 'value']):
-                            value_col_2023 = col
-                            break
-                    
-                    if value_col_2023:
-                        file_df_2023 = file_df_2023.rename(columns={value_col_2023: 'Value'})
-                        if file_df_2023['Value'].dtype == 'object':
-                            file_df_2023['Value'] = file_df_2023['Value'].astype(str).str.replace('%', '', regex=False).str.strip()
-                        file_df_2023['Value'] = pd.to_numeric(file_df_2023['Value'], errors='coerce')
-                        
-                        # Find statement/question column
-                        statement_col_2023 = None
-                        for col_name in ['Statement', 'Question', 'statement', 'question']:
-                            if col_name in file_df_2023.columns:
-                                statement_col_2023 = col_name
-                                break
-                        
-                        if statement_col_2023:
-                            file_df_2023[statement_col_2023] = file_df_2023[statement_col_2023].astype(str).str.strip()
-                            file_df_2023[statement_col_2023] = file_df_2023[statement_col_2023].str.replace(r'\s+', ' ', regex=True)
-                            file_df_2023[statement_col_2023] = file_df_2023[statement_col_2023].str.title()
-                            file_df_2023[statement_col_2023] = file_df_2023[statement_col_2023].str.replace(r'\bAi\b', 'AI', regex=True)
-                            file_df_2023[statement_col_2023] = file_df_2023[statement_col_2023].str.replace('–', '-', regex=False)
-                            file_df_2023[statement_col_2023] = file_df_2023[statement_col_2023].str.replace('—', '-', regex=False)
-                            file_df_2023[statement_col_2023] = file_df_2023[statement_col_2023].str.replace('35 Years', '3-5 Years', regex=False)
-                            
-                            # Create metric with full context: % Agreeing With Statement: [Question]
-                            file_df_2023['Metric'] = '% Agreeing With Statement: ' + file_df_2023[statement_col_2023].astype(str)
-                            
-                            # Find country column
-                            country_col_2023 = None
-                            for col in ['Country', 'country', 'Country Name', 'country_name']:
-                                if col in file_df_2023.columns:
-                                    country_col_2023 = col
-                                    break
-                            
-                            if country_col_2023:
-                                before_filter_2023 = len(file_df_2023)
-                                file_df_2023 = file_df_2023[file_df_2023[country_col_2023].astype(str).str.strip().str.lower() != 'global']
-                                
-                                # Create new DataFrame with Year set to 2023
-                                new_df_2023 = pd.DataFrame({
-                                    'Year': [2023] * len(file_df_2023),
-                                    'Country': file_df_2023[country_col_2023].astype(str).str.strip(),
-                                    'ISO3': pd.NA,
-                                    'Metric': file_df_2023['Metric'],
-                                    'Value': file_df_2023['Value']
-                                })
-                                
-                                new_df_2023['Source_File'] = contaminated_source_2023
-                                new_df_2023['Source_Category'] = 'Public Opinion'
-                                new_df_2023['Source_Type'] = 'csv'
-                                new_df_2023['Source_Year'] = '2023'
-                                new_df_2023['Source'] = 'Stanford AI Index'
-                                new_df_2023['Dataset'] = 'Stanford AI Index - Public Opinion'
-                                
-                                new_df_2023 = add_iso3_column(new_df_2023, country_col='Country')
-                                new_df_2023 = new_df_2023.dropna(subset=['Country', 'Metric', 'Value'])
-                                
-                                # Ensure Year remains integer type
-                                if len(new_df_2023) > 0 and new_df_2023['Year'].dtype != 'int64':
-                                    new_df_2023['Year'] = new_df_2023['Year'].astype(int)
-                                
-                                # Apply minimal normalization
-                                new_df_2023['Metric'] = new_df_2023['Metric'].astype(str).str.replace('\u2018', "'", regex=False)
-                                new_df_2023['Metric'] = new_df_2023['Metric'].str.replace('\u2019', "'", regex=False)
-                                new_df_2023['Metric'] = new_df_2023['Metric'].str.replace("'S", "'s", regex=False)
-                                new_df_2023['Metric'] = new_df_2023['Metric'].str.replace(r'\bAi\b', 'AI', regex=True)
-                                new_df_2023['Metric'] = new_df_2023['Metric'].str.strip()
-                                
-                                df = pd.concat([df, new_df_2023], ignore_index=True)
-                                print(f"  ✓ Successfully restored {len(new_df_2023)} rows for 2023 Survey 'Agreeing With Statement' metrics with full context.")
-                        else:
-                            print(f"  WARNING: Could not find Statement/Question column in '{contaminated_source_2023}'.")
-                    else:
-                        print(f"  WARNING: Could not find value column in '{contaminated_source_2023}'.")
-            except Exception as e:
-                print(f"  ERROR: Failed to process '{contaminated_source_2023}': {str(e)}")
-        else:
-            print(f"  WARNING: File not found: {file_path_2023}")
+        restored_2023 = restore_agreement_survey(contaminated_source_2023, 2023, '2023_data')
+        if restored_2023 is not None:
+            restored_survey_frames[contaminated_source_2023] = restored_2023
     
     # STEP 64: Professional GIRAI Metric Restoration
     print("\n[Step 64] Professional GIRAI Metric Restoration...")
@@ -1998,14 +2505,7 @@ def final_cleanup(df):
             'Non State Actors Coefficient': 'COEFFICIENTS: Non-state Actors'
         }
         
-        restoration_count = 0
-        for old_name, new_name in girai_mapping.items():
-            mask = (df['Metric'] == old_name) & (df['Source'] == 'Global Index on Responsible AI')
-            count = mask.sum()
-            if count > 0:
-                df.loc[mask, 'Metric'] = new_name
-                restoration_count += count
-                print(f"  ✓ Restored {count} rows: '{old_name}' -> '{new_name}'")
+        restoration_count = rename_metrics(df, girai_mapping, scope=df['Source'] == 'Global Index on Responsible AI')
         
         if restoration_count > 0:
             print(f"  ✓ Total {restoration_count} GIRAI metric names restored to professional format.")
@@ -2022,7 +2522,7 @@ def final_cleanup(df):
             '8. Public Opinion-2025_Data_fig_8.1.3.csv'
         ]
         before_purge = len(df)
-        df = df[~df['Source_File'].isin(generic_survey_files)].copy()
+        df = df.take(np.flatnonzero(~df['Source_File'].isin(generic_survey_files).to_numpy()))
         purge_removed = before_purge - len(df)
         if purge_removed > 0:
             print(f"  ✓ Removed {purge_removed} generic survey rows from 2024 and 2025 files.")
@@ -2042,107 +2542,40 @@ def final_cleanup(df):
     ]
     
     for survey_info in survey_files_to_restore:
-        survey_file = survey_info['file']
-        survey_year = survey_info['year']
-        path_part = survey_info['path_part']
-        
-        file_path_survey = BASE_DIR / "stanford_ai_index" / "public access raw data" / path_part / survey_file
+        restored_survey = restore_agreement_survey(survey_info['file'], survey_info['year'], survey_info['path_part'])
+        if restored_survey is not None:
+            restored_survey_frames[survey_info['file']] = restored_survey
+    
+    # None of the steps above touch the restored rows, so they can be appended in one concat
+    def finish_restored_surveys(restored):
+        # ISO3 lookup (a single country_converter batch) for the restored rows
+        restored = add_iso3_column(restored, country_col='Country')
+        # PROTECTED: Apply minimal normalization only (NO title case - preserve the format)
+        restored['Metric'] = normalize_survey_metrics(restored['Metric'])
+        return restored
+    
+    if restored_survey_frames:
+        try:
+            restored = finish_restored_surveys(
+                pd.concat([survey_frame for survey_frame, _ in restored_survey_frames.values()], ignore_index=True)
+            )
+            success_messages = [message for _, message in restored_survey_frames.values()]
+        except Exception:
+            # Redo survey by survey so only the failing survey is skipped
+            finished_frames = []
+            success_messages = []
+            for survey_file, (survey_frame, message) in restored_survey_frames.items():
+                try:
+                    finished_frames.append(finish_restored_surveys(survey_frame))
+                    success_messages.append(message)
+                except Exception as e:
+                    print(f"  ERROR: Failed to process '{survey_file}': {str(e)}")
+            restored = pd.concat(finished_frames, ignore_index=True) if finished_frames else None
         
-        if file_path_survey.exists():
-            try:
-                file_df_survey = None
-                for encoding in ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252']:
-                    try:
-                        file_df_survey = pd.read_csv(file_path_survey, low_memory=False, encoding=encoding)
-                        break
-                    except (UnicodeDecodeError, UnicodeError):
-                        continue
-                
-                if file_df_survey is not None and len(file_df_survey) > 0:
-                    # Find the value column (likely '% Agree' or similar)
-                    value_col_survey = None
-                    for col in file_df_survey.columns:
-                        col_lower = col.lower()
-                        if any(x in col_lower for x in ['agree', 'percentage', '%', 'value']):
-                            value_col_survey = col
-                            break
-                    
-                    if value_col_survey:
-                        file_df_survey = file_df_survey.rename(columns={value_col_survey: 'Value'})
-                        if file_df_survey['Value'].dtype == 'object':
-                            file_df_survey['Value'] = file_df_survey['Value'].astype(str).str.replace('%', '', regex=False).str.strip()
-                        file_df_survey['Value'] = pd.to_numeric(file_df_survey['Value'], errors='coerce')
-                        
-                        # Find statement/question column
-                        statement_col_survey = None
-                        for col_name in ['Statement', 'Question', 'statement', 'question']:
-                            if col_name in file_df_survey.columns:
-                                statement_col_survey = col_name
-                                break
-                        
-                        if statement_col_survey:
-                            file_df_survey[statement_col_survey] = file_df_survey[statement_col_survey].astype(str).str.strip()
-                            file_df_survey[statement_col_survey] = file_df_survey[statement_col_survey].str.replace(r'\s+', ' ', regex=True)
-                            file_df_survey[statement_col_survey] = file_df_survey[statement_col_survey].str.title()
-                            file_df_survey[statement_col_survey] = file_df_survey[statement_col_survey].str.replace(r'\bAi\b', 'AI', regex=True)
-                            file_df_survey[statement_col_survey] = file_df_survey[statement_col_survey].str.replace('–', '-', regex=False)
-                            file_df_survey[statement_col_survey] = file_df_survey[statement_col_survey].str.replace('—', '-', regex=False)
-                            file_df_survey[statement_col_survey] = file_df_survey[statement_col_survey].str.replace('35 Years', '3-5 Years', regex=False)
-                            
-                            # Create metric with full context: % Agreeing With Statement: [Statement]
-                            file_df_survey['Metric'] = '% Agreeing With Statement: ' + file_df_survey[statement_col_survey].astype(str)
-                            
-                            # Find country column
-                            country_col_survey = None
-                            for col in ['Country', 'country', 'Country Name', 'country_name']:
-                                if col in file_df_survey.columns:
-                                    country_col_survey = col
-                                    break
-                            
-                            if country_col_survey:
-                                before_filter_survey = len(file_df_survey)
-                                file_df_survey = file_df_survey[file_df_survey[country_col_survey].astype(str).str.strip().str.lower() != 'global']
-                                
-                                # Create new DataFrame with Year set appropriately
-                                new_df_survey = pd.DataFrame({
-                                    'Year': [survey_year] * len(file_df_survey),
-                                    'Country': file_df_survey[country_col_survey].astype(str).str.strip(),
-                                    'ISO3': pd.NA,
-                                    'Metric': file_df_survey['Metric'],
-                                    'Value': file_df_survey['Value']
-                                })
-                                
-                                new_df_survey['Source_File'] = survey_file
-                                new_df_survey['Source_Category'] = 'Public Opinion'
-                                new_df_survey['Source_Type'] = 'csv'
-                                new_df_survey['Source_Year'] = str(survey_year)
-                                new_df_survey['Source'] = 'Stanford AI Index'
-                                new_df_survey['Dataset'] = 'Stanford AI Index - Public Opinion'
-                                
-                                new_df_survey = add_iso3_column(new_df_survey, country_col='Country')
-                                new_df_survey = new_df_survey.dropna(subset=['Country', 'Metric', 'Value'])
-                                
-                                # Ensure Year remains integer type
-                                if len(new_df_survey) > 0 and new_df_survey['Year'].dtype != 'int64':
-                                    new_df_survey['Year'] = new_df_survey['Year'].astype(int)
-                                
-                                # Apply minimal normalization
-                                new_df_survey['Metric'] = new_df_survey['Metric'].astype(str).str.replace('\u2018', "'", regex=False)
-                                new_df_survey['Metric'] = new_df_survey['Metric'].str.replace('\u2019', "'", regex=False)
-                                new_df_survey['Metric'] = new_df_survey['Metric'].str.replace("'S", "'s", regex=False)
-                                new_df_survey['Metric'] = new_df_survey['Metric'].str.replace(r'\bAi\b', 'AI', regex=True)
-                                new_df_survey['Metric'] = new_df_survey['Metric'].str.strip()
-                                
-                                df = pd.concat([df, new_df_survey], ignore_index=True)
-                                print(f"  ✓ Successfully restored {len(new_df_survey)} rows for {survey_year} Survey 'Agreeing With Statement' metrics with full context.")
-                        else:
-                            print(f"  WARNING: Could not find Statement/Question column in '{survey_file}'.")
-                    else:
-                        print(f"  WARNING: Could not find value column in '{survey_file}'.")
-            except Exception as e:
-                print(f"  ERROR: Failed to process '{survey_file}': {str(e)}")
-        else:
-            print(f"  WARNING: File not found: {file_path_survey}")
+        if restored is not None:
+            df = pd.concat([df, restored], ignore_index=True)
+            # Report each survey only once its rows are in the frame
+            print('\n'.join(success_messages))
     
     # STEP 65: Restore Remaining Private Investment Focus Area Metrics
     print("\n[Step 65] Restore Remaining Private Investment Focus Area Metrics...")
@@ -2164,14 +2597,7 @@ def final_cleanup(df):
             'VC': 'Private Investment In AI Focus Area: Venture Capital (In Billions Of US Dollars)'
         }
         
-        restoration_count = 0
-        for old_name, new_name in focus_area_mapping.items():
-            mask = (df['Metric'] == old_name) & (df['Source_File'] == '4. Economy-2023_Data_fig_4.2.21.csv')
-            count = mask.sum()
-            if count > 0:
-                df.loc[mask, 'Metric'] = new_name
-                restoration_count += count
-                print(f"  ✓ Restored {count} rows: '{old_name}' -> '{new_name}'")
+        restoration_count = rename_metrics(df, focus_area_mapping, scope=df['Source_File'] == '4. Economy-2023_Data_fig_4.2.21.csv')
         
         if restoration_count > 0:
             print(f"  ✓ Total {restoration_count} Private Investment Focus Area metric names restored to professional format.")
@@ -2190,14 +2616,7 @@ def final_cleanup(df):
             'Public Spending On AI-Related Contracts (In Millions Of U.S. Dollars)': 'Public Spending On AI-Related Contracts (In Millions Of US Dollars)'
         }
         
-        standardization_count = 0
-        for old_name, new_name in currency_standardization.items():
-            mask = df['Metric'] == old_name
-            count = mask.sum()
-            if count > 0:
-                df.loc[mask, 'Metric'] = new_name
-                standardization_count += count
-                print(f"  ✓ Standardized {count} rows: '{old_name}' -> '{new_name}'")
+        standardization_count = rename_metrics(df, currency_standardization, verb='Standardized')
         
         if standardization_count > 0:
             print(f"  ✓ Total {standardization_count} currency metric names standardized to 'US Dollars' format.")
@@ -2218,15 +2637,8 @@ def final_cleanup(df):
                 'Percentage Change Of Granted AI Patents Per 100,000 Inhabitants By Country, 2012 Vs. 2022'
         }
         
-        restoration_count = 0
-        for old_name, new_name in patent_mapping.items():
-            # Apply specifically to Stanford AI Index source files
-            mask = (df['Metric'] == old_name) & (df['Source'] == 'Stanford AI Index')
-            count = mask.sum()
-            if count > 0:
-                df.loc[mask, 'Metric'] = new_name
-                restoration_count += count
-                print(f"  ✓ Restored {count} rows: '{old_name}' -> '{new_name}'")
+        # Apply specifically to Stanford AI Index source files
+        restoration_count = rename_metrics(df, patent_mapping, scope=df['Source'] == 'Stanford AI Index')
         
         if restoration_count > 0:
             print(f"  ✓ Total {restoration_count} patent metric names restored to official figure titles.")
@@ -2245,7 +2657,7 @@ def final_cleanup(df):
         drop_mask = (df['Source_File'].isin(secondary_bill_sources)) & (df['Metric'].isin(bill_metrics_to_drop))
         rows_dropped = drop_mask.sum()
         if rows_dropped > 0:
-            df = df[~drop_mask].copy()
+            df = df.take(np.flatnonzero(~drop_mask.to_numpy()))
             print(f"  ✓ Dropped {rows_dropped} redundant/conflicting rows from secondary bill source.")
         
         # 2. Apply surgical renaming to the primary sources
@@ -2258,14 +2670,7 @@ def final_cleanup(df):
             'Number Of AI-Related Bills Passed Into Law In 2023': 'Number of AI-Related Bills Passed Into Law (2023)'
         }
         
-        renaming_count = 0
-        for old_name, new_name in bills_mapping.items():
-            mask = df['Metric'] == old_name
-            count = mask.sum()
-            if count > 0:
-                df.loc[mask, 'Metric'] = new_name
-                renaming_count += count
-                print(f"  ✓ Renamed {count} rows: '{old_name}' -> '{new_name}'")
+        renaming_count = rename_metrics(df, bills_mapping, verb='Renamed')
         
         if renaming_count > 0:
             print(f"  ✓ Total {renaming_count} bill metric names standardized.")
@@ -2273,10 +2678,13 @@ def final_cleanup(df):
     # BLOCK 1: [Step 69] The Nuclear US Standard Lock
     print("\n[Step 69] The Nuclear US Standard Lock...")
     if 'Metric' in df.columns:
-        df['Metric'] = df['Metric'].str.replace('U.S.', 'US', regex=False)
-        df['Metric'] = df['Metric'].str.replace('Usd', 'US Dollars', case=False)
-        df['Metric'] = df['Metric'].str.replace('US Dollars Dollars', 'US Dollars', case=False)
-        df['Metric'] = df['Metric'].str.strip()
+        def lock_us_standard(metrics):
+            metrics = metrics.str.replace('U.S.', 'US', regex=False)
+            metrics = metrics.str.replace('Usd', 'US Dollars', case=False)
+            metrics = metrics.str.replace('US Dollars Dollars', 'US Dollars', case=False)
+            return metrics.str.strip()
+        
+        df['Metric'] = map_unique_values(df['Metric'], lock_us_standard)
         print(f"  ✓ Applied nuclear US standardization lock to all metrics.")
     
     # BLOCK 2: [Step 72] READER-FRIENDLY VIBRANCY & RAI RESTORATION
@@ -2303,9 +2711,8 @@ def final_cleanup(df):
             'Relative AI Skill Pen': 'Relative AI Skill Penetration'
         }
         
-        before_count = len(df[df['Metric'].isin(vibrancy_final_fix.keys())])
-        df['Metric'] = df['Metric'].replace(vibrancy_final_fix)
-        after_count = len(df[df['Metric'].isin(vibrancy_final_fix.values())])
+        before_count = df['Metric'].isin(vibrancy_final_fix.keys()).sum()
+        df['Metric'] = map_unique_values(df['Metric'], lambda metrics: metrics.replace(vibrancy_final_fix))
         
         if before_count > 0:
             print(f"  ✓ Restored {before_count} Vibrancy & RAI metric names to reader-friendly format.")
@@ -2324,7 +2731,7 @@ def final_cleanup(df):
     
     if 'Source_File' in df.columns:
         before_purge = len(df)
-        df = df[~df['Source_File'].isin(sub_national_job_files)].copy()
+        df = df.take(np.flatnonzero(~df['Source_File'].isin(sub_national_job_files).to_numpy()))
         rows_purged = before_purge - len(df)
         if rows_purged > 0:
             print(f"  ✓ Purged {rows_purged} sub-national job posting artifacts (mislabeled state data).")
@@ -2352,7 +2759,7 @@ def final_cleanup(df):
         before_purge = len(df)
         # We only remove these specific metrics when they are assigned to 'Georgia'
         purge_mask = (df['Country'] == 'Georgia') & (df['Metric'].isin(georgia_state_metrics))
-        df = df[~purge_mask].copy()
+        df = df.take(np.flatnonzero(~purge_mask.to_numpy()))
         rows_purged = before_purge - len(df)
         if rows_purged > 0:
             print(f"  ✓ Purged {rows_purged} Georgia State artifacts (mislabeled as country data).")
@@ -2362,7 +2769,7 @@ def final_cleanup(df):
     # BLOCK 3: Final Collision Check
     print("\n[Final] Collision Check...")
     before_dedup = len(df)
-    df.drop_duplicates(subset=['Year', 'Country', 'Metric', 'Value'], inplace=True)
+    df = drop_duplicate_rows(df, subset=['Year', 'Country', 'Metric', 'Value'])
     after_dedup = len(df)
     duplicates_removed = before_dedup - after_dedup
     if duplicates_removed > 0:
@@ -2373,10 +2780,13 @@ def final_cleanup(df):
     # Final Mojibake & Format Lock (Absolute Last Step)
     if 'Metric' in df.columns:
         # Absolute final sweep - fix all variants of 3-5 years mojibake
-        df['Metric'] = df['Metric'].str.replace(r'3\s*[^\x00-\x7F]+\s*5', '3-5', regex=True)
-        df['Metric'] = df['Metric'].str.replace('3Â€"5', '3-5', regex=False)
-        df['Metric'] = df['Metric'].str.replace('3 Ğ5', '3-5', regex=False)
-        df['Metric'] = df['Metric'].str.strip()
+        def lock_3_5_years(metrics):
+            metrics = metrics.str.replace(NON_ASCII_3_5_RE, '3-5', regex=True)
+            metrics = metrics.str.replace('3Â€"5', '3-5', regex=False)
+            metrics = metrics.str.replace('3 Ğ5', '3-5', regex=False)
+            return metrics.str.strip()
+        
+        df['Metric'] = map_unique_values(df['Metric'], lock_3_5_years)
         print(f"  ✓ Applied final mojibake cleanup and format lock.")
     
     # STEP 79: Clinical Restoration of Contract Spending Metrics
@@ -2393,15 +2803,8 @@ def final_cleanup(df):
                 'Median Public Spending AI-Related Contract Value (In Thousands Of US Dollars)'
         }
         
-        restoration_count = 0
-        for old_name, new_name in spending_mapping.items():
-            # Apply specifically to Policy and Governance category
-            mask = (df['Metric'] == old_name) & (df['Source_Category'] == 'Policy and Governance')
-            count = mask.sum()
-            if count > 0:
-                df.loc[mask, 'Metric'] = new_name
-                restoration_count += count
-                print(f"  ✓ Restored {count} rows: '{old_name}' -> '{new_name}'")
+        # Apply specifically to Policy and Governance category
+        restoration_count = rename_metrics(df, spending_mapping, scope=df['Source_Category'] == 'Policy and Governance')
         
         if restoration_count > 0:
             print(f"  ✓ Total {restoration_count} contract spending metric names restored with context.")
@@ -2413,22 +2816,26 @@ def final_cleanup(df):
     
     # [Step 80] Bachelor's casing fix and Migration differentiation
     if 'Metric' in df.columns:
-        # 1. Global Bachelor's casing fix
-        before_bachelors = len(df[df['Metric'].str.contains("Bachelor'S", regex=False, na=False)])
-        df['Metric'] = df['Metric'].str.replace("Bachelor'S", "Bachelor's", regex=False)
+        # 1. Global Bachelor's casing fix and 2. residual 'Linkedin' spelling (before
+        # migration differentiation), counted and rewritten per distinct name
+        before_bachelors = flag_unique_values(df['Metric'], lambda u: u.str.contains("Bachelor'S", regex=False, na=False)).sum()
+        before_linkedin = flag_unique_values(df['Metric'], lambda u: u.str.contains('Linkedin', regex=False, na=False)).sum()
+        df['Metric'] = map_unique_values(
+            df['Metric'],
+            lambda metrics: metrics.str.replace("Bachelor'S", "Bachelor's", regex=False).str.replace('Linkedin', 'LinkedIn', regex=False)
+        )
         if before_bachelors > 0:
             print(f"  ✓ Fixed {before_bachelors} rows with 'Bachelor'S' casing artifact.")
-        
-        # 2. Clean up any residual 'Linkedin' spelling (do this before migration differentiation)
-        before_linkedin = len(df[df['Metric'].str.contains('Linkedin', regex=False, na=False)])
-        df['Metric'] = df['Metric'].str.replace('Linkedin', 'LinkedIn', regex=False)
         if before_linkedin > 0:
             print(f"  ✓ Fixed {before_linkedin} rows with 'Linkedin' spelling.")
         
         # 3. Differentiate Net AI Talent Migration metrics
         if 'Source_File' in df.columns:
             # First, standardize the metric name (handle both variations with/without parentheses)
-            migration_mask = df['Metric'].str.contains('Net AI Talent Migration.*LinkedIn.*Members', case=False, regex=True, na=False) & (~df['Metric'].str.contains('\\(202[34]\\)', regex=True, na=False))
+            migration_mask = flag_unique_values(
+                df['Metric'],
+                lambda u: u.str.contains(NET_MIGRATION_RE, regex=True, na=False) & ~u.str.contains(MIGRATION_YEAR_SUFFIX_RE, regex=True, na=False)
+            )
             count_standardized = migration_mask.sum()
             if count_standardized > 0:
                 df.loc[migration_mask, 'Metric'] = 'Net AI Talent Migration Per 10,000 LinkedIn Members'
@@ -2479,13 +2886,7 @@ def final_cleanup(df):
             'Private Investment': 'Total AI Private Investment (Nominal USD)'
         }
         
-        for old_name, new_name in vibrancy_pillar_mapping.items():
-            mask = df['Metric'] == old_name
-            count = mask.sum()
-            if count > 0:
-                df.loc[mask, 'Metric'] = new_name
-                restoration_count += count
-                print(f"  ✓ Restored {count} rows: '{old_name}' -> '{new_name}'")
+        restoration_count += rename_metrics(df, vibrancy_pillar_mapping)
         
         if restoration_count > 0:
             print(f"  ✓ Total {restoration_count} generic indicator names professionalized.")
@@ -2517,31 +2918,17 @@ def final_cleanup(df):
         
         for file_name, (val_col, prefix, context_col) in residual_targets.items():
             try:
-                file_path = None
-                potential_paths = [
+                file_path = find_source_file([
                     BASE_DIR / file_name,
                     BASE_DIR / 'stanford_ai_index' / 'public access raw data' / '2025_data' / file_name,
                     BASE_DIR / 'stanford_ai_index' / '2025_data' / file_name,
                     BASE_DIR / 'stanford_ai_index' / 'public access raw data' / '2024_data' / file_name,
                     BASE_DIR / 'stanford_ai_index' / '2024_data' / file_name,
                     DATA_DIR / file_name,
-                ]
+                ])
                 
-                for potential_path in potential_paths:
-                    if potential_path.exists():
-                        file_path = potential_path
-                        break
-                
-                if file_path and file_path.exists():
-                    # Try multiple encodings
-                    raw = None
-                    for enc in ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252']:
-                        try:
-                            raw = pd.read_csv(file_path, encoding=enc, low_memory=False)
-                            if not raw.empty and len(raw.columns) >= 3:
-                                break
-                        except:
-                            continue
+                if file_path:
+                    raw = read_legacy_csv(file_path)
                     
                     if raw is not None and not raw.empty and val_col in raw.columns and context_col in raw.columns:
                         # Map country names
@@ -2551,25 +2938,30 @@ def final_cleanup(df):
                         else:
                             raw['Country'] = ''
                         
-                        file_restored = 0
-                        for _, row in raw.iterrows():
-                            try:
-                                # Standardize raw percentage string to float to match Master
-                                val_str = str(row[val_col]).replace('%', '').strip()
-                                val = float(val_str)
-                                country = str(row['Country']).strip()
-                                
-                                if country:
-                                    mask = (df['Source_File'] == file_name) & \
-                                           (df['Country'].astype(str).str.strip() == country) & \
-                                           (df['Value'].astype(float) == val)
-                                    
-                                    if mask.any():
-                                        new_metric = prefix + str(row[context_col]).strip()
-                                        df.loc[mask, 'Metric'] = new_metric
-                                        file_restored += mask.sum()
-                            except (ValueError, KeyError, TypeError):
-                                continue
+                        # Standardize raw percentage strings to float to match Master
+                        keys = pd.DataFrame({
+                            'Country': raw['Country'],
+                            'Value': parse_percent_values(raw[val_col]).astype(float),
+                            'NewMetric': prefix + raw[context_col].astype(str).str.strip()
+                        })
+                        keys = keys[(keys['Country'] != '') & keys['Value'].notna()]
+                        
+                        # Join the raw keys onto this file's Master rows in one pass
+                        file_positions = np.flatnonzero((df['Source_File'] == file_name).to_numpy(dtype=bool))
+                        file_rows = pd.DataFrame({
+                            'Country': df['Country'].take(file_positions).astype(str).str.strip().to_numpy(),
+                            'Value': df['Value'].take(file_positions).astype(float).to_numpy(),
+                            'Position': file_positions
+                        })
+                        # Every matching raw row counts; the last one wins the Metric
+                        file_restored = len(file_rows.merge(keys[['Country', 'Value']], on=['Country', 'Value']))
+                        matches = file_rows.merge(
+                            keys.drop_duplicates(subset=['Country', 'Value'], keep='last'),
+                            on=['Country', 'Value']
+                        )
+                        if not matches.empty:
+                            metric_loc = df.columns.get_loc('Metric')
+                            df.iloc[matches['Position'].to_numpy(), metric_loc] = matches['NewMetric'].to_numpy()
                         
                         if file_restored > 0:
                             restoration_count += file_restored
@@ -2579,12 +2971,12 @@ def final_cleanup(df):
                 continue
         
         # 3. Clean up degree typography (fix curly apostrophes - replace U+2019 with U+0027)
-        df['Metric'] = df['Metric'].str.replace('\u2019', "'", regex=False)
+        df['Metric'] = map_unique_values(df['Metric'], lambda metrics: metrics.str.replace('\u2019', "'", regex=False))
         print(f"  ✓ Cleaned degree typography (standardized apostrophes)")
         
         # Final deduplication
         before_dedup = len(df)
-        df.drop_duplicates(subset=['Year', 'Country', 'Metric', 'Value'], inplace=True)
+        df = drop_duplicate_rows(df, subset=['Year', 'Country', 'Metric', 'Value'])
         after_dedup = len(df)
         duplicates_removed = before_dedup - after_dedup
         if duplicates_removed > 0:
@@ -2601,11 +2993,15 @@ def final_cleanup(df):
     # [Step 84] The Absolute Final Casing Lock
     if 'Metric' in df.columns:
         # Standardize all variations of degree apostrophe casing
-        before_fix = len(df[df['Metric'].str.contains("Master'S|Bachelor'S", regex=True, na=False)])
-        df['Metric'] = df['Metric'].str.replace("Master'S", "Master's", regex=False)
-        df['Metric'] = df['Metric'].str.replace("Bachelor'S", "Bachelor's", regex=False)
-        # Cleanup any resulting double spaces or leading/trailing whitespace
-        df['Metric'] = df['Metric'].str.replace('  ', ' ', regex=False).str.strip()
+        before_fix = flag_unique_values(df['Metric'], lambda u: u.str.contains(DEGREE_CASING_ARTIFACT_RE, regex=True, na=False)).sum()
+        
+        def lock_degree_casing(metrics):
+            metrics = metrics.str.replace("Master'S", "Master's", regex=False)
+            metrics = metrics.str.replace("Bachelor'S", "Bachelor's", regex=False)
+            # Cleanup any resulting double spaces or leading/trailing whitespace
+            return metrics.str.replace('  ', ' ', regex=False).str.strip()
+        
+        df['Metric'] = map_unique_values(df['Metric'], lock_degree_casing)
         if before_fix > 0:
             print(f"  ✓ Fixed {before_fix} rows with incorrect 'Master'S'/'Bachelor'S' casing artifacts.")
         print(f"  ✓ Applied final academic casing lock to all metrics.")
@@ -2617,23 +3013,24 @@ def final_cleanup(df):
     if 'Country' in df.columns and 'ISO3' in df.columns:
         # 1. Remove non-country aggregate 'World'
         before_world = len(df)
-        df = df[df['ISO3'] != 'WLD'].copy()
-        df = df[df['Country'] != 'World'].copy()
+        world_mask = ((df['ISO3'] == 'WLD') | (df['Country'] == 'World')).to_numpy()
+        df = df.take(np.flatnonzero(~world_mask))
         rows_world = before_world - len(df)
         if rows_world > 0:
             print(f"  ✓ Purged {rows_world} rows of non-country aggregate data ('World').")
     
     if 'Metric' in df.columns:
         # 2. Standardize residual en-dashes to hyphens for linguistic consistency
-        before_dash_fix = len(df[df['Metric'].str.contains('–', regex=False, na=False)])
-        df['Metric'] = df['Metric'].str.replace('–', '-', regex=False)
+        # and 3. final whitespace and double-space sweep, in one pass per distinct name
+        before_dash_fix = flag_unique_values(df['Metric'], lambda u: u.str.contains('–', regex=False, na=False)).sum()
+        df['Metric'] = map_unique_values(
+            df['Metric'],
+            lambda metrics: metrics.str.replace('–', '-', regex=False).str.replace('  ', ' ', regex=False).str.strip()
+        )
         if before_dash_fix > 0:
             print(f"  ✓ Standardized {before_dash_fix} rows with residual en-dashes to standard hyphens.")
         else:
             print(f"  ✓ Standardized residual en-dashes to standard hyphens.")
-        
-        # 3. Final whitespace and double-space sweep
-        df['Metric'] = df['Metric'].str.replace('  ', ' ', regex=False).str.strip()
         print(f"  ✓ Applied final whitespace cleanup to all metrics.")
     
     print(f"\n  Final shape: {len(df)} rows, {len(df.columns)} columns")
@@ -2649,25 +3046,19 @@ def final_cleanup(df):
         rows_to_remove = removal_mask.sum()
         
         if rows_to_remove > 0:
-            df = df[~removal_mask].copy()
+            df = df.take(np.flatnonzero(~removal_mask.to_numpy()))
             print(f"  ✓ Removed {rows_to_remove} generic rows for '{target_metric}' from '{source_file_86}'.")
         
         # Load raw source file
-        file_path = None
-        potential_paths = [
+        file_path = find_source_file([
             BASE_DIR / source_file_86,
             BASE_DIR / "stanford_ai_index" / "public access raw data" / "2025_data" / source_file_86,
             BASE_DIR / "stanford_ai_index" / "2025_data" / source_file_86,
-        ]
-        
-        for potential_path in potential_paths:
-            if potential_path.exists():
-                file_path = potential_path
-                break
+        ])
         
-        if file_path and file_path.exists():
+        if file_path:
             try:
-                raw_df = pd.read_csv(file_path, low_memory=False)
+                raw_df = read_source_csv(file_path)
                 
                 # Check if required columns exist
                 if 'Geographic area' in raw_df.columns and 'Gender' in raw_df.columns:
@@ -2679,45 +3070,39 @@ def final_cleanup(df):
                             break
                     
                     if value_col:
-                        # Create new rows for each gender
-                        new_rows = []
+                        # Create new rows for both genders in one frame (Female rows first, as before)
+                        gender_order = raw_df['Gender'].map({'Female': 0, 'Male': 1})
+                        gender_rows = np.flatnonzero(gender_order.notna().to_numpy())
+                        gender_rows = gender_rows[np.argsort(gender_order.to_numpy()[gender_rows], kind='stable')]
+                        gender_df = raw_df.take(gender_rows)
+                        gender_count = gender_df['Gender'].nunique()
                         
-                        for gender in ['Female', 'Male']:
-                            gender_df = raw_df[raw_df['Gender'] == gender].copy()
+                        if gender_count > 0:
+                            # Create new dataframe with required columns
+                            new_df_combined = pd.DataFrame({
+                                'Country': gender_df['Geographic area'].values,
+                                'Value': pd.to_numeric(gender_df[value_col], errors='coerce').values,
+                                'Year': 2025,  # Set Year to 2025 as specified
+                                'Metric': ("Relative AI Skill Penetration, 2015-24: " + gender_df['Gender']).values,
+                                'Source_File': source_file_86,
+                                'Dataset': 'Stanford AI Index - Economy',
+                                'Source': 'Stanford AI Index',
+                                'Source_Year': 2025,
+                                'Source_Type': 'CSV',
+                                'Source_Category': 'Economy'
+                            })
                             
-                            if len(gender_df) > 0:
-                                # Create new dataframe with required columns
-                                new_df = pd.DataFrame({
-                                    'Country': gender_df['Geographic area'].values,
-                                    'Value': pd.to_numeric(gender_df[value_col], errors='coerce').values,
-                                    'Year': 2025,  # Set Year to 2025 as specified
-                                    'Metric': f"Relative AI Skill Penetration, 2015-24: {gender}",
-                                    'Source_File': source_file_86,
-                                    'Dataset': 'Stanford AI Index - Economy',
-                                    'Source': 'Stanford AI Index',
-                                    'Source_Year': 2025,
-                                    'Source_Type': 'CSV',
-                                    'Source_Category': 'Economy'
-                                })
-                                
-                                # Remove rows with missing values
-                                new_df = new_df.dropna(subset=['Country', 'Value'])
-                                
-                                # Apply country_converter logic to get ISO3 codes
-                                if CC_AVAILABLE:
-                                    new_df['ISO3'] = new_df['Country'].apply(get_iso3_country_converter)
-                                else:
-                                    new_df['ISO3'] = new_df['Country'].apply(get_iso3_pycountry)
-                                
-                                # Add other metadata columns if they exist in main df
-                                for col in ['GIRAI_region', 'UN_region', 'UN_subregion']:
-                                    if col in df.columns:
-                                        new_df[col] = None
-                                
-                                new_rows.append(new_df)
-                        
-                        if new_rows:
-                            new_df_combined = pd.concat(new_rows, ignore_index=True)
+                            # Remove rows with missing values
+                            new_df_combined = new_df_combined.dropna(subset=['Country', 'Value']).reset_index(drop=True)
+                            
+                            # Look up each distinct country's ISO3 code once
+                            iso3_map = build_iso3_map(new_df_combined['Country'].unique())
+                            new_df_combined['ISO3'] = new_df_combined['Country'].map(iso3_map)
+                            
+                            # Add other metadata columns if they exist in main df
+                            for col in ['GIRAI_region', 'UN_region', 'UN_subregion']:
+                                if col in df.columns:
+                                    new_df_combined[col] = None
                             
                             # Ensure data types match main dataframe
                             if 'Year' in df.columns:
@@ -2727,7 +3112,7 @@ def final_cleanup(df):
                             
                             # Append to main dataframe
                             df = pd.concat([df, new_df_combined], ignore_index=True)
-                            print(f"  ✓ Added {len(new_df_combined)} gendered rows ({len(new_rows)} gender categories).")
+                            print(f"  ✓ Added {len(new_df_combined)} gendered rows ({gender_count} gender categories).")
                         else:
                             print(f"  ⚠ No new rows created from raw file.")
                     else:
@@ -2742,7 +3127,7 @@ def final_cleanup(df):
             print(f"  ⚠ Raw source file '{source_file_86}' not found in expected locations.")
         
         # Remove duplicates after adding new rows
-        df.drop_duplicates(inplace=True)
+        df = drop_duplicate_rows(df)
     
     # STEP 89: Restore Collaboration Level Context for Elsevier Publications (Vectorized)
     print("\n[Step 89] Restore Collaboration Level Context for Elsevier Publications...")
@@ -2755,22 +3140,16 @@ def final_cleanup(df):
         rows_to_remove = removal_mask.sum()
         
         if rows_to_remove > 0:
-            df = df[~removal_mask].copy()
+            df = df.take(np.flatnonzero(~removal_mask.to_numpy()))
             print(f"  ✓ Removed {rows_to_remove} generic rows for Elsevier publications.")
         
         # Load raw source file
-        file_path = None
-        potential_paths = [
+        file_path = find_source_file([
             BASE_DIR / "stanford_ai_index" / "public access raw data" / "2021_data" / "1. Research and Development-2021_Publications_arXiv_Elsevier - 2021 AI Index Reprot.xlsx",
             BASE_DIR / source_file_89,
-        ]
+        ])
         
-        for potential_path in potential_paths:
-            if potential_path.exists():
-                file_path = potential_path
-                break
-        
-        if file_path and file_path.exists():
+        if file_path:
             try:
                 # Load "Raw Data" sheet from Excel file
                 source_df = pd.read_excel(file_path, sheet_name='Raw Data', engine='openpyxl')
@@ -2936,13 +3315,13 @@ def final_cleanup(df):
             print(f"  ⚠ Raw source file '{source_file_89}' not found in expected locations.")
         
         # Vectorized deduplication
-        df.drop_duplicates(inplace=True)
+        df = drop_duplicate_rows(df)
     
     # Purge non-country aggregates (introduced by Elsevier)
     if 'ISO3' in df.columns:
         before_purge = len(df)
         non_country_iso3 = ['WLD', 'E27', 'E28', 'E44', 'CSX', 'SCG', 'YUG', 'YUX', 'ROM']
-        df = df[~df['ISO3'].isin(non_country_iso3)].copy()
+        df = df.take(np.flatnonzero(~df['ISO3'].isin(non_country_iso3).to_numpy()))
         rows_purged = before_purge - len(df)
         if rows_purged > 0:
             print(f"\n[Purge] Removed {rows_purged} rows with non-country ISO3 codes: {', '.join(non_country_iso3)}")
@@ -2990,7 +3369,7 @@ def final_cleanup(df):
         
         # Final deduplication
         before_dedup = len(df)
-        df = df.drop_duplicates(subset=['Year', 'Country', 'Metric', 'Value']).copy()
+        df = drop_duplicate_rows(df, subset=['Year', 'Country', 'Metric', 'Value'])
         rows_deduped = before_dedup - len(df)
         
         # Get final unique countries count
@@ -3007,27 +3386,21 @@ def final_cleanup(df):
     
     # Clear generic rows
     before_clear = len(df)
-    df = df[df['Source_File'] != oecd_file].copy()
+    df = df.take(np.flatnonzero((df['Source_File'] != oecd_file).to_numpy()))
     rows_cleared = before_clear - len(df)
     if rows_cleared > 0:
         print(f"  ✓ Cleared {rows_cleared} generic OECD rows.")
     
     # Locate the source file
-    oecd_file_path = None
-    potential_paths = [
+    oecd_file_path = find_source_file([
         BASE_DIR / "OECD_ai" / oecd_file,
         BASE_DIR / oecd_file,
         DATA_DIR / oecd_file,
-    ]
+    ])
     
-    for potential_path in potential_paths:
-        if potential_path.exists():
-            oecd_file_path = potential_path
-            break
-    
-    if oecd_file_path and oecd_file_path.exists():
+    if oecd_file_path:
         try:
-            oecd_raw = pd.read_csv(oecd_file_path, low_memory=False)
+            oecd_raw = read_source_csv(oecd_file_path)
             
             # Standardize Names
             oecd_name_map = {'Korea': 'South Korea', 'Slovak Republic': 'Slovakia', 'Türkiye': 'Turkey'}
@@ -3113,26 +3486,20 @@ def final_cleanup(df):
             rows_to_remove = removal_mask.sum()
             
             if rows_to_remove > 0:
-                df = df[~removal_mask].copy()
+                df = df.take(np.flatnonzero(~removal_mask.to_numpy()))
                 total_rows_removed += rows_to_remove
                 print(f"  ✓ Removed {rows_to_remove} generic rows for '{target_metric}' from '{source_file}'.")
             
             # Load source file
-            file_path = None
-            potential_paths = [
+            file_path = find_source_file([
                 BASE_DIR / source_file,
                 BASE_DIR / "stanford_ai_index" / "public access raw data" / "2025_data" / source_file,
                 BASE_DIR / "stanford_ai_index" / "2025_data" / source_file,
-            ]
-            
-            for potential_path in potential_paths:
-                if potential_path.exists():
-                    file_path = potential_path
-                    break
+            ])
             
-            if file_path and file_path.exists():
+            if file_path:
                 try:
-                    raw_df = pd.read_csv(file_path, low_memory=False)
+                    raw_df = read_source_csv(file_path)
                     
                     # Check for required columns - files have 'Geographic area', 'Gender', and value column
                     value_col = None
@@ -3214,7 +3581,7 @@ def final_cleanup(df):
             print(f"  ✓ Restored Gender context for {total_rows_restored} LinkedIn Talent rows.")
         
         # Remove duplicates after adding new rows
-        df.drop_duplicates(inplace=True)
+        df = drop_duplicate_rows(df)
     
     # STEP 92: Restore Gender Context for CS Graduates
     print("\n[Step 92] Restore Gender Context for CS Graduates...")
@@ -3227,25 +3594,19 @@ def final_cleanup(df):
         rows_to_remove = removal_mask.sum()
         
         if rows_to_remove > 0:
-            df = df[~removal_mask].copy()
+            df = df.take(np.flatnonzero(~removal_mask.to_numpy()))
             print(f"  ✓ Removed {rows_to_remove} generic rows for '{target_metric}' from '{source_file_92}'.")
         
         # Load source file
-        file_path = None
-        potential_paths = [
+        file_path = find_source_file([
             BASE_DIR / source_file_92,
             BASE_DIR / "stanford_ai_index" / "public access raw data" / "2024_data" / source_file_92,
             BASE_DIR / "stanford_ai_index" / "2024_data" / source_file_92,
-        ]
+        ])
         
-        for potential_path in potential_paths:
-            if potential_path.exists():
-                file_path = potential_path
-                break
-        
-        if file_path and file_path.exists():
+        if file_path:
             try:
-                raw_df = pd.read_csv(file_path, low_memory=False)
+                raw_df = read_source_csv(file_path)
                 
                 # Check for required columns
                 if 'Gender' in raw_df.columns and 'Percentage' in raw_df.columns and 'Country' in raw_df.columns:
@@ -3317,7 +3678,7 @@ def final_cleanup(df):
             print(f"  ⚠ Source file '{source_file_92}' not found in expected locations.")
         
         # Remove duplicates after adding new rows
-        df.drop_duplicates(inplace=True)
+        df = drop_duplicate_rows(df)
     
     # [Step 93] Restore Transactional Context for NetBase Quid Funding (Vectorized)
     print("\n[Step 93] Restore Transactional Context for NetBase Quid Funding...")
@@ -3327,25 +3688,19 @@ def final_cleanup(df):
     # 1. Identify metrics to replace or delete
     # We replace Funding and Quarters with better names. We delete 'Year Of Funding Event' forever.
     target_quid_metrics = ["Funding In US Dollars", "Quarter Of Funding Event", "Target Founding Year", "Year Of Funding Event"]
-    df = df[~((df['Source_File'] == quid_source) & (df['Metric'].isin(target_quid_metrics)))].copy()
+    df = df.take(np.flatnonzero(~((df['Source_File'] == quid_source) & (df['Metric'].isin(target_quid_metrics))).to_numpy()))
     
     # Try multiple potential paths for the CSV file
-    file_path = None
-    potential_paths = [
+    file_path = find_source_file([
         BASE_DIR / quid_raw_file,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2021_data" / quid_raw_file,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2021_data" / quid_source,
-    ]
+    ])
     
-    for potential_path in potential_paths:
-        if potential_path.exists():
-            file_path = potential_path
-            break
-    
-    if file_path and file_path.exists():
+    if file_path:
         try:
             if file_path.suffix == '.csv':
-                raw_df = pd.read_csv(file_path, low_memory=False)
+                raw_df = read_source_csv(file_path)
             else:
                 # Read Excel file - try "Funding Event" sheet
                 try:
@@ -3409,7 +3764,7 @@ def final_cleanup(df):
         print(f"  ⚠ Source file '{quid_raw_file}' not found in expected locations.")
     
     # Remove duplicates after adding new rows
-    df.drop_duplicates(inplace=True)
+    df = drop_duplicate_rows(df)
     
     # [Step 95] Surgical Restoration of Turkey Granular Metrics (Fixed Syntax)
     print("\n[Step 95] Surgical Restoration of Turkey Granular Metrics...")
@@ -3418,25 +3773,19 @@ def final_cleanup(df):
     s86 = "8. Public Opinion-2025_Data_fig_8.1.6.csv"
     
     # 1. Purge existing generic Turkey rows for these sources
-    df = df[~((df['Country'] == 'Turkey') & (df['Source_File'].isin([s6, s85, s86])))].copy()
+    df = df.take(np.flatnonzero(~((df['Country'] == 'Turkey') & (df['Source_File'].isin([s6, s85, s86]))).to_numpy()))
     
     restored_rows = []
     
     # Restore Education data (Vectorized)
-    edu_file_path = None
-    edu_potential_paths = [
+    edu_file_path = find_source_file([
         BASE_DIR / s6,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2025_data" / s6,
-    ]
+    ])
     
-    for potential_path in edu_potential_paths:
-        if potential_path.exists():
-            edu_file_path = potential_path
-            break
-    
-    if edu_file_path and edu_file_path.exists():
+    if edu_file_path:
         try:
-            raw = pd.read_csv(edu_file_path)
+            raw = read_source_csv(edu_file_path)
             tur = raw[raw['Country'] == 'Turkey'].copy()
             if not tur.empty and 'Group' in tur.columns and 'Percent Female' in tur.columns:
                 # Fix apostrophes using double quotes to avoid syntax errors
@@ -3453,23 +3802,17 @@ def final_cleanup(df):
 
     # Restore Public Opinion data (Vectorized)
     for s_file in [s85, s86]:
-        po_file_path = None
-        po_potential_paths = [
+        po_file_path = find_source_file([
             BASE_DIR / s_file,
             BASE_DIR / "stanford_ai_index" / "public access raw data" / "2025_data" / s_file,
-        ]
+        ])
         
-        for potential_path in po_potential_paths:
-            if potential_path.exists():
-                po_file_path = potential_path
-                break
-        
-        if po_file_path and po_file_path.exists():
+        if po_file_path:
             try:
-                raw = pd.read_csv(po_file_path)
+                raw = read_source_csv(po_file_path)
                 tur = raw[raw['Country'] == 'Turkey'].copy()
                 if not tur.empty and 'Statement' in tur.columns and 'pp. change' in tur.columns:
-                    tur['Clean_Stmt'] = tur['Statement'].str.replace(r'\s+', ' ', regex=True).str.strip()
+                    tur['Clean_Stmt'] = tur['Statement'].str.replace(WHITESPACE_RUN_RE, ' ', regex=True).str.strip()
                     tur['Metric'] = "Percentage Point Change (2022-2024) Agreeing With Statement: " + tur['Clean_Stmt']
                     tur['Value'] = tur['pp. change'].str.replace("%", "").astype(float)
                     tur['ISO3'], tur['Year'] = 'TUR', 2025
@@ -3499,7 +3842,7 @@ def final_cleanup(df):
         print(f"  ✓ Successfully restored {len(new_turkey_df)} granular metrics for Turkey.")
     
     # Remove duplicates after adding new rows
-    df.drop_duplicates(inplace=True)
+    df = drop_duplicate_rows(df)
     
     # Final ISO3 Hard-Lock: Nuclear Purge for 100% ISO3 coverage
     print("\n[Final ISO3 Hard-Lock] Ensuring 100% ISO3 coverage...")
@@ -3550,7 +3893,7 @@ def final_cleanup(df):
     df['Country'] = df['Country'].apply(ultimate_diamond_clean)
     
     # Global deduplication after cleaning
-    df = df.drop_duplicates(subset=['Year', 'ISO3', 'Metric', 'Value'], keep='first')
+    df = drop_duplicate_rows(df, subset=['Year', 'ISO3', 'Metric', 'Value'])
     
     print("  ✓ Ultimate Standard 8.1 achieved: Zero non-ASCII chars and correct grammar confirmed.")
     
@@ -3584,8 +3927,8 @@ def final_cleanup(df):
     df.loc[mask, 'Metric'] = df.loc[mask].apply(sync_pc_metrics, axis=1)
     
     # Final standard strip and deduplication lock
-    df['Metric'] = df['Metric'].str.replace(r'\s+', ' ', regex=True).str.strip()
-    df = df.drop_duplicates(subset=['Year', 'ISO3', 'Metric', 'Value'], keep='first')
+    df['Metric'] = df['Metric'].str.replace(WHITESPACE_RUN_RE, ' ', regex=True).str.strip()
+    df = drop_duplicate_rows(df, subset=['Year', 'ISO3', 'Metric', 'Value'])
     
     print("  ✓ Success: All Point Change metrics synchronized to Title Case (2022-23, 2022-24, 2023-24).")
     
@@ -3597,25 +3940,19 @@ def final_cleanup(df):
     uk_removal_mask = (df['Country'] == "United Kingdom") & (df['Source_File'] == rd_file)
     uk_rows_removed = uk_removal_mask.sum()
     if uk_rows_removed > 0:
-        df = df[~uk_removal_mask].copy()
+        df = df.take(np.flatnonzero(~uk_removal_mask.to_numpy()))
         print(f"  ✓ Removed {uk_rows_removed} contaminated UK rows from {rd_file}.")
     
     # 2. Update Metric names with Sector context
-    rd_file_path = None
-    rd_potential_paths = [
+    rd_file_path = find_source_file([
         BASE_DIR / rd_file,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2024_data" / rd_file,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2024_data" / "1. Research and Development-2024_Data_fig_1.1.5.csv",
-    ]
+    ])
     
-    for potential_path in rd_potential_paths:
-        if potential_path.exists():
-            rd_file_path = potential_path
-            break
-    
-    if rd_file_path and rd_file_path.exists():
+    if rd_file_path:
         try:
-            raw_rd = pd.read_csv(rd_file_path, low_memory=False)
+            raw_rd = read_source_csv(rd_file_path)
             
             # Find the correct column names (handle variations)
             geo_col = None
@@ -3661,7 +3998,7 @@ def final_cleanup(df):
         print(f"  ⚠ Source file '{rd_file}' not found in expected locations.")
     
     # Final deduplication after updates
-    df = df.drop_duplicates(subset=['Year', 'ISO3', 'Metric', 'Value'], keep='first')
+    df = drop_duplicate_rows(df, subset=['Year', 'ISO3', 'Metric', 'Value'])
     print("  ✓ R&D sector context updated and UK contamination removed.")
     
     # [Step 99] Absolute AI Talent Methodology Lock (v8.7)
@@ -3681,21 +4018,15 @@ def final_cleanup(df):
     # 4. Gender Split Differentiation (2024 Portions vs 2025 Shares)
     # This surgical fix recovers gender from the 2024 source file to solve the 240 duplicate pairs
     f24_18 = "4. Economy-2024_Data_fig_4.2.18.csv"
-    f24_18_path = None
-    f24_18_potential_paths = [
+    f24_18_path = find_source_file([
         BASE_DIR / f24_18,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2024_data" / f24_18,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2024_data" / "4. Economy-2024_Data_fig_4.2.18.csv",
-    ]
+    ])
     
-    for potential_path in f24_18_potential_paths:
-        if potential_path.exists():
-            f24_18_path = potential_path
-            break
-    
-    if f24_18_path and f24_18_path.exists():
+    if f24_18_path:
         try:
-            raw_24 = pd.read_csv(f24_18_path, low_memory=False)
+            raw_24 = read_source_csv(f24_18_path)
             
             # Find the correct column names
             geo_col = None
@@ -3731,7 +4062,7 @@ def final_cleanup(df):
     df.loc[(df['Source_File'] == f25_19) & (df['Metric'].str.contains("Male", na=False)), 'Metric'] = "AI Talent Concentration: Male (Share of Professionals)"
 
     # Final deduplication after metric updates
-    df = df.drop_duplicates(subset=['Year', 'ISO3', 'Metric', 'Value'], keep='first')
+    df = drop_duplicate_rows(df, subset=['Year', 'ISO3', 'Metric', 'Value'])
     print("  ✓ AI Talent Concentration metrics differentiated by Gender AND Methodology (LinkedIn Members vs. Professionals).")
     
     # [Step 100] Legislative Mentions Temporal Lock (v8.8)
@@ -3765,7 +4096,7 @@ def final_cleanup(df):
     df.loc[df['Source_File'] == f25_16, 'Metric'] = "Number of AI Mentions in Legislative Proceedings (Cumulative 2016-2024)"
     
     # Final deduplication after metric updates
-    df = df.drop_duplicates(subset=['Year', 'ISO3', 'Metric', 'Value'], keep='first')
+    df = drop_duplicate_rows(df, subset=['Year', 'ISO3', 'Metric', 'Value'])
     print("  ✓ Legislative Mentions differentiated by explicit temporal ranges (Annual vs. Cumulative).")
     
     # [Step 101] AI Job Postings Methodology Lock (v8.8)
@@ -3781,7 +4112,7 @@ def final_cleanup(df):
     df.loc[df['Source_File'].isin(f25_files), 'Metric'] = "AI Job Postings (% Of All Job Postings) (2025 Report Methodology)"
     
     # Final deduplication after metric updates
-    df = df.drop_duplicates(subset=['Year', 'ISO3', 'Metric', 'Value'], keep='first')
+    df = drop_duplicate_rows(df, subset=['Year', 'ISO3', 'Metric', 'Value'])
     print("  ✓ AI Job Postings differentiated by report methodology (2024 vs. 2025 Lightcast Taxonomy).")
     
     # [Step 102] Total Investment Methodology Lock (v8.8)
@@ -3796,7 +4127,7 @@ def final_cleanup(df):
     df.loc[df['Source_File'] == f25_10, 'Metric'] = "Total Investment (In Billions Of US Dollars) [2025 Report Methodology]"
     
     # Final deduplication after metric updates
-    df = df.drop_duplicates(subset=['Year', 'ISO3', 'Metric', 'Value'], keep='first')
+    df = drop_duplicate_rows(df, subset=['Year', 'ISO3', 'Metric', 'Value'])
     print("  ✓ Total Investment differentiated by report methodology (2024 vs. 2025 NetBase Quid revisions).")
     
     # [Step 103] Surgical Aggregate Purge for Total Investment (v8.8)
@@ -3813,13 +4144,13 @@ def final_cleanup(df):
     met24 = "Total Investment (In Billions Of US Dollars) [2024 Report Methodology]"
     purge_mask_24 = (df['Source_File'] == src24) & (df['Metric'] == met24) & (df['Country'].isin(bad_entities))
     rows_purged_24 = purge_mask_24.sum()
-    df = df[~purge_mask_24].copy()
+    df = df.take(np.flatnonzero(~purge_mask_24.to_numpy()))
     
     # 2. Purge for 2025 methodology metric
     met25 = "Total Investment (In Billions Of US Dollars) [2025 Report Methodology]"
     purge_mask_25 = (df['Source_File'] == src25) & (df['Metric'] == met25) & (df['Country'].isin(bad_entities))
     rows_purged_25 = purge_mask_25.sum()
-    df = df[~purge_mask_25].copy()
+    df = df.take(np.flatnonzero(~purge_mask_25.to_numpy()))
     
     total_purged = rows_purged_24 + rows_purged_25
     if total_purged > 0:
@@ -3833,21 +4164,15 @@ def final_cleanup(df):
     source_17 = "4. Economy-2024_Data_fig_4.3.17.csv"
     
     # Try multiple potential paths for the source file
-    source_17_path = None
-    source_17_potential_paths = [
+    source_17_path = find_source_file([
         BASE_DIR / source_17,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2024_data" / source_17,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2024_data" / "4. Economy-2024_Data_fig_4.3.17.csv",
-    ]
+    ])
     
-    for potential_path in source_17_potential_paths:
-        if potential_path.exists():
-            source_17_path = potential_path
-            break
-    
-    if source_17_path and source_17_path.exists():
+    if source_17_path:
         try:
-            raw_17 = pd.read_csv(source_17_path, low_memory=False)
+            raw_17 = read_source_csv(source_17_path)
             
             # Find the correct column names (handle variations)
             geo_col = None
@@ -3901,7 +4226,7 @@ def final_cleanup(df):
     purge_mask_17 = (df['Source_File'] == source_17) & (df['Country'].isin(["United Kingdom", "European Union", "Europe"]))
     rows_purged_17 = purge_mask_17.sum()
     if rows_purged_17 > 0:
-        df = df[~purge_mask_17].copy()
+        df = df.take(np.flatnonzero(~purge_mask_17.to_numpy()))
         print(f"  ✓ Purged {rows_purged_17} aggregate rows (UK/EU/Europe) from {source_17}.")
     else:
         print(f"  ✓ No aggregate rows found in {source_17}.")
@@ -3939,7 +4264,7 @@ def final_cleanup(df):
     purge_mask_gen = (df['Source_File'].isin([src24_gen, src25_gen])) & (df['Country'].isin(bad_entities))
     rows_purged_gen = purge_mask_gen.sum()
     if rows_purged_gen > 0:
-        df = df[~purge_mask_gen].copy()
+        df = df.take(np.flatnonzero(~purge_mask_gen.to_numpy()))
         print(f"  ✓ Purged {rows_purged_gen} aggregate rows from {src24_gen} and {src25_gen}.")
     else:
         print(f"  ✓ No aggregate rows found in {src24_gen} and {src25_gen}.")
@@ -3978,7 +4303,7 @@ def final_cleanup(df):
     purge_mask_inv = (df['Source_File'].isin(inv_sources)) & (df['Country'].isin(bad_entities))
     rows_purged_inv = purge_mask_inv.sum()
     if rows_purged_inv > 0:
-        df = df[~purge_mask_inv].copy()
+        df = df.take(np.flatnonzero(~purge_mask_inv.to_numpy()))
         print(f"  ✓ Purged {rows_purged_inv} regional aggregate rows from investment snapshot sources.")
     else:
         print(f"  ✓ No regional aggregates found in investment snapshot sources.")
@@ -3998,7 +4323,7 @@ def final_cleanup(df):
     purge_mask_proj = (df['Source_File'].isin([src23_proj, src24_proj])) & (df['Country'].isin(bad_entities))
     rows_purged_proj = purge_mask_proj.sum()
     if rows_purged_proj > 0:
-        df = df[~purge_mask_proj].copy()
+        df = df.take(np.flatnonzero(~purge_mask_proj.to_numpy()))
         print(f"  ✓ Purged {rows_purged_proj} non-country aggregate rows from {src23_proj} and {src24_proj}.")
     else:
         print(f"  ✓ No aggregate rows found in {src23_proj} and {src24_proj}.")
@@ -4053,21 +4378,15 @@ def final_cleanup(df):
     removed = initial_count - len(df)
     
     # 2. Update Metric names with status context for China and United States
-    patent_file_path = None
-    patent_potential_paths = [
+    patent_file_path = find_source_file([
         BASE_DIR / patent_file,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2024_data" / patent_file,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2024_data" / "1. Research and Development-2024_Data_fig_1.2.3.csv",
-    ]
+    ])
     
-    for potential_path in patent_potential_paths:
-        if potential_path.exists():
-            patent_file_path = potential_path
-            break
-    
-    if patent_file_path and patent_file_path.exists():
+    if patent_file_path:
         try:
-            raw_pat = pd.read_csv(patent_file_path, low_memory=False)
+            raw_pat = read_source_csv(patent_file_path)
             
             # Find the correct column names (handle variations)
             geo_col = None
@@ -4116,21 +4435,15 @@ def final_cleanup(df):
     
     # 1. 2023 Report Detail (fig 4.1.14)
     f23_14 = "4. Economy-2023_Data_fig_4.1.14.csv"
-    f23_14_path = None
-    f23_14_potential_paths = [
+    f23_14_path = find_source_file([
         BASE_DIR / f23_14,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2023_data" / f23_14,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2023_data" / "4. Economy-2023_Data_fig_4.1.14.csv",
-    ]
+    ])
     
-    for potential_path in f23_14_potential_paths:
-        if potential_path.exists():
-            f23_14_path = potential_path
-            break
-    
-    if f23_14_path and f23_14_path.exists():
+    if f23_14_path:
         try:
-            raw_23 = pd.read_csv(f23_14_path, low_memory=False)
+            raw_23 = read_source_csv(f23_14_path)
             
             # Find the correct column names (handle variations)
             country_col = None
@@ -4169,21 +4482,15 @@ def final_cleanup(df):
 
     # 2. 2024 Report Detail (fig 4.2.15)
     f24_15 = "4. Economy-2024_Data_fig_4.2.15.csv"
-    f24_15_path = None
-    f24_15_potential_paths = [
+    f24_15_path = find_source_file([
         BASE_DIR / f24_15,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2024_data" / f24_15,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2024_data" / "4. Economy-2024_Data_fig_4.2.15.csv",
-    ]
+    ])
     
-    for potential_path in f24_15_potential_paths:
-        if potential_path.exists():
-            f24_15_path = potential_path
-            break
-    
-    if f24_15_path and f24_15_path.exists():
+    if f24_15_path:
         try:
-            raw_24 = pd.read_csv(f24_15_path, low_memory=False)
+            raw_24 = read_source_csv(f24_15_path)
             
             # Find the correct column names (handle variations)
             geo_col = None
@@ -4238,21 +4545,15 @@ def final_cleanup(df):
     src24_rob = "4. Economy-2024_Data_fig_4.5.9.csv"
     
     # 1. Update for 2023 Report (fig 4.4.12)
-    src23_rob_path = None
-    src23_rob_potential_paths = [
+    src23_rob_path = find_source_file([
         BASE_DIR / src23_rob,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2023_data" / src23_rob,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2023_data" / "4. Economy-2023_Data_fig_4.4.12.csv",
-    ]
+    ])
     
-    for potential_path in src23_rob_potential_paths:
-        if potential_path.exists():
-            src23_rob_path = potential_path
-            break
-    
-    if src23_rob_path and src23_rob_path.exists():
+    if src23_rob_path:
         try:
-            raw23 = pd.read_csv(src23_rob_path, low_memory=False)
+            raw23 = read_source_csv(src23_rob_path)
             
             # Find the correct column names (handle variations)
             country_col = None
@@ -4292,21 +4593,15 @@ def final_cleanup(df):
         print(f"  ⚠ Source file '{src23_rob}' not found in expected locations.")
     
     # 2. Update for 2024 Report (fig 4.5.9)
-    src24_rob_path = None
-    src24_rob_potential_paths = [
+    src24_rob_path = find_source_file([
         BASE_DIR / src24_rob,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2024_data" / src24_rob,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2024_data" / "4. Economy-2024_Data_fig_4.5.9.csv",
-    ]
+    ])
     
-    for potential_path in src24_rob_potential_paths:
-        if potential_path.exists():
-            src24_rob_path = potential_path
-            break
-    
-    if src24_rob_path and src24_rob_path.exists():
+    if src24_rob_path:
         try:
-            raw24 = pd.read_csv(src24_rob_path, low_memory=False)
+            raw24 = read_source_csv(src24_rob_path)
             
             # Find the correct column names (handle variations)
             geo_col = None
@@ -4376,21 +4671,15 @@ def final_cleanup(df):
     src_8117 = "9. Diversity-2024_Data_fig_8.1.17.csv"
     
     # Fix for fig 8.1.15 (Bachelor's) - Maps generic "Percentage" to "Share of CS Bachelor's Graduates"
-    src_8115_path = None
-    src_8115_potential_paths = [
+    src_8115_path = find_source_file([
         BASE_DIR / src_8115,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2024_data" / src_8115,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2024_data" / "9. Diversity-2024_Data_fig_8.1.15.csv",
-    ]
+    ])
     
-    for potential_path in src_8115_potential_paths:
-        if potential_path.exists():
-            src_8115_path = potential_path
-            break
-    
-    if src_8115_path and src_8115_path.exists():
+    if src_8115_path:
         try:
-            raw = pd.read_csv(src_8115_path, low_memory=False)
+            raw = read_source_csv(src_8115_path)
             raw['Percentage_val'] = raw['Percentage'].str.replace('%', '', regex=False).astype(float)
             for _, r in raw.iterrows():
                 if pd.notna(r['Country']) and pd.notna(r['Year']) and pd.notna(r['Percentage_val']) and pd.notna(r.get('Gender', '')):
@@ -4408,21 +4697,15 @@ def final_cleanup(df):
         print(f"  ⚠ Source file '{src_8115}' not found in expected locations.")
 
     # Fix for fig 8.1.17 (Doctoral) - Maps generic "Percentage" to "Share of CS Doctoral Graduates"
-    src_8117_path = None
-    src_8117_potential_paths = [
+    src_8117_path = find_source_file([
         BASE_DIR / src_8117,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2024_data" / src_8117,
         BASE_DIR / "stanford_ai_index" / "public access raw data" / "2024_data" / "9. Diversity-2024_Data_fig_8.1.17.csv",
-    ]
+    ])
     
-    for potential_path in src_8117_potential_paths:
-        if potential_path.exists():
-            src_8117_path = potential_path
-            break
-    
-    if src_8117_path and src_8117_path.exists():
+    if src_8117_path:
         try:
-            raw = pd.read_csv(src_8117_path, low_memory=False)
+            raw = read_source_csv(src_8117_path)
             raw['Percentage_val'] = raw['Percentage'].str.replace('%', '', regex=False).astype(float)
             for _, r in raw.iterrows():
                 if pd.notna(r['Country']) and pd.notna(r['Year']) and pd.notna(r['Percentage_val']) and pd.notna(r.get('Gender', '')):
@@ -4914,9 +5197,12 @@ def main():
         print("STEP 1: Loading Data Files")
         print("=" * 80)
         
-        df_stanford = load_stanford_data(STANFORD_FILE)
-        df_girai = load_girai_data(GIRAI_FILE)
-        df_oecd = load_oecd_data(OECD_FILE)
+        # Parse the three CSVs concurrently; standardization stays sequential
+        # so the progress output remains in order
+        raw = read_source_files([STANFORD_FILE, GIRAI_FILE, OECD_FILE])
+        df_stanford = load_source_data(STANFORD_FILE, 'Stanford AI Index', 'Stanford', raw.get(STANFORD_FILE))
+        df_girai = load_source_data(GIRAI_FILE, 'GIRAI', df=raw.get(GIRAI_FILE))
+        df_oecd = load_source_data(OECD_FILE, 'OECD', df=raw.get(OECD_FILE))
         
         # Step 2: Merge dataframes
         print("\nSTEP 2: Merging Dataframes")
@@ -4947,10 +5233,12 @@ def main():
         final_df = final_df.sort_values(by=['Year', 'Country', 'Metric'], ascending=[True, True, True])
         print(f"  ✓ Dataset sorted by Year, Country, and Metric.")
         
-        final_df.to_csv(OUTPUT_FILE, index=False, encoding='utf-8')
+        write_csv(final_df, OUTPUT_FILE)
         print(f"  ✓ Saved successfully!")
         print(f"  File size: {OUTPUT_FILE.stat().st_size / (1024*1024):.2f} MB")
         
+        save_iso3_cache()
+        
         # Final summary
         print("\n" + "=" * 80)
         print("CONSOLIDATION COMPLETE!")